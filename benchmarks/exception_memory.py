@@ -0,0 +1,51 @@
+"""
+Memory held by a list of `Err(exception)` values, with the full tracebacks, stripped or summarized.
+"""
+import gc
+import time
+import tracemalloc
+from typing import Callable, List
+
+from rusty_results import Err
+from rusty_results.exception_capture import capture
+
+
+def parse(record: int):
+    # locals kept alive by the traceback frames
+    buffer = bytearray(1024)
+    fields = [str(record)] * 16
+    raise ValueError(f"invalid record {record}")
+
+
+def process(record: int):
+    return parse(record)
+
+
+def collect(count: int, wrap: Callable[[BaseException], Err]) -> List[Err]:
+    results = []
+    for record in range(count):
+        try:
+            process(record)
+        except ValueError as e:
+            results.append(wrap(e))
+    return results
+
+
+def bench(label: str, count: int, wrap: Callable[[BaseException], Err]):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = collect(count, wrap)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {current / 2**20:8.1f} MiB held  {peak / 2**20:8.1f} MiB peak  {elapsed:6.3f}s")
+    del results
+
+
+if __name__ == "__main__":
+    count = 20_000
+    bench("Err(exception)", count, Err)
+    bench("stripped", count, capture)
+    bench("summarized", count, lambda e: capture(e, summarize=True))
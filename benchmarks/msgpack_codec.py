@@ -0,0 +1,31 @@
+"""
+`pack_many`/`unpack_many` throughput for `Result` lists, compared with packing each value on its own and with an
+equivalent list of plain tuples.
+"""
+import time
+from typing import Any, Callable
+
+import msgpack
+
+from rusty_results import Ok, Err
+from rusty_results.msgpack_codec import packb, pack_many, unpack_many
+
+
+def bench(label: str, f: Callable[[], Any], rounds: int = 5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        f()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<24} {elapsed * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    count = 100_000
+    results = [Ok(i) if i % 4 else Err("invalid") for i in range(count)]
+    tuples = [("Ok", i) if i % 4 else ("Error", "invalid") for i in range(count)]
+    data = pack_many(results)
+    bench("packb per value", lambda: [packb(result) for result in results])
+    bench("pack_many", lambda: pack_many(results))
+    bench("unpack_many", lambda: unpack_many(data))
+    bench("plain tuples packb", lambda: msgpack.packb(tuples))
+    bench("plain tuples unpackb", lambda: msgpack.unpackb(msgpack.packb(tuples)))
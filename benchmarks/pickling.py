@@ -0,0 +1,39 @@
+"""
+Pickle size and throughput of `Result` lists, compared with the default pickling of an equivalent frozen dataclass.
+"""
+import pickle
+import time
+from dataclasses import dataclass
+from typing import Any, List
+
+from rusty_results import Some, Empty, Ok, Err
+
+
+@dataclass(eq=True, frozen=True)
+class DataclassOk:
+    Ok: Any
+
+
+@dataclass(eq=True, frozen=True)
+class DataclassErr:
+    Error: Any
+
+
+def bench(label: str, values: List[Any], rounds: int = 5):
+    data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    dumps_elapsed = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        pickle.loads(data)
+    loads_elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<20} {len(data):>12,} bytes  dumps {dumps_elapsed:7.3f}s  loads {loads_elapsed:7.3f}s")
+
+
+if __name__ == "__main__":
+    count = 500_000
+    bench("dataclass default", [DataclassOk(i) if i % 4 else DataclassErr("invalid") for i in range(count)])
+    bench("Ok/Err", [Ok(i) if i % 4 else Err("invalid") for i in range(count)])
+    bench("Some/Empty", [Some(i) if i % 4 else Empty() for i in range(count)])
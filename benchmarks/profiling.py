@@ -0,0 +1,42 @@
+"""
+Overhead of `rusty_results.profiler` and `rusty_results.instrumentation` on a combinator chain with trivial steps.
+"""
+import time
+
+from rusty_results import Ok, Err
+from rusty_results import instrumentation, profiler
+
+
+def parse(value: int):
+    return Ok(value) if value % 4 else Err("invalid")
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def chain(count: int):
+    for i in range(count):
+        Ok(i).and_then(parse).map(double).map_err(str.upper)
+
+
+def bench(label: str, count: int, baseline: float = 0.0) -> float:
+    start = time.perf_counter()
+    chain(count)
+    elapsed = time.perf_counter() - start
+    overhead = f"  +{(elapsed - baseline) / count * 1e6:.2f}us per chain" if baseline else ""
+    print(f"{label:<30} {elapsed:7.3f}s{overhead}")
+    return elapsed
+
+
+if __name__ == "__main__":
+    count = 200_000
+    chain(count)  # warm up
+    baseline = bench("off", count)
+    with profiler.profiled():
+        bench("profiler", count, baseline)
+    with instrumentation.instrumented():
+        bench("instrumentation", count, baseline)
+    with instrumentation.instrumented(sample_rate=0.01):
+        bench("instrumentation (1% sampled)", count, baseline)
+    bench("off again", count)
@@ -0,0 +1,45 @@
+"""
+Validation throughput of pydantic models with `Option` and `Result` fields.
+Everything runs inside pydantic-core, no Python validator is called per field.
+"""
+import time
+from typing import List
+
+import pydantic
+from rusty_results import Option, Result
+
+
+class MyData(pydantic.BaseModel):
+    name: Option[str]
+    phone: Option[int]
+    parsed: Result[int, str]
+
+
+def build_records(count: int) -> List[dict]:
+    return [
+        {
+            "name": {"Some": f"name {i}"} if i % 3 else {"Empty": None},
+            "phone": {"Some": i} if i % 2 else {"Empty": None},
+            "parsed": {"Ok": i} if i % 5 else {"Error": "invalid"},
+        }
+        for i in range(count)
+    ]
+
+
+def bench(label: str, f, count: int):
+    start = time.perf_counter()
+    f()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed:8.3f}s {count / elapsed:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    count = 200_000
+    records = build_records(count)
+    adapter = pydantic.TypeAdapter(List[MyData])
+    models = adapter.validate_python(records)
+    json_data = adapter.dump_json(models)
+
+    bench("validate_python", lambda: adapter.validate_python(records), count)
+    bench("validate_json", lambda: adapter.validate_json(json_data), count)
+    bench("dump_json", lambda: adapter.dump_json(models), count)
@@ -8,10 +8,9 @@ class MyData(pydantic.BaseModel):
 
 
 if __name__ == "__main__":
-    import json
     # serialize to json
-    json_data = MyData(name=Some("Link"), phone=Empty()).json()
+    json_data = MyData(name=Some("Link"), phone=Empty()).model_dump_json()
     print(json_data)
     # deserialize json data
-    data = MyData(**json.loads(json_data))
+    data = MyData.model_validate_json(json_data)
     print(data)
@@ -1,2 +1,19 @@
 from .prelude import Option, Some, Empty, Result, Ok, Err
 from .exceptions import UnwrapException, early_return
+
+
+# optional submodules, imported on first attribute access (`rusty_results.retry`...) so `import rusty_results` only
+# loads the prelude
+_LAZY_SUBMODULES = frozenset((
+    "batching", "cache", "circuit_breaker", "columnar", "deadline", "disk_cache", "err_sink", "error_context",
+    "error_enum", "exception_capture", "hedging", "instrumentation", "interning", "json_codec", "limiter",
+    "msgpack_codec", "profiler", "records", "retry", "sqlite_adapter", "timeout",
+))
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
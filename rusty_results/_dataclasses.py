@@ -0,0 +1,56 @@
+"""
+Support for the prelude classes, which are frozen dataclasses with precomputed methods.
+
+Decorating them with `dataclasses.dataclass` at import would import `dataclasses` (and `inspect`, `ast`...) and
+generate their methods with `exec`, a noticeable share of the import time. Their methods are written by hand instead,
+matching the generated ones, and the dataclass metadata is only built when something asks for it (pydantic,
+`dataclasses.fields`, `dataclasses.replace`...).
+"""
+from typing import Any, Dict, Tuple
+
+
+# (name, type, `dataclasses.field` arguments), types as annotated on the class, TypeVars included like `dataclass`
+# records them (mypy needs `# type: ignore[misc]` to take a TypeVar as a value)
+FieldSpec = Tuple[str, Any, Dict[str, Any]]
+
+
+class DataclassInfo:
+    """
+    Descriptor standing for `__dataclass_fields__` or `__dataclass_params__`. On first access both are built from an
+    equivalent frozen dataclass and set on the class, replacing the descriptors.
+    """
+    def __init__(self, attribute: str, fields: Tuple[FieldSpec, ...]):
+        self.attribute = attribute
+        self.fields = fields
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        import dataclasses
+
+        shadow = dataclasses.make_dataclass(
+            owner.__name__,
+            [(name, field_type, dataclasses.field(**kwargs)) for name, field_type, kwargs in self.fields],
+            frozen=True,
+        )
+        owner.__dataclass_fields__ = shadow.__dataclass_fields__  # type: ignore[attr-defined]
+        owner.__dataclass_params__ = shadow.__dataclass_params__  # type: ignore[attr-defined]
+        return getattr(owner, self.attribute)
+
+
+def dataclass_info(*fields: FieldSpec) -> Tuple[DataclassInfo, DataclassInfo]:
+    """
+    :param fields: Fields of the class, in order.
+    :return: Descriptors for `__dataclass_fields__` and `__dataclass_params__`.
+    """
+    return DataclassInfo("__dataclass_fields__", fields), DataclassInfo("__dataclass_params__", fields)
+
+
+def frozen_setattr(self, name: str, value: Any):
+    import dataclasses
+
+    raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def frozen_delattr(self, name: str):
+    import dataclasses
+
+    raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
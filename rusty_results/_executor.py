@@ -0,0 +1,43 @@
+import itertools
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+
+class ThreadPerCallExecutor(Executor):
+    """
+    Executor running every call in its own daemon thread.
+    The sync helpers wait for calls that cannot be interrupted: with a bounded pool, calls that never return would
+    keep its workers busy for good and later calls would time out without ever running. Here a hung call only keeps
+    its own thread, and daemon threads do not hold up the interpreter exit.
+    """
+    def __init__(self, thread_name_prefix: str = "rusty_results"):
+        self._thread_name_prefix = thread_name_prefix
+        self._counter = itertools.count()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:  # type: ignore[override]
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        name = f"{self._thread_name_prefix}_{next(self._counter)}"
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return future
+
+
+_executor = ThreadPerCallExecutor()
+
+
+def default_executor() -> ThreadPerCallExecutor:
+    """
+    :return: Executor used by the sync helpers running calls in the background.
+    """
+    return _executor
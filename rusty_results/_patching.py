@@ -0,0 +1,31 @@
+from typing import Any, List, Tuple
+
+
+class Patches:
+    """
+    Class attribute replacements that can be undone, used by the opt-in instrumentation and profiling so the prelude
+    classes stay untouched (and cost nothing) while they are off.
+    """
+    def __init__(self):
+        # (class, attribute, original value in the class dict)
+        self._originals: List[Tuple[type, str, Any]] = []
+
+    def patch(self, cls: type, name: str, value: Any):
+        """
+        :param cls: Class to patch.
+        :param name: Attribute defined in the class itself.
+        :param value: Replacement value.
+        """
+        self._originals.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, value)
+
+    def restore(self):
+        """
+        Puts back the original attributes, in reverse order.
+        """
+        while self._originals:
+            cls, name, original = self._originals.pop()
+            setattr(cls, name, original)
+
+    def __bool__(self) -> bool:
+        return bool(self._originals)
@@ -0,0 +1,149 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union
+
+from rusty_results.prelude import Option, Result, Some, Ok
+
+
+# batched key type, the unwrapped value of an `Ok` or `Some`
+K = TypeVar('K', bound=Hashable)
+# answer type returned by the bulk function for each key
+R = TypeVar('R')
+
+Wrapped = Union[Result[K, R], Option[K]]
+
+
+def _check_answers(keys: Sequence[K], answers: Sequence[R]):
+    if len(answers) != len(keys):
+        raise ValueError(
+            f"Bulk function returned {len(answers)} answers for {len(keys)} keys, they must have the same length"
+        )
+
+
+def batch_and_then(
+        values: Iterable[Wrapped],
+        bulk: Callable[[List[K]], Sequence[R]],
+        dedupe: bool = True,
+) -> List[Union[R, Wrapped]]:
+    """
+    Batched version of `and_then`.
+    Values inside every `Ok` and `Some` are collected and passed in a single call to `bulk`, which must return
+    one answer (usually a `Result` or an `Option`) per key in the same order it received them.
+    `Err` and `Empty` are passed through untouched.
+
+    :param values: `Result` or `Option` values to chain.
+    :param bulk: Function resolving a list of keys at once.
+    :param dedupe: If True, identical keys are only sent once to `bulk`.
+    :return: A list aligned with `values` holding the answer for each `Ok`/`Some`, or the original `Err`/`Empty`.
+    :raises: `ValueError` if `bulk` does not return an answer per key.
+    """
+    values = list(values)
+    keys: List[K] = []
+    # for each position in values, index of its key inside keys, None if it is not batched
+    positions: List[Optional[int]] = []
+    seen: Dict[K, int] = {}
+    for value in values:
+        if not isinstance(value, (Ok, Some)):
+            positions.append(None)
+            continue
+        key = value.unwrap()
+        if dedupe:
+            index = seen.get(key)
+            if index is None:
+                index = seen[key] = len(keys)
+                keys.append(key)
+        else:
+            index = len(keys)
+            keys.append(key)
+        positions.append(index)
+
+    if not keys:
+        return values
+
+    answers = bulk(keys)
+    _check_answers(keys, answers)
+    return [value if index is None else answers[index] for value, index in zip(values, positions)]
+
+
+class BatchLoader(Generic[K, R]):
+    """
+    Async DataLoader style batcher.
+    Every `load` awaited within the same event loop tick is coalesced into a single call to the async `bulk` function,
+    identical keys are only requested once.
+    """
+    def __init__(self, bulk: Callable[[List[K]], Awaitable[Sequence[R]]], max_batch_size: Optional[int] = None):
+        """
+        :param bulk: Coroutine function resolving a list of keys at once, returning one answer per key in order.
+        :param max_batch_size: Maximum number of keys per `bulk` call, unbounded if None.
+        """
+        self._bulk = bulk
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[K, "asyncio.Future[R]"] = {}
+        self._scheduled = False
+        # strong references to in flight bulk calls so they are not garbage collected
+        self._tasks: Set["asyncio.Task"] = set()
+
+    def load(self, key: K) -> "asyncio.Future[R]":
+        """
+        :param key: Key to resolve.
+        :return: Future with the answer of `bulk` for the key.
+        """
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = self._pending[key] = loop.create_future()
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[R]:
+        """
+        :param keys: Keys to resolve.
+        :return: Answers of `bulk` for each key, in order.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def and_then(self, value: Wrapped) -> Union[R, Wrapped]:
+        """
+        Batched `and_then` for a single value.
+        :param value: `Result` or `Option` to chain.
+        :return: The answer for the wrapped key if `Ok`/`Some`, otherwise the original `Err`/`Empty`.
+        """
+        if isinstance(value, (Ok, Some)):
+            return await self.load(value.unwrap())
+        return value
+
+    def _dispatch(self):
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        items = list(pending.items())
+        size = self._max_batch_size or len(items)
+        for start in range(0, len(items), size):
+            task = asyncio.ensure_future(self._resolve(items[start:start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, items: List[Tuple[K, "asyncio.Future[R]"]]):
+        keys = [key for key, _ in items]
+        try:
+            answers = await self._bulk(keys)
+            _check_answers(keys, answers)
+        except asyncio.CancelledError:
+            for _, future in items:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException as e:
+            # KeyboardInterrupt, SystemExit and the like still propagate, but waiting loads must not hang
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        for (_, future), answer in zip(items, answers):
+            if not future.done():
+                future.set_result(answer)
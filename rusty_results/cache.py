@@ -0,0 +1,183 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from rusty_results.prelude import Err, Empty
+
+
+T = TypeVar('T')
+
+# separates positional from keyword arguments inside a cache key
+_KWARGS_MARK = object()
+
+
+@dataclass(eq=True, frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class _InFlight:
+    """
+    Marker for a key being computed, concurrent misses on the same key wait on it instead of calling the function.
+    """
+    __slots__ = ("event", "value", "exception")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.exception: Optional[BaseException] = None
+
+
+def _make_key(args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def is_failure(value: Any) -> bool:
+    """
+    :param value: Value returned by a memoized function.
+    :return: True if value is an `Err` or `Empty`, any other value is considered a success.
+    """
+    return isinstance(value, (Err, Empty))
+
+
+class ResultCache:
+    """
+    Thread safe LRU/TTL cache aware of `Result` and `Option` values.
+    Successes (`Ok`, `Some` or any other value) are kept for `ttl` seconds, failures (`Err`, `Empty`) are kept as
+    negative entries for `err_ttl` seconds, or never stored if `cache_errors` is False.
+    """
+    def __init__(
+            self,
+            maxsize: Optional[int] = 128,
+            ttl: Optional[float] = None,
+            err_ttl: Optional[float] = None,
+            cache_errors: bool = True,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param maxsize: Maximum number of entries, unbounded if None.
+        :param ttl: Seconds a success is kept, forever if None.
+        :param err_ttl: Seconds a failure is kept, forever if None.
+        :param cache_errors: Whether failures are cached at all.
+        :param clock: Monotonic time source.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.err_ttl = err_ttl
+        self.cache_errors = cache_errors
+        self._clock = clock
+        # key -> (value, expiration time or None)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_call(self, key: Hashable, f: Callable[..., T], *args, **kwargs) -> T:
+        """
+        :param key: Cache key.
+        :param f: Function computing the value on a miss, called with the remaining arguments.
+        :return: The cached value for key, calling f only once for concurrent misses.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or self._clock() < expires:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+
+        if not leader:
+            in_flight.event.wait()
+            if in_flight.exception is not None:
+                raise in_flight.exception
+            return in_flight.value
+
+        try:
+            value = f(*args, **kwargs)
+        except BaseException as e:
+            in_flight.exception = e
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.event.set()
+            raise
+        in_flight.value = value
+        with self._lock:
+            del self._in_flight[key]
+            self._store(key, value)
+        in_flight.event.set()
+        return value
+
+    def _store(self, key: Hashable, value: Any):
+        if is_failure(value):
+            if not self.cache_errors:
+                return
+            ttl = self.err_ttl
+        else:
+            ttl = self.ttl
+        self._entries[key] = (value, None if ttl is None else self._clock() + ttl)
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """
+        :return: Hits, misses and evictions since creation or last clear.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def memoize(
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        err_ttl: Optional[float] = None,
+        cache_errors: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+):
+    """
+    Memoization decorator for functions returning `Result` or `Option`.
+    Arguments must be hashable. Check `ResultCache` for the caching policies.
+    The wrapped function exposes `cache_stats()` and `cache_clear()`.
+
+    :param maxsize: Maximum number of entries, unbounded if None.
+    :param ttl: Seconds an `Ok`/`Some` is kept, forever if None.
+    :param err_ttl: Seconds an `Err`/`Empty` is kept, forever if None.
+    :param cache_errors: Whether `Err`/`Empty` are cached at all.
+    :param clock: Monotonic time source.
+    """
+    def decorator(f):
+        cache = ResultCache(maxsize=maxsize, ttl=ttl, err_ttl=err_ttl, cache_errors=cache_errors, clock=clock)
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_call(_make_key(args, kwargs), f, *args, **kwargs)
+
+        wrapper.cache = cache
+        wrapper.cache_stats = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
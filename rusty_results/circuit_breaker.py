@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from functools import wraps
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from rusty_results.prelude import Result, Err
+
+
+T = TypeVar('T')
+E = TypeVar('E')
+
+
+@dataclass(eq=True, frozen=True)
+class CircuitOpen:
+    """
+    Error value returned while the circuit is open, the wrapped function is not called.
+    """
+    name: str
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker driven by the `Err` ratio of the last `window` calls.
+    When the ratio reaches `failure_ratio` (and at least `min_calls` were recorded) the circuit opens and every call
+    returns the same `Err(CircuitOpen)` without calling the function. After `reset_timeout` seconds the circuit
+    turns half open and lets `probes` calls through: if all of them succeed it closes again, any failure reopens it.
+    Raised exceptions count as failures and are propagated, cancellations are not recorded.
+    Each call is recorded against the state it was admitted in: results of calls that outlive a state change (e.g. a
+    call admitted while closed finishing after the circuit turned half open) are ignored.
+
+    The breaker is thread safe, the lock is never held while the wrapped function runs, so it can be shared
+    by async tasks as well.
+    """
+    def __init__(
+            self,
+            name: str = "circuit",
+            failure_ratio: float = 0.5,
+            window: int = 100,
+            min_calls: int = 10,
+            reset_timeout: float = 30.0,
+            probes: int = 1,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param name: Name reported by `CircuitOpen`.
+        :param failure_ratio: Ratio of `Err` in the window that opens the circuit.
+        :param window: Number of recent calls tracked.
+        :param min_calls: Minimum number of calls in the window before the circuit can open.
+        :param reset_timeout: Seconds the circuit stays open before probing.
+        :param probes: Number of successful probes needed to close the circuit.
+        :param clock: Monotonic time source.
+        """
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rejection: Err = Err(CircuitOpen(name))
+        self._state = CircuitState.CLOSED
+        # incremented on every state change, calls admitted under an older generation are not recorded
+        self._generation = 0
+        self._reset_window()
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+
+    def _reset_window(self):
+        # ring buffer of outcomes, 1 for failures
+        self._outcomes = bytearray(self.window)
+        self._position = 0
+        self._calls = 0
+        self._failures = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def _acquire(self) -> Optional[int]:
+        """
+        :return: The generation the call is admitted in, to hand back to `_record` or `_release`, None if the call
+        cannot go through.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return self._generation
+            if self._state is CircuitState.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return None
+                self._transition(CircuitState.HALF_OPEN)
+                self._probes_in_flight = 0
+                self._probes_succeeded = 0
+            if self._probes_in_flight + self._probes_succeeded >= self.probes:
+                return None
+            self._probes_in_flight += 1
+            return self._generation
+
+    def _record(self, generation: int, failed: bool):
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._state is CircuitState.CLOSED:
+                position = self._position
+                self._failures += failed - self._outcomes[position]
+                self._outcomes[position] = failed
+                self._position = (position + 1) % self.window
+                if self._calls < self.window:
+                    self._calls += 1
+                if failed and self._calls >= self.min_calls and self._failures >= self.failure_ratio * self._calls:
+                    self._open()
+            elif self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight -= 1
+                if failed:
+                    self._open()
+                else:
+                    self._probes_succeeded += 1
+                    if self._probes_succeeded >= self.probes:
+                        self._transition(CircuitState.CLOSED)
+                        self._reset_window()
+
+    def _release(self, generation: int):
+        # the call was interrupted (e.g. cancelled) so it is not recorded, just frees its probe slot
+        with self._lock:
+            if generation == self._generation and self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight -= 1
+
+    def _transition(self, state: CircuitState):
+        self._state = state
+        self._generation += 1
+
+    def _open(self):
+        self._transition(CircuitState.OPEN)
+        self._opened_at = self._clock()
+
+    def call(self, f: Callable[..., Result[T, E]], *args, **kwargs) -> Result[T, E]:
+        """
+        :param f: Function returning a `Result`.
+        :return: The result of `f(*args, **kwargs)` or `Err(CircuitOpen)` if the circuit is open.
+        """
+        generation = self._acquire()
+        if generation is None:
+            return self._rejection
+        try:
+            result = f(*args, **kwargs)
+        except Exception:
+            self._record(generation, True)
+            raise
+        except BaseException:
+            self._release(generation)
+            raise
+        self._record(generation, not result)
+        return result
+
+    async def call_async(self, f: Callable[..., Awaitable[Result[T, E]]], *args, **kwargs) -> Result[T, E]:
+        """
+        :param f: Coroutine function returning a `Result`.
+        :return: The result of `await f(*args, **kwargs)` or `Err(CircuitOpen)` if the circuit is open.
+        """
+        generation = self._acquire()
+        if generation is None:
+            return self._rejection
+        try:
+            result = await f(*args, **kwargs)
+        except Exception:
+            self._record(generation, True)
+            raise
+        except BaseException:
+            self._release(generation)
+            raise
+        self._record(generation, not result)
+        return result
+
+    def __call__(self, f):
+        """
+        Decorator version, works for both functions and coroutine functions.
+        """
+        if asyncio.iscoroutinefunction(f):
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return await self.call_async(f, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return self.call(f, *args, **kwargs)
+        return wrapper
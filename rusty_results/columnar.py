@@ -0,0 +1,235 @@
+"""
+Columnar file format for large batches of `Option` and `Result` values, read through `mmap`.
+
+Layout (little endian):
+
+* header: magic, row count and the offset of each column.
+* tag column: one byte per row, the variant (`Empty`, `Some`, `Ok` or `Err`).
+* kind column: one byte per row, how the payload is stored.
+* value column: 8 bytes per row, the payload itself for ints, floats and bools, otherwise an offset into the blob.
+* blob: length prefixed payloads for str, bytes and any other (pickled) value.
+
+`Err` payloads use the same kind/value/blob encoding as the others, so counting or locating errors only reads the
+tag column. Rows are only decoded when accessed.
+"""
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, BinaryIO, Iterable, Iterator, Union
+
+from rusty_results.prelude import Some, Empty, Ok, Err
+
+
+TAG_EMPTY = 0
+TAG_SOME = 1
+TAG_OK = 2
+TAG_ERR = 3
+
+_KIND_NONE = 0
+_KIND_INT = 1
+_KIND_FLOAT = 2
+_KIND_BOOL = 3
+_KIND_STR = 4
+_KIND_BYTES = 5
+_KIND_PICKLE = 6
+_KIND_NO_VALUE = 7
+
+_MAGIC = b"RRCOL\x00\x01\x00"
+_HEADER = struct.Struct("<8sQQQQQ")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LENGTH = struct.Struct("<Q")
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 63) - 1
+
+Variant = Union[Some, Empty, Ok, Err]
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_columnar(fp: Union[str, os.PathLike, BinaryIO], values: Iterable[Variant]) -> int:
+    """
+    :param fp: Destination path or binary file object.
+    :param values: `Some`, `Empty`, `Ok` or `Err` values to store.
+    :return: Number of rows written.
+    :raises: `TypeError` if a value is not a prelude variant.
+    """
+    tags = bytearray()
+    kinds = bytearray()
+    slots = bytearray()
+    blob = bytearray()
+    for value in values:
+        cls = type(value)
+        if cls is Some:
+            tags.append(TAG_SOME)
+            payload = value.Some
+        elif cls is Ok:
+            tags.append(TAG_OK)
+            payload = value.Ok
+        elif cls is Err:
+            tags.append(TAG_ERR)
+            payload = value.Error
+        elif cls is Empty:
+            tags.append(TAG_EMPTY)
+            kinds.append(_KIND_NO_VALUE)
+            slots += bytes(8)
+            continue
+        else:
+            raise TypeError(f"Object of type {cls.__name__} is not an Option or Result")
+
+        payload_cls = type(payload)
+        if payload_cls is int and _INT_MIN <= payload <= _INT_MAX:
+            kinds.append(_KIND_INT)
+            slots += _INT.pack(payload)
+        elif payload_cls is float:
+            kinds.append(_KIND_FLOAT)
+            slots += _FLOAT.pack(payload)
+        elif payload_cls is bool:
+            kinds.append(_KIND_BOOL)
+            slots += _INT.pack(payload)
+        elif payload is None:
+            kinds.append(_KIND_NONE)
+            slots += bytes(8)
+        else:
+            if payload_cls is str:
+                kinds.append(_KIND_STR)
+                data = payload.encode()
+            elif payload_cls is bytes:
+                kinds.append(_KIND_BYTES)
+                data = payload
+            else:
+                kinds.append(_KIND_PICKLE)
+                data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+            slots += _INT.pack(len(blob))
+            blob += _LENGTH.pack(len(data))
+            blob += data
+
+    count = len(tags)
+    tags_offset = _HEADER.size
+    kinds_offset = tags_offset + count
+    values_offset = _align(kinds_offset + count)
+    blob_offset = values_offset + len(slots)
+    header = _HEADER.pack(_MAGIC, count, tags_offset, kinds_offset, values_offset, blob_offset)
+    padding = bytes(values_offset - kinds_offset - count)
+
+    if isinstance(fp, (str, os.PathLike)):
+        with open(fp, "wb") as f:
+            _write_sections(f, (header, tags, kinds, padding, slots, blob))
+    else:
+        _write_sections(fp, (header, tags, kinds, padding, slots, blob))
+    return count
+
+
+def _write_sections(fp: BinaryIO, sections: Iterable[Union[bytes, bytearray]]):
+    for section in sections:
+        fp.write(section)
+
+
+class ColumnarFile:
+    """
+    Read only, memory mapped view over a file written by `write_columnar`.
+    Supports `len`, indexing and iteration, rows are decoded into `Some`/`Empty`/`Ok`/`Err` on access.
+    """
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        :param path: File written by `write_columnar`.
+        :raises: `ValueError` if the file is not in the columnar format.
+        """
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError("Not a columnar file")
+        magic, self._count, self._tags, self._kinds, self._values, self._blob = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError("Not a columnar file")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def tag(self, index: int) -> int:
+        """
+        :param index: Row index.
+        :return: Tag of the row (`TAG_EMPTY`, `TAG_SOME`, `TAG_OK` or `TAG_ERR`), without decoding it.
+        """
+        return self._mm[self._tags + self._index(index)]
+
+    def count(self, tag: int) -> int:
+        """
+        :param tag: One of `TAG_EMPTY`, `TAG_SOME`, `TAG_OK` or `TAG_ERR`.
+        :return: Number of rows with that tag, reading the tag column only.
+        """
+        return self._mm[self._tags:self._tags + self._count].count(tag)
+
+    def count_err(self) -> int:
+        return self.count(TAG_ERR)
+
+    def indices(self, tag: int) -> Iterator[int]:
+        """
+        :param tag: One of `TAG_EMPTY`, `TAG_SOME`, `TAG_OK` or `TAG_ERR`.
+        :return: Iterator over the indices of the rows with that tag.
+        """
+        needle = bytes((tag,))
+        end = self._tags + self._count
+        position = self._mm.find(needle, self._tags, end)
+        while position != -1:
+            yield position - self._tags
+            position = self._mm.find(needle, position + 1, end)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Row index out of range")
+        return index
+
+    def _payload(self, index: int) -> Any:
+        kind = self._mm[self._kinds + index]
+        slot = self._values + 8 * index
+        if kind == _KIND_INT:
+            return _INT.unpack_from(self._mm, slot)[0]
+        if kind == _KIND_FLOAT:
+            return _FLOAT.unpack_from(self._mm, slot)[0]
+        if kind == _KIND_BOOL:
+            return bool(_INT.unpack_from(self._mm, slot)[0])
+        if kind == _KIND_NONE:
+            return None
+        start = self._blob + _INT.unpack_from(self._mm, slot)[0]
+        length = _LENGTH.unpack_from(self._mm, start)[0]
+        data = self._mm[start + _LENGTH.size:start + _LENGTH.size + length]
+        if kind == _KIND_STR:
+            return data.decode()
+        if kind == _KIND_BYTES:
+            return data
+        return pickle.loads(data)
+
+    def _row(self, index: int) -> Variant:
+        tag = self._mm[self._tags + index]
+        if tag == TAG_EMPTY:
+            return Empty()
+        payload = self._payload(index)
+        if tag == TAG_SOME:
+            return Some(payload)
+        if tag == TAG_OK:
+            return Ok(payload)
+        return Err(payload)
+
+    def __getitem__(self, index: int) -> Variant:
+        return self._row(self._index(index))
+
+    def __iter__(self) -> Iterator[Variant]:
+        for index in range(self._count):
+            yield self._row(index)
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> "ColumnarFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
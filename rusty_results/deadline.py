@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from time import monotonic
+from typing import Iterator, Optional, Tuple
+
+from rusty_results.prelude import Option, Some, Empty, Result, Ok, Err, DeadlineExceeded, _deadline
+
+
+__all__ = ["DeadlineExceeded", "deadline", "deadline_at", "current_deadline", "remaining", "check"]
+
+_NOT_EXPIRED: Ok = Ok(None)
+
+
+@contextmanager
+def deadline_at(when: float) -> Iterator[float]:
+    """
+    Sets an absolute deadline for the current context (thread or async task and the tasks it spawns).
+    Nested deadlines can only shorten the current one.
+
+    :param when: `time.monotonic` time of the deadline.
+    :return: The effective deadline.
+    """
+    current = _deadline.get()
+    effective = when if current is None else min(current, when)
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+def deadline(seconds: float):
+    """
+    Sets a deadline `seconds` from now for the current context. Once it passes, `Ok.and_then` steps are skipped
+    returning `Err(DeadlineExceeded)`, and the timeout, retry and hedging helpers stop starting new work.
+    E.g.:
+    ```
+    with deadline(0.5):
+        result = fetch(key).and_then(parse).and_then(enrich)
+    ```
+    :param seconds: Time budget.
+    """
+    return deadline_at(monotonic() + seconds)
+
+
+def current_deadline() -> Option[float]:
+    """
+    :return: `Some` with the `time.monotonic` deadline of the current context, `Empty` if there is none.
+    """
+    current = _deadline.get()
+    return Empty() if current is None else Some(current)
+
+
+def remaining() -> Option[float]:
+    """
+    :return: `Some` with the seconds left (0 if already passed), `Empty` if there is no deadline.
+    """
+    current = _deadline.get()
+    return Empty() if current is None else Some(max(0.0, current - monotonic()))
+
+
+def check() -> Result[None, DeadlineExceeded]:
+    """
+    :return: `Ok(None)` if there is no deadline or it did not pass yet, `Err(DeadlineExceeded)` otherwise.
+    """
+    current = _deadline.get()
+    if current is not None and monotonic() >= current:
+        return Err(DeadlineExceeded(current))
+    return _NOT_EXPIRED
+
+
+def _limit(seconds: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    :param seconds: Timeout requested by a helper, None for no timeout.
+    :return: The timeout capped by the current deadline, and the deadline if it is the one limiting it (else None).
+    """
+    current = _deadline.get()
+    if current is None:
+        return seconds, None
+    left = max(0.0, current - monotonic())
+    if seconds is None or left < seconds:
+        return left, current
+    return seconds, None
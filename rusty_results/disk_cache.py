@@ -0,0 +1,263 @@
+import dataclasses
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from rusty_results.prelude import Option, Some, Empty, Ok, Err
+from rusty_results.cache import is_failure
+
+
+T = TypeVar('T')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+_ACCESSED_INDEX = "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+
+
+def _sized(tag: bytes, data: bytes) -> bytes:
+    return b"%s%d:%s" % (tag, len(data), data)
+
+
+def _encode(value: Any) -> bytes:
+    """
+    Canonical encoding of a key argument: equal arguments encode the same whatever the process, hash seed or
+    insertion order (set members and dict items are sorted by their encoding).
+    Pickle bytes are not used because the order of sets inside them depends on the hash seed.
+
+    :raises: `TypeError` for types that have no canonical encoding.
+    """
+    cls = type(value)
+    if value is None:
+        return b"N"
+    if cls is bool:
+        return b"T" if value else b"F"
+    if isinstance(value, Enum):
+        return b"e" + _encode(f"{cls.__module__}.{cls.__qualname__}") + _encode(value.name)
+    if cls is int:
+        return b"i%d;" % value
+    if cls is float:
+        return b"f%s;" % value.hex().encode()
+    if cls is complex:
+        return b"c" + _encode(value.real) + _encode(value.imag)
+    if cls is str:
+        return _sized(b"s", value.encode("utf-8", "surrogatepass"))
+    if cls is bytes:
+        return _sized(b"b", value)
+    if cls is tuple:
+        return _sized(b"t", b"".join(_encode(item) for item in value))
+    if cls is list:
+        return _sized(b"l", b"".join(_encode(item) for item in value))
+    if cls is dict:
+        items = sorted((_encode(key), _encode(item)) for key, item in value.items())
+        return _sized(b"d", b"".join(key + item for key, item in items))
+    if cls is set or cls is frozenset:
+        return _sized(b"S" if cls is set else b"z", b"".join(sorted(_encode(item) for item in value)))
+    if cls is Some:
+        return b"V" + _encode(value.Some)
+    if cls is Empty:
+        return b"E"
+    if cls is Ok:
+        return b"O" + _encode(value.Ok)
+    if cls is Err:
+        return b"R" + _encode(value.Error)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = tuple((field.name, getattr(value, field.name)) for field in dataclasses.fields(value))
+        return b"D" + _encode(f"{cls.__module__}.{cls.__qualname__}") + _encode(fields)
+    raise TypeError(f"Arguments of type {cls.__qualname__} have no stable key")
+
+
+def stable_key(namespace: str, args: Tuple, kwargs: dict) -> str:
+    """
+    Supported arguments are None, bool, int, float, complex, str, bytes, tuples, lists, dicts, sets, frozensets,
+    enum members, dataclass instances and the prelude variants, nested in any way.
+
+    :param namespace: Prefix to avoid collisions between different functions sharing a store.
+    :param args: Positional arguments of the call.
+    :param kwargs: Keyword arguments of the call.
+    :return: Hex digest identifying the call, stable across processes and runs.
+    :raises: `TypeError` if an argument is not supported.
+    """
+    return hashlib.sha256(_encode(namespace) + _encode(args) + _encode(kwargs)).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite backed persistent store for `Result` and `Option` values.
+    The database runs in WAL mode so several processes on the same host can read and write it concurrently,
+    each thread uses its own connection.
+    Hits do not write to the database: their access times are kept in memory and written in one transaction every
+    `access_batch` hits or `access_interval` seconds, and before every `set` so evictions see them.
+    """
+    def __init__(
+            self,
+            path: str,
+            max_entries: Optional[int] = None,
+            persist_errors: bool = False,
+            timeout: float = 30.0,
+            access_batch: int = 256,
+            access_interval: float = 1.0,
+    ):
+        """
+        :param path: Database file path, created if it does not exist.
+        :param max_entries: Maximum number of entries, least recently used ones are evicted. Unbounded if None.
+        :param persist_errors: Whether `Err`/`Empty` values are stored.
+        :param timeout: Seconds to wait for a lock held by another process.
+        :param access_batch: Number of pending access times that triggers a write.
+        :param access_interval: Maximum seconds an access time stays pending, checked on hits.
+        """
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.persist_errors = persist_errors
+        self.timeout = timeout
+        self.access_batch = access_batch
+        self.access_interval = access_interval
+        self._local = threading.local()
+        # access times of the hits not written yet, by key
+        self._accessed: Dict[str, float] = {}
+        self._accessed_lock = threading.Lock()
+        self._accessed_since = time.monotonic()
+        with self._connection() as connection:
+            connection.execute(_SCHEMA)
+            connection.execute(_ACCESSED_INDEX)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Option[Any]:
+        """
+        :param key: Entry key.
+        :return: `Some(value)` if the key is stored, `Empty` otherwise.
+        """
+        connection = self._connection()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return Empty()
+        with self._accessed_lock:
+            self._accessed[key] = time.time()
+            due = (
+                len(self._accessed) >= self.access_batch
+                or time.monotonic() - self._accessed_since >= self.access_interval
+            )
+        if due:
+            with connection:
+                self._write_accessed(connection)
+        return Some(pickle.loads(row[0]))
+
+    def _write_accessed(self, connection: sqlite3.Connection):
+        """
+        Writes the pending access times, within the transaction of the caller.
+        """
+        with self._accessed_lock:
+            pending = self._accessed
+            self._accessed = {}
+            self._accessed_since = time.monotonic()
+        if pending:
+            # another process may have recorded a later access in the meantime
+            connection.executemany(
+                "UPDATE entries SET accessed = MAX(accessed, ?) WHERE key = ?",
+                [(accessed, key) for key, accessed in pending.items()],
+            )
+
+    def flush(self):
+        """
+        Writes the pending access times.
+        """
+        connection = self._connection()
+        with connection:
+            self._write_accessed(connection)
+
+    def set(self, key: str, value: Any):
+        """
+        Stores value under key, unless it is a failure and errors are not persisted.
+        :param key: Entry key.
+        :param value: Value to store, it must be picklable.
+        """
+        if not self.persist_errors and is_failure(value):
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        connection = self._connection()
+        with connection:
+            self._write_accessed(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, accessed) VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self):
+        with self._accessed_lock:
+            self._accessed = {}
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM entries")
+
+    def close(self):
+        """
+        Writes the pending access times and closes the connection owned by the calling thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            with connection:
+                self._write_accessed(connection)
+            connection.close()
+            self._local.connection = None
+
+
+def disk_memoize(
+        path: str,
+        max_entries: Optional[int] = None,
+        persist_errors: bool = False,
+        namespace: Optional[str] = None,
+):
+    """
+    Persistent memoization decorator for expensive functions returning `Result` or `Option`.
+    Arguments are hashed with `stable_key`, see there for the supported types.
+    The wrapped function exposes the underlying `DiskCache` as `cache`.
+
+    :param path: Database file path.
+    :param max_entries: Maximum number of stored entries, unbounded if None.
+    :param persist_errors: Whether `Err`/`Empty` values are stored.
+    :param namespace: Key prefix, defaults to the function qualified name.
+    """
+    def decorator(f: Callable[..., T]) -> Callable[..., T]:
+        cache = DiskCache(path, max_entries=max_entries, persist_errors=persist_errors)
+        prefix = namespace or f"{f.__module__}.{f.__qualname__}"
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            key = stable_key(prefix, args, kwargs)
+            stored = cache.get(key)
+            if stored.is_some:
+                return stored.unwrap()
+            value = f(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from rusty_results.prelude import Err
+
+
+T = TypeVar('T')
+
+# variable parts of error messages, replaced so errors differing only by them share a template
+_VARIABLE_PARTS = re.compile(r"""'[^']*'|"[^"]*"|\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{8,}\b|-?\d+(?:\.\d+)?""")
+_OTHER: Tuple[str, str] = ("<other>", "<too many distinct errors>")
+_FLUSH = object()
+_CLOSE = object()
+_TIMEOUT = object()
+
+
+def template(message: str) -> str:
+    """
+    :param message: Error message.
+    :return: message with numbers, hex ids and quoted strings replaced by placeholders.
+    """
+    return _VARIABLE_PARTS.sub("<*>", message)
+
+
+@dataclass
+class _Entry:
+    # events since the last summary
+    count: int
+    # events since the key was first seen
+    total: int
+    example: str
+
+
+class ErrSink:
+    """
+    Logs the `Err` values of `Result` returning functions or pipelines without flooding the logs.
+    The request path only enqueues the error, optionally sampled, a background thread formats it, deduplicates it by
+    error type and message template, logs the first occurrence of each template and then one summary with counts
+    per template every `interval` seconds.
+    E.g.:
+    ```
+    sink = ErrSink(logging.getLogger("orders"))
+
+    @sink
+    def load_order(order_id: int) -> Result[Order, str]:
+        ...
+
+    order = sink.record(fetch(url).and_then(parse))
+    ```
+    """
+    def __init__(
+            self,
+            logger: Optional[logging.Logger] = None,
+            level: int = logging.WARNING,
+            interval: float = 10.0,
+            sample_rate: float = 1.0,
+            max_templates: int = 1024,
+            max_pending: int = 65536,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param logger: Logger to write to, `rusty_results` by default.
+        :param level: Logging level of the records.
+        :param interval: Seconds between summaries.
+        :param sample_rate: Probability, in (0, 1], of keeping each error. Counts are scaled back accordingly.
+        :param max_templates: Distinct templates tracked, further ones are counted together.
+        :param max_pending: Errors waiting for the background thread, further ones are dropped and counted.
+        :param clock: Monotonic time source.
+        """
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.logger = logger or logging.getLogger("rusty_results")
+        self.level = level
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self.max_templates = max_templates
+        self._clock = clock
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_pending)
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rusty_results-err-sink", daemon=True)
+                self._thread.start()
+
+    def record(self, value: T) -> T:
+        """
+        Enqueues value if it is an `Err`, to be used inline in pipelines.
+
+        :param value: Any value, usually a `Result`.
+        :return: value itself.
+        """
+        if not isinstance(value, Err):
+            return value
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return value
+        if self._thread is None:
+            self._ensure_thread()
+        try:
+            self._queue.put_nowait(value.Error)
+        except queue.Full:
+            # approximate under contention, this is only reported
+            self._dropped += 1
+        return value
+
+    def __call__(self, f):
+        """
+        Decorator recording the `Err` values returned by f, works for both functions and coroutine functions.
+        """
+        if asyncio.iscoroutinefunction(f):
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return self.record(await f(*args, **kwargs))
+            return async_wrapper
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return self.record(f(*args, **kwargs))
+        return wrapper
+
+    def _key(self, error: Any) -> Tuple[Tuple[str, str], str]:
+        try:
+            message = str(error)
+        except Exception:
+            message = object.__repr__(error)
+        key = (type(error).__qualname__, template(message))
+        if key not in self._entries and len(self._entries) >= self.max_templates:
+            key = _OTHER
+        return key, message
+
+    def _add(self, error: Any):
+        key, message = self._key(error)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = _Entry(0, 1, message)
+            self.logger.log(
+                self.level, "%s: %s", key[0], message,
+                extra={"err_type": key[0], "err_template": key[1], "err_count": 1},
+            )
+            return
+        entry.count += 1
+        entry.total += 1
+
+    def _summarize(self):
+        scale = 1.0 / self.sample_rate
+        for (error_type, error_template), entry in self._entries.items():
+            if not entry.count:
+                continue
+            count = round(entry.count * scale)
+            self.logger.log(
+                self.level, "%s: %s repeated %d times in the last %.1fs, e.g. %s",
+                error_type, error_template, count, self.interval, entry.example,
+                extra={"err_type": error_type, "err_template": error_template, "err_count": count},
+            )
+            entry.count = 0
+        dropped, self._dropped = self._dropped, 0
+        if dropped:
+            self.logger.log(self.level, "%d errors dropped, the sink queue was full", dropped,
+                            extra={"err_dropped": dropped})
+
+    def _run(self):
+        next_summary = self._clock() + self.interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(next_summary - self._clock(), 0.0))
+            except queue.Empty:
+                item = _TIMEOUT
+            if item is _CLOSE:
+                self._summarize()
+                return
+            if isinstance(item, tuple) and item and item[0] is _FLUSH:
+                self._summarize()
+                item[1].set()
+            elif item is not _TIMEOUT:
+                self._add(item)
+            if self._clock() >= next_summary:
+                self._summarize()
+                next_summary = self._clock() + self.interval
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the pending errors to be processed and writes a summary right away.
+
+        :param timeout: Maximum seconds to wait.
+        :return: True if the flush completed in time.
+        """
+        self._ensure_thread()
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Processes the pending errors, writes a last summary and stops the background thread.
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_CLOSE)
+        thread.join(timeout)
+
+    def counts(self) -> Dict[Tuple[str, str], int]:
+        """
+        :return: Sampled number of errors seen per (error type, message template) since creation.
+        """
+        return {key: entry.total for key, entry in list(self._entries.items())}
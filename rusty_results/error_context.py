@@ -0,0 +1,121 @@
+import sys
+from types import CodeType
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from rusty_results._dataclasses import dataclass_info, frozen_setattr, frozen_delattr
+
+
+E = TypeVar('E')
+
+Frame = Tuple[CodeType, int]
+
+# whether `Err.context` and `Err.with_context` record where they were called, see `capture_frames`
+_capture = False
+
+
+def capture_frames(enabled: bool = True):
+    """
+    Enables or disables recording the calling location of each context layer. Only a code object and a line number
+    are kept per layer, rendering them (file, function and source line) is deferred to `ContextError.render`.
+
+    :param enabled: Whether to record locations.
+    """
+    global _capture
+    _capture = enabled
+
+
+def _caller_frame() -> Optional[Frame]:
+    """
+    :return: Location of the caller of the prelude method calling this function, if capture is enabled.
+    """
+    if not _capture:
+        return None
+    frame = sys._getframe(2)
+    return frame.f_code, frame.f_lineno
+
+
+def _render_frame(frame: Frame) -> str:
+    import linecache
+
+    code, lineno = frame
+    location = f'File "{code.co_filename}", line {lineno}, in {code.co_name}'
+    line = linecache.getline(code.co_filename, lineno).strip()
+    return f"{location}\n        {line}" if line else location
+
+
+class ContextError(Generic[E]):
+    """
+    Error value adding a context layer (usually a message) on top of a source error, built by `Err.context` and
+    `Err.with_context`. Layers nest, the innermost source being the original error.
+    """
+    context: Any
+    source: E
+    frame: Optional[Frame] = None
+
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ("context", "source", "frame")
+    __dataclass_fields__, __dataclass_params__ = dataclass_info(
+        ("context", Any, {}),
+        ("source", E, {}),  # type: ignore[misc]
+        ("frame", Optional[Frame], {"default": None, "compare": False, "repr": False}),
+    )
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __init__(self, context: Any, source: E, frame: Optional[Frame] = None):
+        object.__setattr__(self, "context", context)
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "frame", frame)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(context={self.context!r}, source={self.source!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.context, self.source) == (other.context, other.source)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.context, self.source))
+
+    def chain(self) -> Iterator[Any]:
+        """
+        :return: Iterator over the context layers, outermost first, ending with the root error.
+        """
+        error: Any = self
+        while isinstance(error, ContextError):
+            yield error.context
+            error = error.source
+        yield error
+
+    @property
+    def root(self) -> Any:
+        """
+        :return: The original error, below every context layer.
+        """
+        error: Any = self
+        while isinstance(error, ContextError):
+            error = error.source
+        return error
+
+    def render(self) -> str:
+        """
+        :return: Multi line description of the chain, with the captured locations.
+        """
+        lines: List[str] = [f"Error: {self.context}"]
+        if self.frame is not None:
+            lines.append(f"    {_render_frame(self.frame)}")
+        lines.append("Caused by:")
+        error: Any = self.source
+        index = 0
+        while isinstance(error, ContextError):
+            lines.append(f"    {index}: {error.context}")
+            if error.frame is not None:
+                lines.append(f"    {_render_frame(error.frame)}")
+            error = error.source
+            index += 1
+        lines.append(f"    {index}: {error!r}" if isinstance(error, BaseException) else f"    {index}: {error}")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return ": ".join(str(layer) for layer in self.chain())
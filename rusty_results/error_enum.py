@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Any
+
+from rusty_results.prelude import Err
+
+
+class ErrorEnum(Enum):
+    """
+    Base class for a fixed set of errors. Each member comes with a prebuilt `Err` holding it, so returning one of
+    them does not allocate, and the member is a singleton so it can be compared by identity. Member values are
+    compact codes: they are what pickle stores, and what the JSON and msgpack codecs write.
+    E.g.:
+    ```
+    class ValidationError(ErrorEnum):
+        EMPTY = 1
+        TOO_LONG = 2
+
+    def validate(name: str) -> Result[str, ValidationError]:
+        if not name:
+            return ValidationError.EMPTY.err
+        return Ok(name)
+
+    if validate("").Error is ValidationError.EMPTY:
+        ...
+    ```
+    """
+    def __init__(self, *args: Any):
+        self._err = Err(self)
+
+    @property
+    def err(self) -> Err:
+        """
+        :return: The shared `Err` holding this member.
+        """
+        return self._err
+
+    @property
+    def code(self) -> Any:
+        return self.value
+
+    @classmethod
+    def from_code(cls, code: Any) -> "ErrorEnum":
+        """
+        :param code: Member value.
+        :return: The member with that code.
+        :raises: `ValueError` if there is no member with that code.
+        """
+        return cls(code)
+
+    def matches(self, value: Any) -> bool:
+        """
+        :param value: Any value, usually a `Result`.
+        :return: True if value is an `Err` holding this member.
+        """
+        return value is self._err or (isinstance(value, Err) and value.Error is self)
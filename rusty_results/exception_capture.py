@@ -0,0 +1,154 @@
+"""
+Keeping caught exceptions in `Err` values without keeping their tracebacks alive.
+
+A traceback references every frame it went through, and each frame all of its locals, so a list of `Err(exception)`
+can hold far more memory than the exceptions themselves. `strip_traceback` drops the traceback of an exception and of
+its chained causes, optionally keeping a `traceback.StackSummary` (file, line and function names only, source lines
+are read when formatted) that `format_captured` turns back into a readable traceback.
+"""
+import traceback
+from functools import wraps
+from types import TracebackType
+from typing import Callable, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from rusty_results.prelude import Result, Ok, Err
+
+
+T = TypeVar('T')
+Exc = TypeVar('Exc', bound=BaseException)
+
+# attribute holding the summary of the stripped traceback
+_STACK_ATTRIBUTE = "_rusty_results_stack"
+
+_CAUSE_HEADER = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT_HEADER = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+
+def _summarize(tb: TracebackType, limit: Optional[int]) -> traceback.StackSummary:
+    # built directly instead of through `StackSummary.extract`, which checks the line cache of every file
+    frames = [
+        traceback.FrameSummary(frame.f_code.co_filename, lineno, frame.f_code.co_name, lookup_line=False)
+        for frame, lineno in traceback.walk_tb(tb)
+    ]
+    if limit is not None:
+        frames = frames[-limit:] if limit else []
+    return traceback.StackSummary.from_list(frames)
+
+
+def strip_traceback(exception: Exc, summarize: bool = False, limit: Optional[int] = None) -> Exc:
+    """
+    Drops the traceback of exception and of its `__cause__`/`__context__` chain, in place.
+
+    :param exception: Exception to strip.
+    :param summarize: Keep a compact `StackSummary` of each traceback, see `stack_summary` and `format_captured`.
+    :param limit: Maximum number of frames kept per summary, the innermost ones.
+    :return: exception itself.
+    """
+    seen: Set[int] = set()
+    current: Optional[BaseException] = exception
+    pending: List[BaseException] = []
+    while current is not None or pending:
+        if current is None:
+            current = pending.pop()
+        if id(current) in seen:
+            current = None
+            continue
+        seen.add(id(current))
+        tb = current.__traceback__
+        if tb is not None:
+            if summarize:
+                setattr(current, _STACK_ATTRIBUTE, _summarize(tb, limit))
+            current.__traceback__ = None
+        if current.__context__ is not None and current.__context__ is not current.__cause__:
+            pending.append(current.__context__)
+        current = current.__cause__
+    return exception
+
+
+def stack_summary(exception: BaseException) -> Optional[traceback.StackSummary]:
+    """
+    :param exception: Exception stripped with `summarize=True`.
+    :return: The summary of its former traceback, None if there is none.
+    """
+    return getattr(exception, _STACK_ATTRIBUTE, None)
+
+
+def capture(exception: BaseException, summarize: bool = False, limit: Optional[int] = None) -> Err:
+    """
+    :param exception: Caught exception.
+    :param summarize: Keep a compact summary of the traceback.
+    :param limit: Maximum number of frames kept in the summary.
+    :return: `Err(exception)` with the traceback stripped.
+    """
+    return Err(strip_traceback(exception, summarize, limit))
+
+
+def catch(
+        *exceptions: Type[BaseException], summarize: bool = False, limit: Optional[int] = None
+) -> Callable[[Callable[..., T]], Callable[..., Result[T, BaseException]]]:
+    """
+    Decorator returning `Ok(value)`, or the captured `Err(exception)` if the function raises one of exceptions.
+    E.g.:
+    ```
+    @catch(ValueError, summarize=True)
+    def parse(line: str) -> int:
+        return int(line)
+
+    results = [parse(line) for line in lines]
+    ```
+    :param exceptions: Exception types to capture, `Exception` if none.
+    :param summarize: Keep a compact summary of the traceback.
+    :param limit: Maximum number of frames kept in the summary.
+    """
+    caught: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = exceptions or Exception
+
+    def decorator(f: Callable[..., T]) -> Callable[..., Result[T, BaseException]]:
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            try:
+                return Ok(f(*args, **kwargs))
+            except caught as e:
+                return capture(e, summarize, limit)
+        return wrapper
+    return decorator
+
+
+def _format_one(exception: BaseException) -> List[str]:
+    lines = []
+    summary = stack_summary(exception)
+    if summary:
+        lines.append("Traceback (most recent call last):\n")
+        lines.extend(summary.format())
+    lines.extend(traceback.format_exception_only(type(exception), exception))
+    return lines
+
+
+def format_captured(exception: BaseException) -> str:
+    """
+    Rebuilds a readable traceback for a stripped exception and its chain, like `traceback.format_exception` would.
+    Frames are only listed if they were summarized.
+
+    :param exception: Stripped exception.
+    :return: Formatted traceback.
+    """
+    chain: List[Tuple[str, BaseException]] = []
+    seen: Set[int] = set()
+    current: Optional[BaseException] = exception
+    header = ""
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        chain.append((header, current))
+        if current.__cause__ is not None:
+            header, current = _CAUSE_HEADER, current.__cause__
+        elif current.__context__ is not None and not current.__suppress_context__:
+            header, current = _CONTEXT_HEADER, current.__context__
+        else:
+            current = None
+    lines: List[str] = []
+    # the innermost exception first, as the interpreter prints them
+    for index in range(len(chain) - 1, -1, -1):
+        header, current = chain[index]
+        lines.extend(_format_one(current))
+        if header:
+            lines.append(header)
+    return "".join(lines)
@@ -1,9 +1,37 @@
 from functools import wraps
-from typing import TypeVar
+from typing import Any, TypeVar
+
+
+_NO_MESSAGE: Any = object()
 
 
 class UnwrapException(Exception):
-    ...
+    """
+    Raised when unwrapping the wrong variant. The message is only built when the exception is displayed:
+    `message.format(*args)` if format arguments were given, `str(message)` otherwise.
+    """
+    def __init__(self, message: Any = _NO_MESSAGE, *args: Any, variant: Any = None):
+        """
+        :param message: Message, or value whose `str` is the message.
+        :param args: Arguments for `message.format`.
+        :param variant: The `Option` or `Result` value that could not be unwrapped.
+        """
+        if message is _NO_MESSAGE:
+            super().__init__()
+            message = ""
+        else:
+            super().__init__(message)
+        self.message = message
+        self.format_args = args
+        self.variant = variant
+
+    def __str__(self) -> str:
+        if self.format_args:
+            return str(self.message).format(*self.format_args)
+        return str(self.message)
+
+    def __reduce__(self):
+        return type(self), (self.message, *self.format_args), {"variant": self.variant}
 
 
 T = TypeVar("T")
@@ -0,0 +1,146 @@
+import asyncio
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Optional, TypeVar, Union
+
+from rusty_results.prelude import Result, Err
+from rusty_results.deadline import DeadlineExceeded, check, _limit
+from rusty_results._executor import default_executor
+
+
+T = TypeVar('T')
+E = TypeVar('E')
+
+
+@dataclass(eq=True, frozen=True)
+class HedgeErrors(Generic[E]):
+    """
+    Error value returned when both the primary and the fallback calls fail.
+    """
+    primary: E
+    fallback: E
+
+
+def hedged(
+        primary: Callable[[], Result[T, E]],
+        fallback: Callable[[], Result[T, E]],
+        delay: float,
+        executor: Optional[Executor] = None,
+) -> Result[T, Union["HedgeErrors[E]", DeadlineExceeded]]:
+    """
+    Hedged version of `or_else`.
+    Runs `primary` in a background thread, if it did not answer within `delay` seconds `fallback` is started as well.
+    `fallback` is started right away if `primary` fails before the delay.
+    The first `Ok` is returned and the other call is cancelled. Calls that already started cannot be interrupted,
+    their result is simply discarded. An exception raised by a call is only propagated once the other call did not
+    return an `Ok` either, the primary one first. If the current deadline passes while waiting `Err(DeadlineExceeded)`
+    is returned, and `fallback` is not started.
+
+    :param primary: Function to call first.
+    :param fallback: Function to hedge with, unlike `or_else` it does not receive the error.
+    :param delay: Seconds to wait for `primary` before starting `fallback`.
+    :param executor: Executor to run the calls, if None each runs in its own daemon thread so calls that never
+        return do not hold back later ones.
+    :return: The first `Ok`, or `Err(HedgeErrors(primary_error, fallback_error))` if both failed.
+    """
+    expired = check()
+    if expired.is_err:
+        return Err(expired.unwrap_err())
+    executor = executor or default_executor()
+    primary_future: Future = executor.submit(copy_context().run, primary)
+    wait((primary_future,), timeout=_limit(delay)[0])
+    if _succeeded(primary_future):
+        return primary_future.result()
+
+    expired = check()
+    if expired.is_err:
+        primary_future.cancel()
+        return Err(expired.unwrap_err())
+    fallback_future: Future = executor.submit(copy_context().run, fallback)
+    pending = {fallback_future} if primary_future.done() else {primary_future, fallback_future}
+    while pending:
+        limit, deadline = _limit(None)
+        done, pending = wait(pending, timeout=limit, return_when=FIRST_COMPLETED)
+        if not done:
+            for loser in pending:
+                loser.cancel()
+            return Err(DeadlineExceeded(deadline))
+        for future in done:
+            if _succeeded(future):
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+    return _settle(primary_future, fallback_future)
+
+
+async def hedged_async(
+        primary: Callable[[], Awaitable[Result[T, E]]],
+        fallback: Callable[[], Awaitable[Result[T, E]]],
+        delay: float,
+) -> Result[T, Union["HedgeErrors[E]", DeadlineExceeded]]:
+    """
+    Async version of `hedged` for coroutine functions. The losing call is cancelled.
+
+    :param primary: Coroutine function to call first.
+    :param fallback: Coroutine function to hedge with.
+    :param delay: Seconds to wait for `primary` before starting `fallback`.
+    :return: The first `Ok`, or `Err(HedgeErrors(primary_error, fallback_error))` if both failed.
+    """
+    expired = check()
+    if expired.is_err:
+        return Err(expired.unwrap_err())
+    primary_task = asyncio.ensure_future(primary())
+    try:
+        await asyncio.wait((primary_task,), timeout=_limit(delay)[0])
+        if _succeeded(primary_task):
+            return primary_task.result()
+
+        expired = check()
+        if expired.is_err:
+            return Err(expired.unwrap_err())
+        fallback_task = asyncio.ensure_future(fallback())
+        pending = {fallback_task} if primary_task.done() else {primary_task, fallback_task}
+        try:
+            while pending:
+                limit, deadline = _limit(None)
+                done, pending = await asyncio.wait(pending, timeout=limit, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    return Err(DeadlineExceeded(deadline))
+                for task in done:
+                    if _succeeded(task):
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        return _settle(primary_task, fallback_task)
+    finally:
+        if not primary_task.done():
+            primary_task.cancel()
+
+
+def _succeeded(future: Union[Future, "asyncio.Future"]) -> bool:
+    """
+    :return: True if future finished with an `Ok`, an exception raised by the call is kept for `_settle`.
+    """
+    return future.done() and future.exception() is None and future.result().is_ok
+
+
+def _settle(
+        primary: Union[Future, "asyncio.Future"], fallback: Union[Future, "asyncio.Future"]
+) -> Result[T, "HedgeErrors[E]"]:
+    """
+    Outcome once both calls finished without an `Ok`. An exception raised by either call is re-raised, the primary
+    one first, so a failing call only propagates after the other one had its chance.
+    """
+    for future in (primary, fallback):
+        error = future.exception()
+        if error is not None:
+            raise error
+    return _combine(primary.result(), fallback.result())
+
+
+def _combine(primary: Result[T, E], fallback: Result[T, E]) -> Result[T, "HedgeErrors[E]"]:
+    if fallback.is_ok:
+        return fallback
+    return Err(HedgeErrors(primary.unwrap_err(), fallback.unwrap_err()))
@@ -0,0 +1,217 @@
+"""
+Opt-in instrumentation counting, per call site and per variant:
+
+* `Err` and `Empty` creations (`CREATE`).
+* `unwrap`/`expect` failures raising `UnwrapException` (`UNWRAP`).
+* `~x` and `early_return` short-circuits (`EARLY_RETURN`).
+
+Nothing is installed until `enable` is called: the prelude classes are left untouched, so there is no cost at all
+while instrumentation is off. `enable` wraps the `Err` and `Empty` constructors, and either registers a
+`sys.monitoring` RAISE callback (Python 3.12+) or wraps the failing unwrap and early return methods, and `disable`
+restores everything. Call sites are the first frame outside of the library prelude.
+
+With `sample_rate` below 1, each event is counted with that probability, estimated totals are `count / sample_rate`.
+"""
+import random
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from rusty_results import prelude
+from rusty_results._patching import Patches
+from rusty_results.exceptions import UnwrapException, EarlyReturnException
+from rusty_results.prelude import Some, Empty, Ok, Err
+
+
+__all__ = [
+    "CREATE", "UNWRAP", "EARLY_RETURN", "Site", "enable", "disable", "is_enabled", "instrumented", "counters",
+    "reset",
+]
+
+CREATE = "create"
+UNWRAP = "unwrap"
+EARLY_RETURN = "early_return"
+
+_TOOL_NAME = "rusty_results"
+_INTERNAL_FILES = {prelude.__file__, __file__}
+
+# methods that always raise when called on their variant
+_UNWRAP_METHODS = ((Empty, "expects"), (Empty, "unwrap"), (Some, "expect_empty"), (Ok, "unwrap_err"),
+                   (Ok, "expect_err"), (Err, "unwrap"), (Err, "expect"))
+_EARLY_RETURN_METHODS = ((Empty, "early_return"), (Err, "early_return"))
+
+
+@dataclass(eq=True, frozen=True)
+class Site:
+    filename: str
+    lineno: int
+    function: str
+
+
+_UNKNOWN_SITE = Site("<unknown>", 0, "<unknown>")
+
+_lock = threading.Lock()
+_counts: "Counter[Tuple[str, str, Site]]" = Counter()
+_sample_rate = 1.0
+_random: Callable[[], float] = random.random
+_patches = Patches()
+_tool_id: Optional[int] = None
+
+
+def _site() -> Site:
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename in _INTERNAL_FILES:
+        frame = frame.f_back
+    if frame is None:
+        return _UNKNOWN_SITE
+    return Site(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+
+def _record(event: str, variant: str):
+    if _sample_rate < 1.0 and _random() >= _sample_rate:
+        return
+    key = (event, variant, _site())
+    with _lock:
+        _counts[key] += 1
+
+
+def _wrap_err_init(original: Callable) -> Callable:
+    @wraps(original)
+    def __init__(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        _record(CREATE, type(self).__name__)
+    return __init__
+
+
+def _wrap_empty_new(original: Callable) -> Callable:
+    @wraps(original)
+    def __new__(cls):
+        instance = original(cls)
+        _record(CREATE, cls.__name__)
+        return instance
+    return __new__
+
+
+def _wrap_raising(original: Callable, event: str) -> Callable:
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        _record(event, type(self).__name__)
+        return original(self, *args, **kwargs)
+    return wrapper
+
+
+def _on_raise(code, offset: int, exception: BaseException):
+    if code.co_filename not in _INTERNAL_FILES:
+        return
+    traceback = exception.__traceback__
+    if traceback is not None and traceback.tb_next is not None:
+        # propagating through a caller, it was already counted where it was raised
+        return
+    if isinstance(exception, EarlyReturnException):
+        _record(EARLY_RETURN, type(exception.value).__name__)
+    elif isinstance(exception, UnwrapException):
+        _record(UNWRAP, type(exception.variant).__name__)
+
+
+def _start_monitoring():
+    global _tool_id
+    monitoring = sys.monitoring  # type: ignore[attr-defined]
+    for tool_id in range(6):
+        if monitoring.get_tool(tool_id) is None:
+            break
+    else:
+        raise RuntimeError("No free sys.monitoring tool id")
+    monitoring.use_tool_id(tool_id, _TOOL_NAME)
+    monitoring.register_callback(tool_id, monitoring.events.RAISE, _on_raise)
+    monitoring.set_events(tool_id, monitoring.events.RAISE)
+    _tool_id = tool_id
+
+
+def _stop_monitoring():
+    global _tool_id
+    if _tool_id is None:
+        return
+    monitoring = sys.monitoring  # type: ignore[attr-defined]
+    monitoring.set_events(_tool_id, 0)
+    monitoring.register_callback(_tool_id, monitoring.events.RAISE, None)
+    monitoring.free_tool_id(_tool_id)
+    _tool_id = None
+
+
+def enable(sample_rate: float = 1.0, backend: str = "auto", rng: Callable[[], float] = random.random):
+    """
+    Installs the instrumentation, replacing any previous installation. Counters are kept, see `reset`.
+
+    :param sample_rate: Probability, in (0, 1], of counting each event.
+    :param backend: How unwrap failures and early returns are caught: `"monitoring"` (`sys.monitoring` RAISE
+    events, Python 3.12+), `"patch"` (wrapping the raising methods) or `"auto"` for the first available one.
+    :param rng: Function returning a float in [0, 1), used for sampling.
+    :raises: `ValueError` for an invalid sample_rate or backend.
+    """
+    global _sample_rate, _random
+    if not 0.0 < sample_rate <= 1.0:
+        raise ValueError("sample_rate must be in (0, 1]")
+    if backend == "auto":
+        backend = "monitoring" if hasattr(sys, "monitoring") else "patch"
+    if backend not in ("monitoring", "patch"):
+        raise ValueError(f"Unknown backend {backend!r}")
+    disable()
+    _sample_rate = sample_rate
+    _random = rng
+    _patches.patch(Err, "__init__", _wrap_err_init(Err.__init__))
+    _patches.patch(Empty, "__new__", staticmethod(_wrap_empty_new(Empty.__dict__["__new__"].__func__)))
+    if backend == "monitoring":
+        _start_monitoring()
+        return
+    for cls, name in _UNWRAP_METHODS:
+        _patches.patch(cls, name, _wrap_raising(cls.__dict__[name], UNWRAP))
+    for cls, name in _EARLY_RETURN_METHODS:
+        _patches.patch(cls, name, _wrap_raising(cls.__dict__[name], EARLY_RETURN))
+
+
+def disable():
+    """
+    Removes the instrumentation, restoring the prelude classes. Counters are kept.
+    """
+    _stop_monitoring()
+    _patches.restore()
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+@contextmanager
+def instrumented(sample_rate: float = 1.0, backend: str = "auto") -> Iterator[None]:
+    """
+    Enables the instrumentation for the duration of the block.
+    E.g.:
+    ```
+    with instrumented():
+        run_job()
+    for (event, variant, site), count in counters().items():
+        ...
+    ```
+    """
+    enable(sample_rate, backend)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def counters() -> Dict[Tuple[str, str, Site], int]:
+    """
+    :return: Sampled event counts by (event, variant name, call site).
+    """
+    with _lock:
+        return dict(_counts)
+
+
+def reset():
+    with _lock:
+        _counts.clear()
@@ -0,0 +1,129 @@
+"""
+Interning of common `Some` and `Ok` values.
+
+`option_from`, `Ok.ok()`, `Err.err()`, `Some.ok_or()` and `Some.ok_or_else()` always return shared instances for
+None, True, False and small ints (-5 to 256), from a fixed table built at import. `some` and `ok` give the same
+behaviour to user code.
+
+For other payloads, `enable_cache` installs a bounded LRU cache of shared instances. Only payload types whose
+equality implies they are interchangeable are cached, by exact type: str, bytes and int by default. Floats
+(`0.0 == -0.0`), containers (`(1,) == (True,)`) and similar types are not cached unless explicitly listed.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from rusty_results import prelude
+from rusty_results.prelude import Some, Ok
+
+
+T = TypeVar('T')
+
+__all__ = ["InternStats", "InternCache", "some", "ok", "enable_cache", "disable_cache", "cache_stats"]
+
+
+@dataclass(eq=True, frozen=True)
+class InternStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class InternCache:
+    """
+    Thread safe LRU cache of shared `Some`/`Ok` instances.
+    """
+    def __init__(self, maxsize: int = 1024, types: Iterable[type] = (str, bytes, int), max_len: Optional[int] = 64):
+        """
+        :param maxsize: Maximum number of cached instances.
+        :param types: Exact payload types to cache.
+        :param max_len: Longest str or bytes payload cached, None for no limit.
+        """
+        self.maxsize = maxsize
+        self.types = frozenset(types)
+        self.max_len = max_len
+        self._entries: "OrderedDict[Tuple[type, type, Hashable], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, cls: type, value: Any) -> Any:
+        """
+        :param cls: `Some` or `Ok`.
+        :param value: Payload.
+        :return: The shared `cls(value)`, or a new one if value is not cacheable.
+        """
+        value_cls = type(value)
+        if value_cls not in self.types:
+            return cls(value)
+        if self.max_len is not None and (value_cls is str or value_cls is bytes) and len(value) > self.max_len:
+            return cls(value)
+        # the payload type is part of the key, so equal values of different types (1 and 1.0) are kept apart
+        key = (cls, value_cls, value)
+        with self._lock:
+            instance = self._entries.get(key)
+            if instance is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return instance
+            self._misses += 1
+            instance = cls(value)
+            self._entries[key] = instance
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return instance
+
+    def stats(self) -> InternStats:
+        with self._lock:
+            return InternStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def some(value: T) -> Some[T]:
+    """
+    :param value: Payload.
+    :return: `Some(value)`, shared when interned.
+    """
+    return prelude._some(value)
+
+
+def ok(value: T) -> Ok:
+    """
+    :param value: Payload.
+    :return: `Ok(value)`, shared when interned.
+    """
+    return prelude._ok(value)
+
+
+def enable_cache(maxsize: int = 1024, types: Iterable[type] = (str, bytes, int), max_len: Optional[int] = 64) \
+        -> InternCache:
+    """
+    Installs a new interning cache, replacing the current one.
+
+    :param maxsize: Maximum number of cached instances.
+    :param types: Exact payload types to cache.
+    :param max_len: Longest str or bytes payload cached, None for no limit.
+    :return: The installed cache.
+    """
+    cache = InternCache(maxsize, types, max_len)
+    prelude._intern_cache = cache
+    return cache
+
+
+def disable_cache():
+    prelude._intern_cache = None
+
+
+def cache_stats() -> Optional[InternStats]:
+    """
+    :return: Stats of the installed cache, None if there is none.
+    """
+    cache = prelude._intern_cache
+    return None if cache is None else cache.stats()
@@ -0,0 +1,180 @@
+"""
+JSON encoding and decoding for `Option` and `Result`.
+
+Each variant is encoded as a single key object:
+
+* `Some(value)` -> `{"Some": value}`
+* `Empty()` -> `{"Empty": null}`
+* `Ok(value)` -> `{"Ok": value}`
+* `Err(error)` -> `{"Error": error}`
+
+This is also how the pydantic integration serializes them. `Empty` gets an explicit key so empty objects keep
+decoding as plain dicts. Values are encoded recursively, so nested options and results are supported.
+`ErrorEnum` members are encoded as their code, `from_code` turns them back into members.
+
+`dumps` and `loads` use orjson when it is installed and fall back to the standard library otherwise.
+msgspec encodes dataclasses natively without calling its `enc_hook`, so values must go through `to_jsonable`
+first when encoding with it.
+"""
+import dataclasses
+import json
+from typing import IO, Any, Dict, Iterable, Iterator, List
+
+from rusty_results.error_enum import ErrorEnum
+from rusty_results.prelude import Some, Empty, Ok, Err, _EMPTY_JSON
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default(obj: Any) -> Any:
+    """
+    Encoder hook, to be used as `default` for `json.dumps` and `orjson.dumps`.
+    orjson encodes dataclasses natively, it needs `option=orjson.OPT_PASSTHROUGH_DATACLASS` to call this hook.
+
+    :param obj: Object the encoder does not know how to handle.
+    :return: JSON compatible form of obj, one level deep.
+    :raises: `TypeError` if obj is not supported.
+    """
+    cls = type(obj)
+    if cls is Some:
+        return {"Some": obj.Some}
+    if cls is Empty:
+        return _EMPTY_JSON
+    if cls is Ok:
+        return {"Ok": obj.Ok}
+    if cls is Err:
+        return {"Error": obj.Error}
+    if isinstance(obj, ErrorEnum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # other dataclasses are passed through as well by orjson, keep its default encoding for them
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+def object_hook(obj: Dict[str, Any]) -> Any:
+    """
+    Decoder hook, to be used as `object_hook` for `json.loads`.
+
+    :param obj: Decoded JSON object.
+    :return: The prelude variant obj encodes, obj itself otherwise.
+    """
+    if len(obj) != 1:
+        return obj
+    key, value = next(iter(obj.items()))
+    if key == "Some":
+        return Some(value)
+    if key == "Ok":
+        return Ok(value)
+    if key == "Error":
+        return Err(value)
+    if key == "Empty" and value is None:
+        return Empty()
+    return obj
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    :param obj: Object to convert.
+    :return: obj with every nested variant replaced by its JSON form, walking lists, tuples and dicts.
+    """
+    cls = type(obj)
+    if cls is Some:
+        return {"Some": to_jsonable(obj.Some)}
+    if cls is Empty:
+        return {"Empty": None}
+    if cls is Ok:
+        return {"Ok": to_jsonable(obj.Ok)}
+    if cls is Err:
+        return {"Error": to_jsonable(obj.Error)}
+    if cls is list or cls is tuple:
+        return [to_jsonable(item) for item in obj]
+    if cls is dict:
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, ErrorEnum):
+        return obj.value
+    return obj
+
+
+def from_jsonable(obj: Any) -> Any:
+    """
+    Rebuilds the prelude variants of an already decoded JSON tree, for decoders without object hooks
+    (e.g. orjson or msgspec).
+
+    :param obj: Decoded JSON value.
+    :return: obj with every variant JSON form replaced by the variant.
+    """
+    cls = type(obj)
+    if cls is list:
+        return [from_jsonable(item) for item in obj]
+    if cls is dict:
+        return object_hook({key: from_jsonable(value) for key, value in obj.items()})
+    return obj
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    :param obj: Object to encode.
+    :return: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, default=default, separators=(",", ":")).encode()
+
+
+def loads(data: bytes) -> Any:
+    """
+    :param data: JSON document, as bytes or str.
+    :return: Decoded value with the prelude variants rebuilt.
+    """
+    if orjson is not None:
+        return from_jsonable(orjson.loads(data))
+    return json.loads(data, object_hook=object_hook)
+
+
+def write_jsonl(fp: IO[bytes], records: Iterable[Any], chunk_size: int = 1024) -> int:
+    """
+    Writes records as JSON Lines, buffering `chunk_size` records per write.
+
+    :param fp: Binary file object.
+    :param records: Records to encode.
+    :param chunk_size: Number of records per write.
+    :return: Number of records written.
+    """
+    count = 0
+    chunk: List[bytes] = []
+    for record in records:
+        chunk.append(dumps(record))
+        if len(chunk) >= chunk_size:
+            fp.write(b"\n".join(chunk) + b"\n")
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        fp.write(b"\n".join(chunk) + b"\n")
+        count += len(chunk)
+    return count
+
+
+def read_jsonl(fp: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Lazily reads JSON Lines records, reading `chunk_size` bytes at a time. Blank lines are skipped.
+
+    :param fp: Binary file object.
+    :param chunk_size: Bytes per read.
+    :return: Iterator over the decoded records.
+    """
+    rest = b""
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield loads(line)
+    if rest.strip():
+        yield loads(rest)
@@ -0,0 +1,226 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple, TypeVar, Union
+
+from rusty_results.prelude import Result, Ok, Err
+
+
+T = TypeVar('T')
+E = TypeVar('E')
+
+_ACQUIRED: Ok = Ok(None)
+
+
+@dataclass(eq=True, frozen=True)
+class Rejected:
+    """
+    Error value returned when a limiter is saturated, the wrapped function is not called.
+    """
+    name: str
+    reason: str
+
+
+@dataclass(eq=True, frozen=True)
+class LimiterStats:
+    in_flight: int
+    accepted: int
+    rejected: int
+    # calls waiting for a slot now, and calls that had to wait so far
+    queued: int = 0
+    waited: int = 0
+
+
+class Limiter:
+    """
+    Load shedding limiter for calls returning `Result`.
+    Supports a maximum number of calls in flight (bulkhead) and/or a token bucket rate. When all slots are taken, up to
+    `max_queue` calls wait for one in FIFO order, for at most `queue_timeout` seconds. Any other call that does not
+    fit returns `Err(Rejected)` right away, so the number of waiting calls stays bounded. Calls over the rate are
+    rejected right away, a queued call already took its token.
+    """
+    def __init__(
+            self,
+            name: str = "limiter",
+            max_in_flight: Optional[int] = None,
+            rate: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_queue: int = 0,
+            queue_timeout: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param name: Name reported by `Rejected`.
+        :param max_in_flight: Maximum concurrent calls, unbounded if None.
+        :param rate: Tokens refilled per second, no rate limit if None.
+        :param burst: Token bucket capacity, defaults to one second worth of `rate`.
+        :param max_queue: Maximum calls waiting for a slot when `max_in_flight` calls are running.
+        :param queue_timeout: Maximum seconds a call waits for a slot, no limit if None.
+        :param clock: Monotonic time source.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1, int(rate or 1)))
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._refilled_at = clock()
+        self._in_flight = 0
+        self._accepted = 0
+        self._rejected = 0
+        # calls waiting for a slot, `threading.Event` for sync calls and `asyncio.Future` for async ones
+        self._waiters: Deque[Any] = deque()
+        self._waited = 0
+        self._busy: Err = Err(Rejected(name, "max_in_flight"))
+        self._throttled: Err = Err(Rejected(name, "rate"))
+        self._timed_out: Err = Err(Rejected(name, "queue_timeout"))
+
+    def _admit(self, max_queue: int, waiter: Callable[[], Any]) -> Tuple[Result[None, Rejected], Any]:
+        """
+        :param max_queue: Maximum calls waiting for a slot.
+        :param waiter: Factory of the object to wait on if the call is queued.
+        :return: The outcome and None, or `Ok(None)` and the waiter if the call must wait for a slot.
+        """
+        with self._lock:
+            full = self.max_in_flight is not None and self._in_flight >= self.max_in_flight
+            if full and len(self._waiters) >= max_queue:
+                self._rejected += 1
+                return self._busy, None
+            if self.rate is not None:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                if self._tokens < 1:
+                    self._rejected += 1
+                    return self._throttled, None
+                self._tokens -= 1
+            if full:
+                queued = waiter()
+                self._waiters.append(queued)
+                self._waited += 1
+                return _ACQUIRED, queued
+            self._in_flight += 1
+            self._accepted += 1
+            return _ACQUIRED, None
+
+    def _give_up(self, waiter: Any) -> bool:
+        """
+        :return: True if waiter was still queued and is now removed, False if it was granted a slot meanwhile.
+        """
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                return False
+            self._rejected += 1
+            return True
+
+    def try_acquire(self) -> Result[None, Rejected]:
+        """
+        Takes a slot (and a token) without waiting. It must be given back with `release` once the call finished.
+        :return: `Ok(None)` if the call can go through, `Err(Rejected)` otherwise.
+        """
+        return self._admit(0, threading.Event)[0]
+
+    def acquire(self) -> Result[None, Rejected]:
+        """
+        Takes a slot (and a token), waiting in the queue if there is room. It must be given back with `release`.
+        :return: `Ok(None)` if the call can go through, `Err(Rejected)` otherwise.
+        """
+        acquired, waiter = self._admit(self.max_queue, threading.Event)
+        if waiter is None or waiter.wait(self.queue_timeout) or not self._give_up(waiter):
+            return acquired
+        return self._timed_out
+
+    async def acquire_async(self) -> Result[None, Rejected]:
+        """
+        Async version of `acquire`, the event loop is not blocked while waiting.
+        """
+        acquired, waiter = self._admit(self.max_queue, asyncio.get_running_loop().create_future)
+        if waiter is None:
+            return acquired
+        try:
+            await asyncio.wait((waiter,), timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            if not self._give_up(waiter):
+                self.release()
+            raise
+        if waiter.done() or not self._give_up(waiter):
+            return acquired
+        return self._timed_out
+
+    def release(self):
+        with self._lock:
+            if not self._waiters:
+                self._in_flight -= 1
+                return
+            # the slot goes straight to the first waiter
+            waiter = self._waiters.popleft()
+            self._accepted += 1
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            waiter.get_loop().call_soon_threadsafe(_grant, waiter)
+
+    def stats(self) -> LimiterStats:
+        """
+        :return: Calls currently running, accepted and rejected so far, waiting now and that had to wait so far.
+        """
+        with self._lock:
+            return LimiterStats(self._in_flight, self._accepted, self._rejected, len(self._waiters), self._waited)
+
+    def call(self, f: Callable[..., Result[T, E]], *args, **kwargs) -> Result[T, Union[E, Rejected]]:
+        """
+        :param f: Function to call.
+        :return: The result of `f(*args, **kwargs)` or `Err(Rejected)` if the limiter is saturated.
+        """
+        acquired = self.acquire()
+        if acquired.is_err:
+            return acquired
+        try:
+            return f(*args, **kwargs)
+        finally:
+            self.release()
+
+    async def call_async(
+            self, f: Callable[..., Awaitable[Result[T, E]]], *args, **kwargs
+    ) -> Result[T, Union[E, Rejected]]:
+        """
+        :param f: Coroutine function to call.
+        :return: The result of `await f(*args, **kwargs)` or `Err(Rejected)` if the limiter is saturated.
+        """
+        acquired = await self.acquire_async()
+        if acquired.is_err:
+            return acquired
+        try:
+            return await f(*args, **kwargs)
+        finally:
+            self.release()
+
+    def __call__(self, f):
+        """
+        Decorator version, works for both functions and coroutine functions.
+        """
+        if asyncio.iscoroutinefunction(f):
+            @wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return await self.call_async(f, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            return self.call(f, *args, **kwargs)
+        return wrapper
+
+
+def _grant(waiter: "asyncio.Future[None]"):
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,154 @@
+"""
+msgpack encoding and decoding for `Option` and `Result`, requires the `msgpack` package.
+
+Each variant is packed as an ext type holding its packed payload (nothing for `Empty`).
+`bytes` payloads get their own ext codes and are stored as they are, without being packed again.
+`ErrorEnum` members are packed as their code.
+"""
+from typing import Any, Iterable, List
+
+import msgpack
+
+from rusty_results.error_enum import ErrorEnum
+from rusty_results.prelude import Some, Empty, Ok, Err
+
+
+EXT_SOME = 1
+EXT_EMPTY = 2
+EXT_OK = 3
+EXT_ERR = 4
+EXT_SOME_BYTES = 5
+EXT_OK_BYTES = 6
+EXT_ERR_BYTES = 7
+
+_EMPTY_EXT = msgpack.ExtType(EXT_EMPTY, b"")
+
+# builds an `ExtType` without going through its `__new__`, which checks the arguments in Python and costs more than
+# packing a small payload. The codes used here are always valid.
+_new_ext = tuple.__new__
+
+
+# idle packers. Building a packer costs more than packing a small payload, so they are reused. Payloads
+# holding variants are packed re-entrantly from `default`, each nesting level takes its own packer from here.
+_packers: List[msgpack.Packer] = []
+
+
+def _pack(value: Any) -> bytes:
+    try:
+        packer = _packers.pop()
+    except IndexError:
+        packer = msgpack.Packer(default=default, use_bin_type=True)
+    try:
+        return packer.pack(value)
+    finally:
+        _packers.append(packer)
+
+
+# prebuilt ext types for the payloads packed as a single byte (fixints), by variant code
+_FIXINT_MIN = -32
+_FIXINT_MAX = 127
+_FIXINT_EXTS = {
+    code: tuple(
+        msgpack.ExtType(code, msgpack.packb(value)) for value in range(_FIXINT_MIN, _FIXINT_MAX + 1)
+    )
+    for code in (EXT_SOME, EXT_OK, EXT_ERR)
+}
+
+
+def _payload(code: int, bytes_code: int, value: Any) -> msgpack.ExtType:
+    cls = type(value)
+    if cls is int and _FIXINT_MIN <= value <= _FIXINT_MAX:
+        return _FIXINT_EXTS[code][value - _FIXINT_MIN]
+    if cls is bytes:
+        return _new_ext(msgpack.ExtType, (bytes_code, value))
+    return _new_ext(msgpack.ExtType, (code, _pack(value)))
+
+
+def default(obj: Any) -> Any:
+    """
+    Packer hook, to be used as `default` for `msgpack.packb` or `msgpack.Packer`.
+
+    :param obj: Object the packer does not know how to handle.
+    :return: The ext type for obj.
+    :raises: `TypeError` if obj is not supported.
+    """
+    cls = type(obj)
+    if cls is Some:
+        return _payload(EXT_SOME, EXT_SOME_BYTES, obj.Some)
+    if cls is Empty:
+        return _EMPTY_EXT
+    if cls is Ok:
+        return _payload(EXT_OK, EXT_OK_BYTES, obj.Ok)
+    if cls is Err:
+        return _payload(EXT_ERR, EXT_ERR_BYTES, obj.Error)
+    if isinstance(obj, ErrorEnum):
+        return obj.value
+    raise TypeError(f"Object of type {cls.__name__} is not msgpack serializable")
+
+
+def _unpack_payload(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False)
+
+
+def ext_hook(code: int, data: bytes) -> Any:
+    """
+    Unpacker hook, to be used as `ext_hook` for `msgpack.unpackb` or `msgpack.Unpacker`.
+
+    :param code: Ext type code.
+    :param data: Ext type data.
+    :return: The variant for the prelude codes, an `ExtType` for any other code.
+    """
+    if code == EXT_SOME:
+        return Some(_unpack_payload(data))
+    if code == EXT_EMPTY:
+        return Empty()
+    if code == EXT_OK:
+        return Ok(_unpack_payload(data))
+    if code == EXT_ERR:
+        return Err(_unpack_payload(data))
+    if code == EXT_SOME_BYTES:
+        return Some(data)
+    if code == EXT_OK_BYTES:
+        return Ok(data)
+    if code == EXT_ERR_BYTES:
+        return Err(data)
+    return msgpack.ExtType(code, data)
+
+
+def packb(obj: Any) -> bytes:
+    """
+    :param obj: Object to pack.
+    :return: msgpack encoded obj.
+    """
+    return _pack(obj)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    :param data: msgpack encoded data.
+    :return: Unpacked object with the prelude variants rebuilt.
+    """
+    return _unpack_payload(data)
+
+
+def pack_many(values: Iterable[Any]) -> bytes:
+    """
+    Packs values one after the other through a single packer buffer.
+
+    :param values: Objects to pack.
+    :return: Concatenated msgpack encoded values, to be read with `unpack_many`.
+    """
+    packer = msgpack.Packer(default=default, use_bin_type=True, autoreset=False)
+    for value in values:
+        packer.pack(value)
+    return packer.bytes()
+
+
+def unpack_many(data: bytes) -> List[Any]:
+    """
+    :param data: Concatenated msgpack encoded values, as written by `pack_many`.
+    :return: The unpacked values.
+    """
+    unpacker = msgpack.Unpacker(ext_hook=ext_hook, raw=False, strict_map_key=False, max_buffer_size=len(data) or 1)
+    unpacker.feed(data)
+    return list(unpacker)
@@ -1,7 +1,12 @@
 from abc import abstractmethod
-from dataclasses import dataclass
+from contextvars import ContextVar
+from time import monotonic
 from typing import cast, TypeVar, Union, Callable, Generic, Iterator, Tuple, Dict, Any, Optional
 from rusty_results.exceptions import UnwrapException, EarlyReturnException
+from rusty_results.error_context import ContextError, _caller_frame
+from rusty_results._dataclasses import dataclass_info, frozen_setattr, frozen_delattr
+
+__all__ = ["OptionProtocol", "Some", "Empty", "Option", "option_from", "ResultProtocol", "Ok", "Err", "Result"]
 
 
 # base inner type generic
@@ -12,8 +17,71 @@ E = TypeVar('E')
 U = TypeVar('U')
 R = TypeVar('R')
 
+# absolute `time.monotonic` deadline after which `and_then` chains stop, managed through `rusty_results.deadline`
+_deadline: "ContextVar[Optional[float]]" = ContextVar("rusty_results_deadline", default=None)
+
+# pydantic config of the variants. Parametrized ones (`Some[int]`...) are validated by the dataclass schema pydantic
+# builds itself, this makes them forbid extra keys like `_dataclass_core_schema` does, see there
+_PYDANTIC_CONFIG: Dict[str, Any] = {"extra": "forbid"}
+
+
+class DeadlineExceeded:
+    """
+    Error value returned instead of running work once the current deadline passed.
+    """
+    deadline: float
+
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ("deadline",)
+    __dataclass_fields__, __dataclass_params__ = dataclass_info(("deadline", float, {}))
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __init__(self, deadline: float):
+        object.__setattr__(self, "deadline", deadline)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(deadline={self.deadline!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.deadline,) == (other.deadline,)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.deadline,))
+
+
+# parametrized aliases (`Ok[int, str]`...) by (class, parameters), so runtime subscriptions in pydantic models and
+# factories are a dict lookup instead of going through `typing` every time
+_generic_aliases: Dict[Tuple[type, Any], Any] = {}
+_GENERIC_ALIASES_MAX = 4096
+
+
+def _new_generic_alias(cls: type, base: type, params: Any) -> Any:
+    """
+    :param cls: Subscripted class.
+    :param base: Class defining the cached `__class_getitem__`.
+    :param params: Subscription parameters.
+    :return: The alias built by `Generic`, cached when params are hashable.
+    """
+    alias = super(base, cls).__class_getitem__(params)  # type: ignore[arg-type]
+    try:
+        if len(_generic_aliases) < _GENERIC_ALIASES_MAX:
+            _generic_aliases[cls, params] = alias
+    except TypeError:
+        # unhashable parameters, typing does not cache them either
+        pass
+    return alias
+
 
 class OptionProtocol(Generic[T]):
+    def __class_getitem__(cls, params: Any) -> Any:
+        try:
+            return _generic_aliases[cls, params]
+        except (KeyError, TypeError):
+            return _new_generic_alias(cls, OptionProtocol, params)
+
     @property
     @abstractmethod
     def is_some(self) -> bool:
@@ -39,9 +107,10 @@ class OptionProtocol(Generic[T]):
         ...  # pragma: no cover
 
     @abstractmethod
-    def expects(self, msg: str) -> T:
+    def expects(self, msg: str, *args: Any) -> T:
         """
         :param msg: Attached message for `UnwrapException` if raised.
+        :param args: Arguments for `msg.format`, only applied if the message is displayed
         :return: The contained `Some` value
         :raises: `UnwrapException` if option is Empty.
         """
@@ -200,9 +269,10 @@ class OptionProtocol(Generic[T]):
         ...  # pragma: no cover
 
     @abstractmethod
-    def expect_empty(self, msg: str):
+    def expect_empty(self, msg: str, *args: Any):
         """
         :param msg: Message to be wrapped by `UnwrapException` if raised
+        :param args: Arguments for `msg.format`, only applied if the message is displayed
         :raises: `UnwrapException` if option is `Some`
         """
         ...  # pragma: no cover
@@ -274,11 +344,38 @@ class OptionProtocol(Generic[T]):
         """
         return self.early_return()
 
+    @classmethod
+    def __get_validators__(cls):
+        """
+        pydantic v1 validators hook, accepts `Option` instances and their dict form (`{"Some": value}`,
+        `{"Empty": None}` or `{}`).
+        """
+        yield _validate_option
+
 
-@dataclass(eq=True, frozen=True)
 class Some(OptionProtocol[T]):
     Some: T
 
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ("Some",)
+    __dataclass_fields__, __dataclass_params__ = dataclass_info(("Some", T, {}))  # type: ignore[misc]
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __init__(self, Some: T):
+        object.__setattr__(self, "Some", Some)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(Some={self.Some!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.Some,) == (other.Some,)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.Some,))
+
     @property
     def is_some(self) -> bool:
         return True
@@ -290,7 +387,7 @@ class Some(OptionProtocol[T]):
     def contains(self, item: T) -> bool:
         return item == self.Some
 
-    def expects(self, msg: str) -> T:
+    def expects(self, msg: str, *args: Any) -> T:
         return self.Some
 
     def unwrap(self) -> T:
@@ -320,10 +417,10 @@ class Some(OptionProtocol[T]):
         return self if predicate(self.Some) else Empty()
 
     def ok_or(self, err: E) -> "Result[T, E]":
-        return Ok(self.Some)
+        return _ok(self.Some)
 
     def ok_or_else(self, err: Callable[[], E]) -> "Result[T, E]":
-        return Ok(self.Some)
+        return _ok(self.Some)
 
     def and_then(self, f: Callable[[T], "Option[T]"]) -> "Option[T]":
         return f(self.Some)
@@ -345,8 +442,8 @@ class Some(OptionProtocol[T]):
     def zip_with(self, other: "Option[U]", f: Callable[[Tuple[T, U]], R]) -> "Option[R]":
         return self.zip(other).map(f)
 
-    def expect_empty(self, msg: str):
-        raise UnwrapException(msg)
+    def expect_empty(self, msg: str, *args: Any):
+        raise UnwrapException(msg, *args, variant=self)
 
     def unwrap_empty(self):
         self.expect_empty("")
@@ -377,13 +474,45 @@ class Some(OptionProtocol[T]):
     def __bool__(self) -> bool:
         return True
 
+    def __reduce__(self):
+        # pickle just the constructor and payload instead of the dataclass state dict
+        return Some, (self.Some,)
+
     @classmethod
     def __get_validators__(cls):
         yield from OptionProtocol.__get_validators__()
 
+    __pydantic_config__ = _PYDANTIC_CONFIG
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return _dataclass_core_schema(cls, (("Some", _type_arg(source_type, 0)),), handler)
+
 
-@dataclass(eq=True, frozen=True)
 class Empty(OptionProtocol):
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ()
+    __dataclass_fields__, __dataclass_params__ = dataclass_info()
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}()"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return True
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(())
+
+    def __new__(cls):
+        # Empty holds no data, so every `Empty()` returns the same shared instance
+        if cls is Empty and _empty is not None:
+            return _empty
+        return super().__new__(cls)
+
     @property
     def is_some(self) -> bool:
         return False
@@ -395,11 +524,11 @@ class Empty(OptionProtocol):
     def contains(self, item: T) -> bool:
         return False
 
-    def expects(self, msg: str) -> T:
-        raise UnwrapException(msg)
+    def expects(self, msg: str, *args: Any) -> T:
+        raise UnwrapException(msg, *args, variant=self)
 
     def unwrap(self) -> T:
-        raise UnwrapException("Tried to unwrap on an Empty value")
+        raise UnwrapException("Tried to unwrap on an Empty value", variant=self)
 
     def unwrap_or(self, default: T) -> T:
         return default
@@ -443,7 +572,7 @@ class Empty(OptionProtocol):
     def zip_with(self, other: "Option[U]", f: Callable[[Tuple[T, U]], R]) -> "Option[R]":
         return Empty()
 
-    def expect_empty(self, msg: str):
+    def expect_empty(self, msg: str, *args: Any):
         ...
 
     def unwrap_empty(self):
@@ -464,10 +593,24 @@ class Empty(OptionProtocol):
     def __bool__(self) -> bool:
         return False
 
+    def __reduce__(self):
+        # pickle a reference to the shared instance
+        return "_empty"
+
     @classmethod
     def __get_validators__(cls):
         yield from OptionProtocol.__get_validators__()
 
+    __pydantic_config__ = _PYDANTIC_CONFIG
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return _empty_core_schema()
+
+
+# shared `Empty` instance, None while it is being built
+_empty: Optional[Empty] = None
+_empty = Empty()
 
 Option = Union[Some[T], Empty]
 
@@ -479,10 +622,16 @@ def option_from(value: Optional[T]) -> Option[T]:
     """
     if value is None:
         return Empty()
-    return Some(value).flatten_one()
+    return _some(value).flatten_one()
 
 
 class ResultProtocol(Generic[T, E]):
+    def __class_getitem__(cls, params: Any) -> Any:
+        try:
+            return _generic_aliases[cls, params]
+        except (KeyError, TypeError):
+            return _new_generic_alias(cls, ResultProtocol, params)
+
     @property
     @abstractmethod
     def is_ok(self) -> bool:
@@ -580,6 +729,25 @@ class ResultProtocol(Generic[T, E]):
         """
         ...  # pragma: no cover
 
+    @abstractmethod
+    def context(self, context: Any) -> "Result[T, ContextError[E]]":
+        """
+        Wraps the `Err` value in a `ContextError` layer, leaving an `Ok` value untouched.
+        The calling location is recorded if enabled with `rusty_results.error_context.capture_frames`.
+        :param context: Context for the error, usually a message
+        :return: `Err(ContextError(context, e))` if `Err(e)`, self if `Ok`
+        """
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def with_context(self, f: Callable[[], Any]) -> "Result[T, ContextError[E]]":
+        """
+        Lazy version of `context`, f is only called if the result is `Err`.
+        :param f: Function returning the context for the error
+        :return: `Err(ContextError(f(), e))` if `Err(e)`, self if `Ok`
+        """
+        ...  # pragma: no cover
+
     @abstractmethod
     def iter(self) -> Iterator[T]:
         """
@@ -591,10 +759,11 @@ class ResultProtocol(Generic[T, E]):
     def and_then(self, op: Callable[[T], "Result[T, E]"]) -> "Result[T, E]":
         """
         Calls op if the result is `Ok`, otherwise returns the `Err` value of self.
+        If the current deadline (see `rusty_results.deadline`) already passed op is skipped.
 
         This function can be used for control flow based on Result values.
         :param op: Callable to apply if result value if is `Ok`
-        :return: A result from applying op if `Ok`, original `Err` if not
+        :return: A result from applying op if `Ok`, original `Err` if not, `Err(DeadlineExceeded)` if the deadline passed
         """
         ...  # pragma: no cover
 
@@ -642,9 +811,10 @@ class ResultProtocol(Generic[T, E]):
         ...  # pragma: no cover
 
     @abstractmethod
-    def expect(self, msg: str) -> T:
+    def expect(self, msg: str, *args: Any) -> T:
         """
         :param msg: Attached message in case result is `Err` and `UnwrapException` is raised
+        :param args: Arguments for `msg.format`, only applied if the message is displayed
         :return: The contained `Ok` value
         :raises: `UnwrapException`
         """
@@ -659,9 +829,10 @@ class ResultProtocol(Generic[T, E]):
         ...  # pragma: no cover
 
     @abstractmethod
-    def expect_err(self, msg: str) -> E:
+    def expect_err(self, msg: str, *args: Any) -> E:
         """
         :param msg: Attached message in case result is `Ok` and `UnwrapException` is raised
+        :param args: Arguments for `msg.format`, only applied if the message is displayed
         :return: The contained `Err` value.
         :raises: `UnwrapException` if result is `Ok`.
         """
@@ -720,11 +891,34 @@ class ResultProtocol(Generic[T, E]):
     def __iter__(self) -> Iterator[T]:
         return self.iter()
 
+    @classmethod
+    def __get_validators__(cls):
+        """
+        pydantic v1 validators hook, accepts `Result` instances and their dict form (`{"Ok": value}` or `{"Error": e}`).
+        """
+        yield _validate_result
+
 
-@dataclass(eq=True, frozen=True)
 class Ok(ResultProtocol[T, E]):
     Ok: T
 
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ("Ok",)
+    __dataclass_fields__, __dataclass_params__ = dataclass_info(("Ok", T, {}))  # type: ignore[misc]
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __init__(self, Ok: T):
+        object.__setattr__(self, "Ok", Ok)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.Ok,) == (other.Ok,)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.Ok,))
+
     @property
     def is_ok(self) -> bool:
         return True
@@ -740,7 +934,7 @@ class Ok(ResultProtocol[T, E]):
         return False
 
     def ok(self) -> Option[T]:
-        return Some(self.Ok)
+        return _some(self.Ok)
 
     def err(self) -> Option[E]:
         return Empty()
@@ -759,12 +953,21 @@ class Ok(ResultProtocol[T, E]):
         # since we do not really have an error, generic type remains the same.
         return self  # type: ignore
 
+    def context(self, context: Any) -> "Result[T, ContextError[E]]":
+        return self  # type: ignore
+
+    def with_context(self, f: Callable[[], Any]) -> "Result[T, ContextError[E]]":
+        return self  # type: ignore
+
     def iter(self) -> Iterator[T]:
         def _iter():
             yield self.Ok
         return iter(_iter())
 
     def and_then(self, op: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
+        deadline = _deadline.get()
+        if deadline is not None and monotonic() >= deadline:
+            return Err(DeadlineExceeded(deadline))  # type: ignore[arg-type]
         return op(self.Ok)
 
     def or_else(self, op: Callable[[E], U]) -> "Result[T, U]":
@@ -781,14 +984,15 @@ class Ok(ResultProtocol[T, E]):
     def unwrap_or_else(self, default: Callable[[], T]) -> T:
         return self.Ok
 
-    def expect(self, msg: str) -> T:
+    def expect(self, msg: str, *args: Any) -> T:
         return self.Ok
 
     def unwrap_err(self) -> E:
-        raise UnwrapException(f"{self.Ok}")
+        # the value is only formatted if the exception is displayed
+        raise UnwrapException(self.Ok, variant=self)
 
-    def expect_err(self, msg: str) -> E:
-        raise UnwrapException(msg)
+    def expect_err(self, msg: str, *args: Any) -> E:
+        raise UnwrapException(msg, *args, variant=self)
 
     def flatten_one(self) -> "Result[T, E]":
         if isinstance(self.Ok, ResultProtocol):
@@ -817,15 +1021,40 @@ class Ok(ResultProtocol[T, E]):
     def __bool__(self):
         return True
 
+    def __reduce__(self):
+        return Ok, (self.Ok,)
+
     @classmethod
     def __get_validators__(cls):
         yield from ResultProtocol.__get_validators__()
 
+    __pydantic_config__ = _PYDANTIC_CONFIG
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return _dataclass_core_schema(cls, (("Ok", _type_arg(source_type, 0)),), handler)
+
 
-@dataclass(eq=True, frozen=True)
 class Err(ResultProtocol[T, E]):
     Error: E
 
+    # frozen dataclass methods, precomputed, see `rusty_results._dataclasses`
+    __match_args__ = ("Error",)
+    __dataclass_fields__, __dataclass_params__ = dataclass_info(("Error", E, {}))  # type: ignore[misc]
+    __setattr__ = frozen_setattr
+    __delattr__ = frozen_delattr
+
+    def __init__(self, Error: E):
+        object.__setattr__(self, "Error", Error)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return (self.Error,) == (other.Error,)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.Error,))
+
     @property
     def is_ok(self) -> bool:
         return False
@@ -844,7 +1073,7 @@ class Err(ResultProtocol[T, E]):
         return Empty()
 
     def err(self) -> Option:
-        return Some(self.Error)
+        return _some(self.Error)
 
     def map(self, f: Callable[[T], U]) -> "Result[U, E]":
         # Type ignored here. In this case U is the same type as T, but mypy cannot understand that match.
@@ -859,6 +1088,12 @@ class Err(ResultProtocol[T, E]):
     def map_err(self, f: Callable[[E], U]) -> "Result[T, U]":
         return Err(f(self.Error))
 
+    def context(self, context: Any) -> "Result[T, ContextError[E]]":
+        return Err(ContextError(context, self.Error, _caller_frame()))
+
+    def with_context(self, f: Callable[[], Any]) -> "Result[T, ContextError[E]]":
+        return Err(ContextError(f(), self.Error, _caller_frame()))
+
     def iter(self) -> Iterator[T]:
         return iter(tuple())
 
@@ -870,7 +1105,7 @@ class Err(ResultProtocol[T, E]):
         return Err(op(self.Error))
 
     def unwrap(self) -> T:
-        raise UnwrapException(self.Error)
+        raise UnwrapException(self.Error, variant=self)
 
     def unwrap_or(self, default: T) -> T:
         return default
@@ -878,13 +1113,13 @@ class Err(ResultProtocol[T, E]):
     def unwrap_or_else(self, default: Callable[[], T]) -> T:
         return default()
 
-    def expect(self, msg: str) -> T:
-        raise UnwrapException(msg)
+    def expect(self, msg: str, *args: Any) -> T:
+        raise UnwrapException(msg, *args, variant=self)
 
     def unwrap_err(self) -> E:
         return self.Error
 
-    def expect_err(self, msg: str) -> E:
+    def expect_err(self, msg: str, *args: Any) -> E:
         return self.Error
 
     def flatten_one(self) -> "Result[T, E]":
@@ -905,9 +1140,142 @@ class Err(ResultProtocol[T, E]):
     def __bool__(self):
         return False
 
+    def __reduce__(self):
+        return Err, (self.Error,)
+
     @classmethod
     def __get_validators__(cls):
         yield from ResultProtocol.__get_validators__()
 
+    __pydantic_config__ = _PYDANTIC_CONFIG
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        return _dataclass_core_schema(cls, (("Error", _type_arg(source_type, 1)),), handler)
+
 
 Result = Union[Ok[T, E], Err[T, E]]
+
+
+# shared instances for the most common payloads, small ints as in CPython's own small int cache
+_SMALL_INT_MIN = -5
+_SMALL_INT_MAX = 256
+# typed with `Any` payloads so they can be returned as `Some[T]`/`Ok[T, Any]` once the payload type was checked
+_SOME_SMALL_INTS: Tuple[Some[Any], ...] = tuple(Some(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1))
+_OK_SMALL_INTS: Tuple[Ok[Any, Any], ...] = tuple(Ok(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1))
+_SOME_NONE: Some[Any] = Some(None)
+_SOME_TRUE: Some[Any] = Some(True)
+_SOME_FALSE: Some[Any] = Some(False)
+_OK_NONE: Ok[Any, Any] = Ok(None)
+_OK_TRUE: Ok[Any, Any] = Ok(True)
+_OK_FALSE: Ok[Any, Any] = Ok(False)
+# opt-in bounded cache for other payloads, managed through `rusty_results.interning`
+_intern_cache: Any = None
+
+
+def _some(value: T) -> Some[T]:
+    """
+    :return: `Some(value)`, a shared instance when value is None, a bool, a small int or in the intern cache.
+    """
+    cls = type(value)
+    if cls is int and _SMALL_INT_MIN <= value <= _SMALL_INT_MAX:  # type: ignore[operator]
+        return _SOME_SMALL_INTS[value - _SMALL_INT_MIN]  # type: ignore[operator]
+    if cls is bool:
+        return _SOME_TRUE if value else _SOME_FALSE
+    if value is None:
+        return _SOME_NONE
+    cache = _intern_cache
+    if cache is not None:
+        return cache.get(Some, value)
+    return Some(value)
+
+
+def _ok(value: T) -> Ok[T, Any]:
+    """
+    :return: `Ok(value)`, a shared instance when value is None, a bool, a small int or in the intern cache.
+    """
+    cls = type(value)
+    if cls is int and _SMALL_INT_MIN <= value <= _SMALL_INT_MAX:  # type: ignore[operator]
+        return _OK_SMALL_INTS[value - _SMALL_INT_MIN]  # type: ignore[operator]
+    if cls is bool:
+        return _OK_TRUE if value else _OK_FALSE
+    if value is None:
+        return _OK_NONE
+    cache = _intern_cache
+    if cache is not None:
+        return cache.get(Ok, value)
+    return Ok(value)
+
+
+def _validate_option(value: Any) -> Option:
+    if isinstance(value, OptionProtocol):
+        return cast(Option, value)
+    if isinstance(value, dict):
+        if not value or value == _EMPTY_JSON:
+            return Empty()
+        if len(value) == 1 and "Some" in value:
+            return Some(value["Some"])
+    raise TypeError(f"{value!r} is not a valid Option")
+
+
+def _validate_result(value: Any) -> Result:
+    if isinstance(value, ResultProtocol):
+        return cast(Result, value)
+    if isinstance(value, dict) and len(value) == 1:
+        if "Ok" in value:
+            return Ok(value["Ok"])
+        if "Error" in value:
+            return Err(value["Error"])
+    raise TypeError(f"{value!r} is not a valid Result")
+
+
+def _type_arg(source_type: Any, index: int) -> Any:
+    args = getattr(source_type, "__args__", ())
+    return args[index] if len(args) > index else Any
+
+
+# JSON form of `Empty`, shared with `rusty_results.json_codec`
+_EMPTY_JSON: Dict[str, None] = {"Empty": None}
+
+
+def _empty_core_schema() -> Any:
+    """
+    pydantic v2 core schema of `Empty`, serialized as `{"Empty": null}` like `rusty_results.json_codec` does.
+    `{}`, the form written by earlier versions, is accepted as well. An explicit key keeps empty objects apart from
+    `Empty` outside of typed fields.
+    """
+    from pydantic_core import core_schema
+
+    dict_form = core_schema.no_info_after_validator_function(
+        lambda _: Empty(),
+        core_schema.typed_dict_schema(
+            {"Empty": core_schema.typed_dict_field(core_schema.none_schema(), required=False)},
+            extra_behavior="forbid",
+        ),
+    )
+    return core_schema.json_or_python_schema(
+        json_schema=dict_form,
+        python_schema=core_schema.union_schema([core_schema.is_instance_schema(Empty), dict_form]),
+        serialization=core_schema.plain_serializer_function_ser_schema(lambda _: dict(_EMPTY_JSON)),
+    )
+
+
+def _dataclass_core_schema(cls: type, fields: Tuple[Tuple[str, Any], ...], handler: Any) -> Any:
+    """
+    pydantic v2 core schema shared by `Some`, `Ok` and `Err`. Each one validates and serializes as a plain dataclass
+    inside pydantic-core (`{"Some": value}`, `{"Ok": value}`, `{"Error": e}`), with no Python validator involved.
+    pydantic already builds the same kind of schema for parametrized variants such as `Some[int]`.
+    Every variant forbids extra keys, so a dict matches exactly one variant of an `Option` or `Result` union.
+    """
+    from pydantic_core import core_schema
+
+    return core_schema.dataclass_schema(
+        cls,
+        core_schema.dataclass_args_schema(
+            cls.__name__,
+            [core_schema.dataclass_field(name, handler.generate_schema(field_type)) for name, field_type in fields],
+            extra_behavior="forbid",
+        ),
+        [name for name, _ in fields],
+        frozen=True,
+    )
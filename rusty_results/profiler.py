@@ -0,0 +1,212 @@
+"""
+Opt-in profiler for the step functions passed to the prelude combinators (`map`, `and_then`, `map_err`...).
+
+For every step it records the number of calls, the number of failures (the step raised or returned `Err`/`Empty`)
+and the cumulative wall time. Steps returning an awaitable (async steps, e.g. `result.map(fetch)`) are timed until
+the awaitable completes and their failures are taken from the awaited value. Steps are identified by their code
+(name, file and line), so a lambda written once in a chain is a single step however many times it is created.
+
+Like `rusty_results.instrumentation`, nothing is installed until `enable` is called: it wraps the combinators that
+call their step and `disable` restores them, so there is no cost while the profiler is off. While on, each profiled
+call costs a few microseconds (`benchmarks/profiling.py` measures it), negligible for steps doing I/O but noticeable
+for trivial ones, so the times of very cheap steps are inflated.
+"""
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import wraps
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from rusty_results._patching import Patches
+from rusty_results.prelude import Some, Empty, Ok, Err
+
+
+__all__ = ["Step", "StepStats", "enable", "disable", "is_enabled", "profiled", "report", "format_report", "reset"]
+
+# positions of the step functions in the combinators that call them, per variant
+_COMBINATORS: Tuple[Tuple[type, str, Tuple[int, ...]], ...] = (
+    (Some, "map", (0,)), (Some, "map_or", (1,)), (Some, "map_or_else", (1,)), (Some, "filter", (0,)),
+    (Some, "and_then", (0,)), (Some, "zip_with", (1,)),
+    (Empty, "map_or_else", (0,)), (Empty, "unwrap_or_else", (0,)), (Empty, "ok_or_else", (0,)),
+    (Empty, "or_else", (0,)),
+    (Ok, "map", (0,)), (Ok, "map_or", (1,)), (Ok, "map_or_else", (1,)), (Ok, "and_then", (0,)),
+    (Err, "map_or_else", (0,)), (Err, "map_err", (0,)), (Err, "or_else", (0,)), (Err, "unwrap_or_else", (0,)),
+)
+
+
+@dataclass(eq=True, frozen=True)
+class Step:
+    name: str
+    filename: str
+    lineno: int
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.filename}:{self.lineno})"
+
+
+@dataclass
+class StepStats:
+    calls: int = 0
+    failures: int = 0
+    # cumulative wall time in seconds
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+_lock = threading.Lock()
+_stats: Dict[Step, StepStats] = {}
+# steps by code object (or callable, for builtins), so they are only built once
+_steps: Dict[Any, Step] = {}
+_patches = Patches()
+
+
+def _step(f: Callable) -> Step:
+    code = getattr(f, "__code__", None)
+    key = f if code is None else code
+    step = _steps.get(key)
+    if step is None:
+        name = getattr(f, "__qualname__", None) or type(f).__qualname__
+        if code is None:
+            step = Step(name, "<unknown>", 0)
+        else:
+            step = Step(name, code.co_filename, code.co_firstlineno)
+        _steps[key] = step
+    return step
+
+
+def _record(step: Step, elapsed: float, failed: bool):
+    with _lock:
+        stats = _stats.get(step)
+        if stats is None:
+            stats = _stats[step] = StepStats()
+        stats.calls += 1
+        stats.failures += failed
+        stats.total += elapsed
+
+
+def _is_failure(value: Any) -> bool:
+    return isinstance(value, (Err, Empty))
+
+
+async def _timed_awaitable(awaitable: Awaitable, step: Step, start: float) -> Any:
+    try:
+        value = await awaitable
+    except BaseException:
+        _record(step, perf_counter() - start, True)
+        raise
+    _record(step, perf_counter() - start, _is_failure(value))
+    return value
+
+
+class _TimedStep:
+    __slots__ = ("f", "step")
+
+    def __init__(self, f: Callable):
+        self.f = f
+        self.step = _step(f)
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            value = self.f(*args, **kwargs)
+        except BaseException:
+            _record(self.step, perf_counter() - start, True)
+            raise
+        if hasattr(type(value), "__await__"):
+            return _timed_awaitable(value, self.step, start)
+        _record(self.step, perf_counter() - start, _is_failure(value))
+        return value
+
+
+def _timed(f: Any) -> Any:
+    if isinstance(f, _TimedStep) or not callable(f):
+        return f
+    return _TimedStep(f)
+
+
+def _wrap_combinator(original: Callable, positions: Tuple[int, ...]) -> Callable:
+    code = original.__code__
+    # parameter names after self, to find the steps passed by keyword
+    names = {code.co_varnames[position + 1] for position in positions}
+
+    @wraps(original)
+    def wrapper(self, *args, **kwargs):
+        if args:
+            args = list(args)  # type: ignore[assignment]
+            for position in positions:
+                if position < len(args):
+                    args[position] = _timed(args[position])  # type: ignore[index]
+        for name in names.intersection(kwargs):
+            kwargs[name] = _timed(kwargs[name])
+        return original(self, *args, **kwargs)
+    return wrapper
+
+
+def enable():
+    """
+    Installs the profiler, replacing any previous installation. Collected stats are kept, see `reset`.
+    """
+    disable()
+    for cls, name, positions in _COMBINATORS:
+        _patches.patch(cls, name, _wrap_combinator(cls.__dict__[name], positions))
+
+
+def disable():
+    """
+    Removes the profiler, restoring the prelude combinators. Collected stats are kept.
+    """
+    _patches.restore()
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+@contextmanager
+def profiled() -> Iterator[None]:
+    """
+    Profiles the combinator steps for the duration of the block.
+    E.g.:
+    ```
+    with profiled():
+        load(path).and_then(parse).map(enrich)
+    print(format_report())
+    ```
+    """
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def report() -> List[Tuple[Step, StepStats]]:
+    """
+    :return: (step, stats) pairs sorted by cumulative time, slowest first.
+    """
+    with _lock:
+        items = [(step, replace(stats)) for step, stats in _stats.items()]
+    return sorted(items, key=lambda item: item[1].total, reverse=True)
+
+
+def format_report(limit: Optional[int] = None) -> str:
+    """
+    :param limit: Maximum number of steps to include.
+    :return: `report` as a text table.
+    """
+    lines = [f"{'cumulative (s)':>14} {'calls':>9} {'failures':>9} {'mean (us)':>10}  step"]
+    for step, stats in report()[:limit]:
+        lines.append(
+            f"{stats.total:>14.6f} {stats.calls:>9} {stats.failures:>9} {stats.mean * 1e6:>10.2f}  {step}"
+        )
+    return "\n".join(lines)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _steps.clear()
@@ -0,0 +1,193 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Deque, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from rusty_results.prelude import Result, Ok, Err
+
+
+T = TypeVar('T')
+
+Source = Union[str, os.PathLike, BinaryIO]
+Parser = Callable[[bytes], Union[Result[T, Any], T]]
+
+
+@dataclass(eq=True, frozen=True)
+class ParseError:
+    """
+    Error value for a record that could not be parsed.
+    """
+    # 1 based line number
+    line_no: int
+    # byte offset of the line start
+    offset: int
+    raw: bytes
+    # `Err` value returned, or exception raised, by the parser
+    reason: Any = None
+
+
+def _parse(parser: Parser, line: bytes, line_no: int, offset: int) -> Result[T, ParseError]:
+    try:
+        parsed = parser(line)
+    except Exception as e:
+        return Err(ParseError(line_no, offset, line, e))
+    if isinstance(parsed, Err):
+        return Err(ParseError(line_no, offset, line, parsed.Error))
+    if isinstance(parsed, Ok):
+        return parsed
+    return Ok(parsed)
+
+
+def _strip(line: bytes) -> bytes:
+    return line[:-1] if line.endswith(b"\r") else line
+
+
+def _split_chunks(read: Callable[[int], bytes], chunk_size: int, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    :return: Iterator over (offset, line) pairs, lines without their line terminator.
+    """
+    rest = b""
+    offset = start
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            yield offset, _strip(line)
+            offset += len(line) + 1
+    if rest:
+        yield offset, _strip(rest)
+
+
+def _split_mmap(mm: mmap.mmap, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    offset = start
+    while offset < end:
+        newline = mm.find(b"\n", offset, end)
+        stop = end if newline == -1 else newline
+        yield offset, _strip(mm[offset:stop])
+        offset = stop + 1
+
+
+def read_records(
+        source: Source,
+        parser: Parser,
+        chunk_size: int = 1 << 20,
+        use_mmap: bool = False,
+        skip_blank: bool = True,
+) -> Iterator[Result[T, ParseError]]:
+    """
+    Lazily reads one record per line (JSON Lines, CSV without quoted newlines...) in constant memory.
+    Each line is passed, without its line terminator, to parser. Its result is wrapped in `Ok`, unless it returns
+    an `Err` or raises, which become `Err(ParseError)` so a bad line never stops the iteration.
+
+    :param source: File path or binary file object.
+    :param parser: Function parsing the raw bytes of a line, returning a value, `Ok` or `Err`.
+    :param chunk_size: Bytes read at a time.
+    :param use_mmap: Scan a memory mapped file instead of reading chunks, source must be a path.
+    :param skip_blank: Skip empty lines (they still count for line numbers).
+    :return: Iterator over the parsed records.
+    """
+    if use_mmap:
+        with open(source, "rb") as f:  # type: ignore[arg-type]
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from _parse_lines(_split_mmap(mm, 0, len(mm)), parser, skip_blank)
+        return
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _parse_lines(_split_chunks(f.read, chunk_size), parser, skip_blank)
+        return
+    yield from _parse_lines(_split_chunks(source.read, chunk_size), parser, skip_blank)
+
+
+def _parse_lines(
+        lines: Iterator[Tuple[int, bytes]], parser: Parser, skip_blank: bool, first_line: int = 1
+) -> Iterator[Result[T, ParseError]]:
+    for line_no, (offset, line) in enumerate(lines, first_line):
+        if skip_blank and not line.strip():
+            continue
+        yield _parse(parser, line, line_no, offset)
+
+
+def split_ranges(path: Union[str, os.PathLike], size: int) -> List[Tuple[int, int]]:
+    """
+    :param path: File to split.
+    :param size: Approximate bytes per range.
+    :return: (start, end) byte ranges covering the file, each one ending right after a line terminator.
+    """
+    total = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < total:
+            f.seek(min(start + size, total))
+            f.readline()
+            end = min(f.tell(), total)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _parse_range(
+        path: Union[str, os.PathLike], start: int, end: int, parser: Parser, skip_blank: bool
+) -> Tuple[int, List[Result[Any, ParseError]]]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = list(_split_mmap(mm, start, end))
+    return len(lines), list(_parse_lines(iter(lines), parser, skip_blank))
+
+
+def read_records_parallel(
+        path: Union[str, os.PathLike],
+        parser: Parser,
+        workers: Optional[int] = None,
+        range_size: int = 1 << 22,
+        skip_blank: bool = True,
+        executor: Optional[Executor] = None,
+) -> Iterator[Result[T, ParseError]]:
+    """
+    Multi process version of `read_records`. The file is split on line boundaries into ranges of about `range_size`
+    bytes, parsed by a process pool, and records are yielded in file order. Only a few ranges are in flight at once
+    so memory stays bounded. parser must be picklable (e.g. a module level function).
+
+    :param path: File path.
+    :param parser: Function parsing the raw bytes of a line, returning a value, `Ok` or `Err`.
+    :param workers: Number of processes, defaults to the number of CPUs.
+    :param range_size: Approximate bytes parsed per task.
+    :param skip_blank: Skip empty lines (they still count for line numbers).
+    :param executor: Executor to use instead of creating a process pool.
+    :return: Iterator over the parsed records.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    pending: Deque = deque()
+    try:
+        window = 2 * (workers or os.cpu_count() or 1)
+        ranges = iter(split_ranges(path, range_size))
+        for start, end in ranges:
+            pending.append(pool.submit(_parse_range, path, start, end, parser, skip_blank))
+            if len(pending) >= window:
+                break
+        lines_before = 0
+        while pending:
+            line_count, results = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(pool.submit(_parse_range, path, next_range[0], next_range[1], parser, skip_blank))
+            for result in results:
+                if lines_before and result.is_err:
+                    error: ParseError = result.unwrap_err()
+                    result = Err(ParseError(error.line_no + lines_before, error.offset, error.raw, error.reason))
+                yield result
+            lines_before += line_count
+    finally:
+        # the consumer may stop early, do not parse ranges nobody will read
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=False)
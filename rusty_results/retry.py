@@ -0,0 +1,177 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar, Union, cast
+
+from rusty_results.prelude import Result, Err
+from rusty_results.deadline import DeadlineExceeded, check, _limit
+
+
+T = TypeVar('T')
+E = TypeVar('E')
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the calls, shared by every call using the same budget.
+    Each call deposits `ratio` tokens and each retry withdraws one, so under sustained failure at most `ratio`
+    retries per call are made and retries cannot amplify the load on a failing dependency.
+    """
+    def __init__(self, ratio: float = 0.1, initial: float = 10.0, max_tokens: float = 100.0):
+        """
+        :param ratio: Retries allowed per call.
+        :param initial: Tokens available before any call was made.
+        :param max_tokens: Maximum tokens that can be accumulated.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(initial, max_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        :return: True if a retry is allowed.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+@dataclass(frozen=True)
+class RetryPolicy(Generic[E]):
+    """
+    :param max_attempts: Maximum number of calls, including the first one.
+    :param retry_on: Predicate over the `Err` value, only errors it accepts are retried.
+    :param base_delay: Seconds to wait before the first retry.
+    :param multiplier: Growth factor of the delay on each retry.
+    :param max_delay: Upper bound for the delay.
+    :param jitter: If True the actual delay is picked uniformly between 0 and the computed delay ("full jitter").
+    :param budget: Optional `RetryBudget` shared between calls.
+    """
+    max_attempts: int = 3
+    retry_on: Callable[[E], bool] = field(default=lambda _: True)
+    base_delay: float = 0.1
+    multiplier: float = 2.0
+    max_delay: float = 10.0
+    jitter: bool = True
+    budget: Optional[RetryBudget] = None
+
+    def delay(self, retry: int) -> float:
+        """
+        :param retry: Retry number, starting at 0.
+        :return: Seconds to wait before that retry.
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+@dataclass(eq=True, frozen=True)
+class RetryOutcome(Generic[T, E]):
+    """
+    Final `Result` of a retried call along with the number of calls made.
+    """
+    result: Result[T, E]
+    attempts: int
+
+
+def _should_retry(policy: RetryPolicy, result: Result, attempts: int) -> bool:
+    return (
+        result.is_err
+        and attempts < policy.max_attempts
+        and policy.retry_on(result.unwrap_err())
+        and (policy.budget is None or policy.budget.try_withdraw())
+    )
+
+
+def _deadline_before(delay: float) -> Optional[DeadlineExceeded]:
+    """
+    :return: `DeadlineExceeded` if the current deadline passes before delay elapses, None otherwise.
+    """
+    _, deadline = _limit(delay)
+    if deadline is not None:
+        return DeadlineExceeded(deadline)
+    return None
+
+
+def retry(
+        f: Callable[..., Result[T, E]],
+        policy: RetryPolicy = RetryPolicy(),
+        *args,
+        sleep: Callable[[float], Any] = time.sleep,
+        **kwargs,
+) -> RetryOutcome[T, Union[E, DeadlineExceeded]]:
+    """
+    Calls f until it returns `Ok`, the policy rejects the error or runs out of attempts or budget.
+    Exceptions raised by f are not retried. If the current deadline would pass before the next attempt,
+    `Err(DeadlineExceeded)` is returned instead of waiting for it.
+
+    :param f: Function returning a `Result`.
+    :param policy: Retry policy.
+    :param args: Positional arguments for f.
+    :param sleep: Function used to wait between attempts.
+    :param kwargs: Keyword arguments for f.
+    :return: The last `Result` and the number of calls made.
+    """
+    expired = check()
+    if expired.is_err:
+        return RetryOutcome(Err(expired.unwrap_err()), 0)
+    if policy.budget is not None:
+        policy.budget.deposit()
+    attempts = 1
+    result = f(*args, **kwargs)
+    while _should_retry(policy, result, attempts):
+        delay = policy.delay(attempts - 1)
+        exceeded = _deadline_before(delay)
+        if exceeded is not None:
+            return RetryOutcome(Err(exceeded), attempts)
+        sleep(delay)
+        attempts += 1
+        result = f(*args, **kwargs)
+    return RetryOutcome(cast(Result[T, Union[E, DeadlineExceeded]], result), attempts)
+
+
+async def retry_async(
+        f: Callable[..., Awaitable[Result[T, E]]],
+        policy: RetryPolicy = RetryPolicy(),
+        *args,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        **kwargs,
+) -> RetryOutcome[T, Union[E, DeadlineExceeded]]:
+    """
+    Async version of `retry` for coroutine functions.
+
+    :param f: Coroutine function returning a `Result`.
+    :param policy: Retry policy.
+    :param args: Positional arguments for f.
+    :param sleep: Coroutine function used to wait between attempts.
+    :param kwargs: Keyword arguments for f.
+    :return: The last `Result` and the number of calls made.
+    """
+    expired = check()
+    if expired.is_err:
+        return RetryOutcome(Err(expired.unwrap_err()), 0)
+    if policy.budget is not None:
+        policy.budget.deposit()
+    attempts = 1
+    result = await f(*args, **kwargs)
+    while _should_retry(policy, result, attempts):
+        delay = policy.delay(attempts - 1)
+        exceeded = _deadline_before(delay)
+        if exceeded is not None:
+            return RetryOutcome(Err(exceeded), attempts)
+        await sleep(delay)
+        attempts += 1
+        result = await f(*args, **kwargs)
+    return RetryOutcome(cast(Result[T, Union[E, DeadlineExceeded]], result), attempts)
@@ -0,0 +1,129 @@
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from rusty_results.prelude import Some, Empty, OptionProtocol
+
+
+Column = Union[str, int]
+Params = Union[Sequence[Any], Mapping[str, Any]]
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, OptionProtocol):
+        return value.unwrap_or(None)
+    return value
+
+
+def bind(params: Params) -> Params:
+    """
+    :param params: Query parameters, as a sequence or a mapping.
+    :return: The same parameters with `Some(value)` replaced by value and `Empty` by `None` (NULL).
+    """
+    if isinstance(params, Mapping):
+        return {key: _unwrap(value) for key, value in params.items()}
+    return tuple(_unwrap(value) for value in params)
+
+
+def register_adapters():
+    """
+    Registers global sqlite3 adapters so `Some` and `Empty` can be passed as parameters directly.
+    """
+    sqlite3.register_adapter(Some, lambda some: some.Some)
+    sqlite3.register_adapter(Empty, lambda _: None)
+
+
+def convert_rows(rows: List[Tuple], indices: Sequence[int]) -> List[Tuple]:
+    """
+    Converts a batch of rows column by column, so there is no Python call per cell.
+
+    :param rows: Rows as returned by `fetchmany`.
+    :param indices: Positions of the nullable columns.
+    :return: Rows with the nullable columns wrapped in `Some`, or the shared `Empty` for NULL.
+    """
+    if not rows or not indices:
+        return rows
+    empty = Empty()
+    columns = list(zip(*rows))
+    for index in indices:
+        columns[index] = tuple([empty if value is None else Some(value) for value in columns[index]])
+    return list(zip(*columns))
+
+
+class OptionCursor:
+    """
+    `sqlite3.Cursor` wrapper that declares the nullable columns once and returns them as `Option`.
+    Parameters are bound through `bind`, so `Some` and `Empty` can be used directly.
+    E.g.:
+    ```
+    cursor = OptionCursor(connection.cursor(), nullable=("phone",))
+    for name, phone in cursor.execute("SELECT name, phone FROM users"):
+        ...
+    ```
+    """
+    def __init__(self, cursor: sqlite3.Cursor, nullable: Iterable[Column]):
+        """
+        :param cursor: Cursor to wrap.
+        :param nullable: Names or positions of the columns to return as `Option`.
+        """
+        self.cursor = cursor
+        self.nullable = tuple(nullable)
+        self._indices: List[int] = []
+
+    def _resolve(self):
+        description = self.cursor.description
+        if description is None:
+            # statement without a result set (e.g. INSERT)
+            self._indices = []
+            return
+        names: Dict[str, int] = {column[0]: index for index, column in enumerate(description)}
+        indices = []
+        for column in self.nullable:
+            if isinstance(column, int):
+                indices.append(column)
+            elif column in names:
+                indices.append(names[column])
+            else:
+                raise KeyError(f"Column {column!r} is not in the query result")
+        self._indices = indices
+
+    def execute(self, sql: str, params: Params = ()) -> "OptionCursor":
+        self.cursor.execute(sql, bind(params))
+        self._resolve()
+        return self
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Params]) -> "OptionCursor":
+        self.cursor.executemany(sql, (bind(params) for params in seq_of_params))
+        self._resolve()
+        return self
+
+    def fetchone(self) -> Optional[Tuple]:
+        row = self.cursor.fetchone()
+        if row is None:
+            return None
+        return convert_rows([row], self._indices)[0]
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Tuple]:
+        rows = self.cursor.fetchmany(self.cursor.arraysize if size is None else size)
+        return convert_rows(rows, self._indices)
+
+    def fetchall(self) -> List[Tuple]:
+        return convert_rows(self.cursor.fetchall(), self._indices)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        size = max(self.cursor.arraysize, 256)
+        while True:
+            rows = self.fetchmany(size)
+            if not rows:
+                return
+            yield from rows
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self.cursor.rowcount
+
+    def close(self):
+        self.cursor.close()
@@ -0,0 +1,139 @@
+import asyncio
+from typing import List
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.batching import batch_and_then, BatchLoader
+
+
+def test_batch_and_then_result():
+    calls = []
+
+    def bulk(keys: List[int]) -> List[Result[int, str]]:
+        calls.append(keys)
+        return [Ok(k * 10) if k > 0 else Err("negative") for k in keys]
+
+    values = [Ok(1), Err("boom"), Ok(2), Ok(1), Ok(-1)]
+    assert batch_and_then(values, bulk) == [Ok(10), Err("boom"), Ok(20), Ok(10), Err("negative")]
+    assert calls == [[1, 2, -1]]
+
+
+def test_batch_and_then_option():
+    values = [Some("a"), Empty(), Some("b")]
+    assert batch_and_then(values, lambda keys: [Some(k.upper()) for k in keys]) == [Some("A"), Empty(), Some("B")]
+
+
+def test_batch_and_then_no_dedupe():
+    calls = []
+
+    def bulk(keys):
+        calls.append(keys)
+        return [Some(k) for k in keys]
+
+    batch_and_then([Some(1), Some(1)], bulk, dedupe=False)
+    assert calls == [[1, 1]]
+
+
+def test_batch_and_then_nothing_to_batch():
+    def bulk(keys):
+        raise AssertionError("should not be called")  # pragma: no cover
+
+    assert batch_and_then([Err(0), Empty()], bulk) == [Err(0), Empty()]
+
+
+def test_batch_and_then_wrong_length():
+    with pytest.raises(ValueError):
+        batch_and_then([Ok(1), Ok(2)], lambda keys: [Ok(1)])
+
+
+def test_batch_loader_coalesces():
+    calls = []
+
+    async def bulk(keys):
+        calls.append(keys)
+        return [Ok(k + 1) for k in keys]
+
+    async def run():
+        loader = BatchLoader(bulk)
+        results = await asyncio.gather(
+            loader.and_then(Ok(1)),
+            loader.and_then(Err("e")),
+            loader.and_then(Ok(2)),
+            loader.and_then(Ok(1)),
+        )
+        second = await loader.load(3)
+        return results, second
+
+    results, second = asyncio.run(run())
+    assert results == [Ok(2), Err("e"), Ok(3), Ok(2)]
+    assert second == Ok(4)
+    assert calls == [[1, 2], [3]]
+
+
+def test_batch_loader_max_batch_size():
+    calls = []
+
+    async def bulk(keys):
+        calls.append(keys)
+        return [Some(k) for k in keys]
+
+    async def run():
+        return await BatchLoader(bulk, max_batch_size=2).load_many([1, 2, 3])
+
+    assert asyncio.run(run()) == [Some(1), Some(2), Some(3)]
+    assert calls == [[1, 2], [3]]
+
+
+def test_batch_loader_bulk_failure():
+    async def bulk(keys):
+        raise RuntimeError("down")
+
+    async def run():
+        await BatchLoader(bulk).load(1)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_batch_loader_bulk_cancelled():
+    started = []
+
+    async def bulk(keys):
+        started.append(keys)
+        await asyncio.sleep(10)
+
+    async def run():
+        loader = BatchLoader(bulk)
+        futures = [loader.load(1), loader.load(2)]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert started == [[1, 2]]
+        for task in list(loader._tasks):
+            task.cancel()
+        await asyncio.wait(futures, timeout=1)
+        return futures
+
+    futures = asyncio.run(run())
+    assert all(future.cancelled() for future in futures)
+
+
+def test_batch_loader_bulk_base_exception():
+    class Interrupted(BaseException):
+        pass
+
+    async def bulk(keys):
+        raise Interrupted()
+
+    async def run():
+        loader = BatchLoader(bulk)
+        future = loader.load(1)
+        await asyncio.sleep(0)
+        tasks = list(loader._tasks)
+        assert len(tasks) == 1
+        await asyncio.wait(tasks + [future], timeout=1)
+        # the bulk call re-raises it
+        assert isinstance(tasks[0].exception(), Interrupted)
+        return future
+
+    future = asyncio.run(run())
+    assert isinstance(future.exception(), Interrupted)
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.cache import memoize, CacheStats
+
+
+def test_memoize_caches_ok():
+    calls = []
+
+    @memoize()
+    def parse(value: str) -> Result[int, str]:
+        calls.append(value)
+        return Ok(int(value))
+
+    assert parse("1") == Ok(1)
+    assert parse("1") == Ok(1)
+    assert parse(value="1") == Ok(1)
+    assert calls == ["1", "1"]
+    assert parse.cache_stats() == CacheStats(hits=1, misses=2, evictions=0, size=2)
+
+
+def test_memoize_ttl_policies(clock):
+    calls = []
+
+    @memoize(ttl=10, err_ttl=1, clock=clock)
+    def lookup(key: int) -> Option[int]:
+        calls.append(key)
+        return Some(key) if key > 0 else Empty()
+
+    lookup(1)
+    lookup(0)
+    clock.now = 2
+    lookup(1)
+    lookup(0)
+    assert calls == [1, 0, 0]
+    clock.now = 11
+    lookup(1)
+    assert calls == [1, 0, 0, 1]
+
+
+def test_memoize_do_not_cache_errors():
+    calls = []
+
+    @memoize(cache_errors=False)
+    def fail(key: int) -> Result[int, str]:
+        calls.append(key)
+        return Err("nope")
+
+    fail(1)
+    fail(1)
+    assert calls == [1, 1]
+    assert fail.cache_stats().size == 0
+
+
+def test_memoize_lru_eviction():
+    @memoize(maxsize=2)
+    def identity(key: int) -> Result[int, str]:
+        return Ok(key)
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)
+    stats = identity.cache_stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+    identity(1)
+    assert identity.cache_stats().hits == 2
+    identity.cache_clear()
+    assert identity.cache_stats() == CacheStats(0, 0, 0, 0)
+
+
+def test_memoize_stampede_protection():
+    calls = []
+    release = threading.Event()
+
+    @memoize()
+    def slow(key: int) -> Result[int, str]:
+        calls.append(key)
+        release.wait()
+        return Ok(key)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(1))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+    assert results == [Ok(1)] * 8
+
+
+def test_memoize_exception_not_cached():
+    calls = []
+
+    @memoize()
+    def broken(key: int) -> Result[int, str]:
+        calls.append(key)
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            broken(1)
+    assert calls == [1, 1]
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.circuit_breaker import CircuitBreaker, CircuitOpen, CircuitState
+
+
+def test_circuit_stays_closed_under_threshold():
+    breaker = CircuitBreaker(failure_ratio=0.75, window=4, min_calls=4)
+    for result in (Ok(0), Err(1), Ok(2), Ok(3), Err(4)):
+        assert breaker.call(lambda: result) == result
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_opens_and_rejects():
+    calls = []
+
+    @CircuitBreaker(name="db", failure_ratio=0.5, window=4, min_calls=2)
+    def query(value: int) -> Result[int, str]:
+        calls.append(value)
+        return Err("down")
+
+    assert query(1) == Err("down")
+    assert query(2) == Err("down")
+    rejected = query(3)
+    assert rejected == Err(CircuitOpen("db"))
+    assert rejected is query(4)
+    assert calls == [1, 2]
+
+
+def test_circuit_half_open_probes(clock):
+    breaker = CircuitBreaker(failure_ratio=0.5, window=2, min_calls=1, reset_timeout=10, probes=2, clock=clock)
+    breaker.call(lambda: Err("down"))
+    assert breaker.state is CircuitState.OPEN
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.call(lambda: Ok(1)) == Ok(1)
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.call(lambda: Ok(2)) == Ok(2)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_ratio=0.5, window=2, min_calls=1, reset_timeout=10, clock=clock)
+    breaker.call(lambda: Err("down"))
+    clock.now = 10
+    assert breaker.call(lambda: Err("still down")) == Err("still down")
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.call(lambda: Ok(1)) == Err(CircuitOpen("circuit"))
+
+
+def test_circuit_exceptions_count_as_failures():
+    breaker = CircuitBreaker(window=2, min_calls=1)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        breaker.call(fail)
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_circuit_async():
+    breaker = CircuitBreaker(window=2, min_calls=1)
+
+    @breaker
+    async def fetch(value: int) -> Result[int, str]:
+        return Err("down") if value < 0 else Ok(value)
+
+    async def run():
+        return [await fetch(1), await fetch(-1), await fetch(2)]
+
+    assert asyncio.run(run()) == [Ok(1), Err("down"), Err(CircuitOpen("circuit"))]
+
+
+def _start_blocked_call(breaker: CircuitBreaker, outcome):
+    """
+    :return: Event releasing a call admitted now, and the thread running it.
+    """
+    admitted = threading.Event()
+    release = threading.Event()
+
+    def blocked():
+        admitted.set()
+        release.wait()
+        return outcome()
+
+    def run():
+        try:
+            breaker.call(blocked)
+        except BaseException:
+            pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert admitted.wait(1)
+    return release, thread
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def test_circuit_ignores_calls_from_older_states(clock):
+    breaker = CircuitBreaker(failure_ratio=0.5, window=2, min_calls=1, reset_timeout=10, probes=1, clock=clock)
+    stale_ok, stale_ok_thread = _start_blocked_call(breaker, lambda: Ok("stale"))
+    stale_err, stale_err_thread = _start_blocked_call(breaker, lambda: Err("stale"))
+
+    def interrupt():
+        raise Interrupted()
+
+    stale_interrupt, stale_interrupt_thread = _start_blocked_call(breaker, interrupt)
+    breaker.call(lambda: Err("down"))
+    assert breaker.state is CircuitState.OPEN
+    clock.now = 10
+    probe, probe_thread = _start_blocked_call(breaker, lambda: Ok("probe"))
+    for release, thread in ((stale_ok, stale_ok_thread), (stale_err, stale_err_thread),
+                            (stale_interrupt, stale_interrupt_thread)):
+        release.set()
+        thread.join()
+    # the calls admitted while closed change nothing, the probe slot is still taken
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.call(lambda: Ok(1)) == Err(CircuitOpen("circuit"))
+    probe.set()
+    probe_thread.join()
+    assert breaker.state is CircuitState.CLOSED
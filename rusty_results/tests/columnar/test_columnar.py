@@ -0,0 +1,72 @@
+import io
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.columnar import write_columnar, ColumnarFile, TAG_EMPTY, TAG_SOME, TAG_OK, TAG_ERR
+
+
+VALUES = [
+    Some(1),
+    Empty(),
+    Ok(-2.5),
+    Err("invalid"),
+    Ok(True),
+    Some(None),
+    Err(b"\x00raw"),
+    Ok({"nested": Some([1, 2])}),
+    Some(1 << 70),
+    Err(ValueError.__name__),
+]
+
+
+def test_columnar_roundtrip(tmp_path):
+    path = tmp_path / "batch.col"
+    assert write_columnar(path, VALUES) == len(VALUES)
+    with ColumnarFile(path) as columns:
+        assert len(columns) == len(VALUES)
+        assert list(columns) == VALUES
+        assert columns[3] == Err("invalid")
+        assert columns[-1] == VALUES[-1]
+        assert type(columns[4].unwrap()) is bool
+
+
+def test_columnar_scans(tmp_path):
+    path = tmp_path / "batch.col"
+    write_columnar(path, VALUES)
+    with ColumnarFile(path) as columns:
+        assert columns.count_err() == 3
+        assert columns.count(TAG_OK) == 3
+        assert columns.count(TAG_SOME) == 3
+        assert columns.count(TAG_EMPTY) == 1
+        assert list(columns.indices(TAG_ERR)) == [3, 6, 9]
+        assert columns.tag(1) == TAG_EMPTY
+
+
+def test_columnar_file_object(tmp_path):
+    buffer = io.BytesIO()
+    write_columnar(buffer, (Ok(i) for i in range(100)))
+    path = tmp_path / "batch.col"
+    path.write_bytes(buffer.getvalue())
+    with ColumnarFile(path) as columns:
+        assert columns[99] == Ok(99)
+
+
+def test_columnar_empty_batch(tmp_path):
+    path = tmp_path / "batch.col"
+    write_columnar(path, [])
+    with ColumnarFile(path) as columns:
+        assert len(columns) == 0
+        assert list(columns) == []
+
+
+def test_columnar_errors(tmp_path):
+    path = tmp_path / "batch.col"
+    with pytest.raises(TypeError):
+        write_columnar(path, [1])
+    write_columnar(path, [Ok(1)])
+    with ColumnarFile(path) as columns:
+        with pytest.raises(IndexError):
+            columns[1]
+    path.write_bytes(b"not a columnar file at all, really")
+    with pytest.raises(ValueError):
+        ColumnarFile(path)
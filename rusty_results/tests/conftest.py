@@ -0,0 +1,17 @@
+import pytest
+
+
+class FakeClock:
+    """
+    Monotonic time source for the `clock` parameters, only moves when `now` is set.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
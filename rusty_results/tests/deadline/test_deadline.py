@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+from rusty_results.prelude import *
+from rusty_results.deadline import deadline, deadline_at, current_deadline, remaining, check, DeadlineExceeded
+from rusty_results.hedging import hedged, hedged_async
+from rusty_results.retry import retry, RetryOutcome, RetryPolicy
+from rusty_results.timeout import with_timeout, with_timeout_async
+
+
+def test_no_deadline():
+    assert current_deadline() == Empty()
+    assert remaining() == Empty()
+    assert check() == Ok(None)
+    assert Ok(1).and_then(lambda x: Ok(x + 1)) == Ok(2)
+
+
+def test_deadline_skips_and_then():
+    calls = []
+
+    def step(x: int) -> Result[int, str]:
+        calls.append(x)
+        return Ok(x + 1)
+
+    with deadline_at(time.monotonic() - 1) as when:
+        assert check() == Err(DeadlineExceeded(when))
+        assert remaining() == Some(0.0)
+        assert Ok(1).and_then(step).and_then(step) == Err(DeadlineExceeded(when))
+    assert calls == []
+    assert current_deadline() == Empty()
+
+
+def test_deadline_nesting_only_shortens():
+    with deadline(10) as outer:
+        with deadline(100) as inner:
+            assert inner == outer
+        with deadline(1) as inner:
+            assert inner < outer
+            assert current_deadline() == Some(inner)
+        assert current_deadline() == Some(outer)
+        assert 9 < remaining().unwrap() <= 10
+
+
+def test_deadline_propagates_to_tasks():
+    async def step() -> Result[int, str]:
+        return check().map(lambda _: 1)
+
+    async def run():
+        with deadline_at(time.monotonic() - 1):
+            return await asyncio.ensure_future(step())
+
+    assert asyncio.run(run()).is_err
+
+
+def test_deadline_with_timeout():
+    with deadline(0.01) as when:
+        assert with_timeout(time.sleep, 1, 0.5) == Err(DeadlineExceeded(when))
+    with deadline(1) as when:
+        # the deadline is visible from the worker thread
+        assert with_timeout(current_deadline, 1) == Ok(Some(when))
+    with deadline_at(time.monotonic() - 1) as when:
+        assert with_timeout(lambda: 1, 1) == Err(DeadlineExceeded(when))
+
+    async def run():
+        with deadline(0.01) as when:
+            return await with_timeout_async(asyncio.sleep(1), 1), when
+
+    result, when = asyncio.run(run())
+    assert result == Err(DeadlineExceeded(when))
+
+    ran = []
+
+    async def body():
+        ran.append(1)  # pragma: no cover
+
+    async def run_expired():
+        with deadline_at(time.monotonic() - 1) as when:
+            return await with_timeout_async(body(), 1), when
+
+    result, when = asyncio.run(run_expired())
+    assert result == Err(DeadlineExceeded(when))
+    assert ran == []
+
+
+def test_deadline_retry():
+    calls = []
+
+    def fail() -> Result[int, str]:
+        calls.append(1)
+        return Err("down")
+
+    policy = RetryPolicy(max_attempts=5, base_delay=10, jitter=False)
+    with deadline(1) as when:
+        assert retry(fail, policy) == RetryOutcome(Err(DeadlineExceeded(when)), 1)
+    with deadline_at(time.monotonic() - 1) as when:
+        assert retry(fail, policy) == RetryOutcome(Err(DeadlineExceeded(when)), 0)
+    assert calls == [1]
+
+
+def test_deadline_hedged():
+    def slow() -> Result[int, str]:
+        time.sleep(0.5)
+        return Ok(1)
+
+    with deadline(0.02) as when:
+        assert hedged(slow, slow, delay=0.01) == Err(DeadlineExceeded(when))
+
+    async def async_slow() -> Result[int, str]:
+        await asyncio.sleep(0.5)
+        return Ok(1)
+
+    async def run():
+        with deadline(0.02) as when:
+            return await hedged_async(async_slow, async_slow, delay=0.01), when
+
+    result, when = asyncio.run(run())
+    assert result == Err(DeadlineExceeded(when))
+
+
+def test_deadline_hedged_does_not_start_fallback():
+    calls = []
+
+    def slow() -> Result[str, str]:
+        time.sleep(0.5)
+        return Ok("p")
+
+    def fallback() -> Result[str, str]:
+        calls.append("fallback")  # pragma: no cover
+        return Ok("f")  # pragma: no cover
+
+    with deadline(0.05) as when:
+        assert hedged(slow, fallback, delay=1.0) == Err(DeadlineExceeded(when))
+
+    async def async_slow() -> Result[str, str]:
+        await asyncio.sleep(0.5)
+        return Ok("p")
+
+    async def async_fallback() -> Result[str, str]:
+        calls.append("async_fallback")  # pragma: no cover
+        return Ok("f")  # pragma: no cover
+
+    async def run():
+        with deadline(0.05) as when:
+            return await hedged_async(async_slow, async_fallback, delay=1.0), when
+
+    result, when = asyncio.run(run())
+    assert result == Err(DeadlineExceeded(when))
+    assert calls == []
@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from rusty_results.prelude import *
+from rusty_results.disk_cache import DiskCache, disk_memoize, stable_key
+
+
+def test_stable_key():
+    assert stable_key("f", (1, "a"), {"b": 2, "c": 3}) == stable_key("f", (1, "a"), {"c": 3, "b": 2})
+    assert stable_key("f", (1,), {}) != stable_key("g", (1,), {})
+    assert stable_key("f", ({"a": 1, "b": {2, 3}},), {}) == stable_key("f", ({"b": {3, 2}, "a": 1},), {})
+    keys = {stable_key("f", (value,), {}) for value in (1, True, 1.0, "1", (1,), [1], {1}, frozenset({1}), Some(1))}
+    assert len(keys) == 9
+    assert stable_key("f", (("a", "b"),), {}) != stable_key("f", (("ab",),), {})
+    with pytest.raises(TypeError):
+        stable_key("f", (object(),), {})
+
+
+def test_stable_key_across_hash_seeds():
+    code = (
+        "from rusty_results.disk_cache import stable_key\n"
+        "print(stable_key('f', (frozenset({'a', 'b', 'c', (1, 'x')}), {'q', 2.5}), {'k': {'z', 'y'}}))\n"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code], env=dict(os.environ, PYTHONHASHSEED=seed),
+            capture_output=True, text=True, check=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(keys) == 1
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", persist_errors=True)
+    values = [Ok(1), Err("e"), Some([1, 2]), Empty()]
+    for i, value in enumerate(values):
+        cache.set(str(i), value)
+    assert [cache.get(str(i)) for i in range(len(values))] == [Some(value) for value in values]
+    assert cache.get("missing") == Empty()
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_cache_error_policy(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db")
+    cache.set("err", Err("e"))
+    cache.set("empty", Empty())
+    cache.set("ok", Ok(0))
+    assert len(cache) == 1
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("a", Ok(1))
+    cache.set("b", Ok(2))
+    cache.get("a")
+    cache.set("c", Ok(3))
+    assert len(cache) == 2
+    assert cache.get("b") == Empty()
+    assert cache.get("a") == Some(Ok(1))
+
+
+def test_disk_cache_hits_do_not_write(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", max_entries=2, access_batch=2, access_interval=60)
+    cache.set("a", Ok(1))
+    cache.set("b", Ok(2))
+    connection = cache._connection()
+    changes = connection.total_changes
+    assert cache.get("a") == Some(Ok(1))
+    assert cache.get("a") == Some(Ok(1))
+    assert connection.total_changes == changes
+    # a second pending key triggers the write
+    assert cache.get("b") == Some(Ok(2))
+    assert connection.total_changes == changes + 2
+    cache.get("a")
+    # pending access times are written before evicting
+    cache.set("c", Ok(3))
+    assert cache.get("b") == Empty()
+    assert cache.get("a") == Some(Ok(1))
+
+
+def test_disk_memoize(tmp_path):
+    calls = []
+
+    @disk_memoize(tmp_path / "cache.db")
+    def parse(value: str) -> Result[int, str]:
+        calls.append(value)
+        return Ok(int(value)) if value.isdigit() else Err(value)
+
+    assert parse("1") == Ok(1)
+    assert parse("1") == Ok(1)
+    assert parse("x") == Err("x")
+    assert parse("x") == Err("x")
+    assert calls == ["1", "x", "x"]
+
+
+def _store(args):
+    path, start = args
+    cache = DiskCache(path, persist_errors=True)
+    for i in range(start, start + 50):
+        cache.set(str(i), Ok(i))
+    return True
+
+
+def test_disk_cache_multiprocess(tmp_path):
+    path = str(tmp_path / "cache.db")
+    DiskCache(path)
+    with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("spawn")) as pool:
+        assert all(pool.map(_store, [(path, start) for start in range(0, 200, 50)]))
+    cache = DiskCache(path)
+    assert len(cache) == 200
+    assert cache.get("199") == Some(Ok(199))
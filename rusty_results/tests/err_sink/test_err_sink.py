@@ -0,0 +1,75 @@
+import asyncio
+import logging
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.err_sink import ErrSink, template
+
+
+@pytest.fixture
+def sink(caplog):
+    caplog.set_level(logging.WARNING, logger="test_err_sink")
+    sink = ErrSink(logging.getLogger("test_err_sink"), interval=60)
+    yield sink
+    sink.close()
+
+
+def test_template():
+    assert template("user 42 not found in 'eu-1' (0xdeadbeef)") == "user <*> not found in <*> (<*>)"
+
+
+def test_record_passes_values_through(sink):
+    assert sink.record(Ok(1)) == Ok(1)
+    assert sink.record(Err("e")) == Err("e")
+    assert sink.record(Empty()) == Empty()
+    assert sink.record(Err(None)) == Err(None)
+    assert sink.flush(1)
+    assert sink.counts() == {("str", "e"): 1, ("NoneType", "None"): 1}
+
+
+def test_deduplicates_and_summarizes(sink, caplog):
+    for user in range(5):
+        sink.record(Err(KeyError(f"user {user}")))
+    sink.record(Err(ValueError("invalid")))
+    assert sink.flush(1)
+    assert sink.counts() == {("KeyError", "<*>"): 5, ("ValueError", "invalid"): 1}
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "KeyError: 'user 0'"
+    assert messages[1] == "ValueError: invalid"
+    assert messages[2] == "KeyError: <*> repeated 4 times in the last 60.0s, e.g. 'user 0'"
+    assert caplog.records[2].err_count == 4
+    assert len(messages) == 3
+    caplog.clear()
+    assert sink.flush(1)
+    assert caplog.records == []
+
+
+def test_decorator(sink):
+    @sink
+    def parse(value: str) -> Result[int, str]:
+        return Ok(int(value)) if value.isdigit() else Err(f"invalid {value!r}")
+
+    @sink
+    async def parse_async(value: str) -> Result[int, str]:
+        return parse(value)
+
+    assert parse("1") == Ok(1)
+    assert parse("x") == Err("invalid 'x'")
+    assert asyncio.run(parse_async("y")) == Err("invalid 'y'")
+    assert sink.flush(1)
+    # the async wrapper records the error returned by the inner call as well
+    assert sink.counts() == {("str", "invalid <*>"): 3}
+
+
+def test_max_templates(caplog):
+    sink = ErrSink(logging.getLogger("test_err_sink"), max_templates=1)
+    sink.record(Err("first"))
+    sink.record(Err("second"))
+    sink.record(Err("third"))
+    sink.close()
+    assert sink.counts() == {("str", "first"): 1, ("<other>", "<too many distinct errors>"): 2}
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        ErrSink(sample_rate=2)
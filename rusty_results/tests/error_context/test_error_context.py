@@ -0,0 +1,51 @@
+import pytest
+from rusty_results.prelude import *
+from rusty_results.exceptions import early_return
+from rusty_results.error_context import ContextError, capture_frames
+
+
+@pytest.fixture
+def frames():
+    capture_frames()
+    yield
+    capture_frames(False)
+
+
+def read(path: str) -> Result[str, OSError]:
+    return Err(FileNotFoundError(path))
+
+
+@early_return
+def load(path: str) -> Result[str, ContextError]:
+    content = ~read(path).with_context(lambda: f"reading {path}")
+    return Ok(content)  # pragma: no cover
+
+
+def test_chain_and_str():
+    error = load("app.toml").context("loading config").unwrap_err()
+    assert list(error.chain())[:2] == ["loading config", "reading app.toml"]
+    assert isinstance(error.root, FileNotFoundError)
+    assert str(error) == "loading config: reading app.toml: app.toml"
+
+
+def test_no_frames_by_default():
+    error = Err(1).context("a").unwrap_err()
+    assert error.frame is None
+    assert "File" not in error.render()
+
+
+def test_frames_are_captured_lazily(frames):
+    error = load("app.toml").context("loading config").unwrap_err()
+    code, lineno = error.frame
+    assert code is test_frames_are_captured_lazily.__code__
+    assert error.source.frame[0] is load.__wrapped__.__code__
+    rendered = error.render()
+    assert rendered.splitlines()[0] == "Error: loading config"
+    assert 'in test_frames_are_captured_lazily' in rendered
+    assert '~read(path).with_context(lambda: f"reading {path}")' in rendered
+    assert rendered.splitlines()[-1] == "    1: FileNotFoundError('app.toml')"
+
+
+def test_frames_do_not_affect_equality(frames):
+    assert Err(1).context("a") == Err(ContextError("a", 1))
+
@@ -0,0 +1,59 @@
+import json
+import pickle
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.error_enum import ErrorEnum
+from rusty_results import json_codec
+
+
+class ValidationError(ErrorEnum):
+    EMPTY = 1
+    TOO_LONG = 2
+
+
+def validate(name: str) -> Result[str, ValidationError]:
+    if not name:
+        return ValidationError.EMPTY.err
+    if len(name) > 8:
+        return ValidationError.TOO_LONG.err
+    return Ok(name)
+
+
+def test_prebuilt_err():
+    assert validate("") is validate("")
+    assert validate("") == Err(ValidationError.EMPTY)
+    assert validate("a" * 9).Error is ValidationError.TOO_LONG
+    assert validate("name") == Ok("name")
+
+
+def test_matches():
+    assert ValidationError.EMPTY.matches(validate(""))
+    assert ValidationError.EMPTY.matches(Err(ValidationError.EMPTY))
+    assert not ValidationError.EMPTY.matches(validate("a" * 9))
+    assert not ValidationError.EMPTY.matches(Ok(ValidationError.EMPTY))
+
+
+def test_codes():
+    assert ValidationError.TOO_LONG.code == 2
+    assert ValidationError.from_code(2) is ValidationError.TOO_LONG
+    with pytest.raises(ValueError):
+        ValidationError.from_code(3)
+
+
+def test_pickle_keeps_identity():
+    assert pickle.loads(pickle.dumps(validate(""))).Error is ValidationError.EMPTY
+
+
+def test_codecs_write_codes():
+    assert json.loads(json_codec.dumps(validate(""))) == {"Error": 1}
+    assert json.dumps(json_codec.to_jsonable([validate("")])) == '[{"Error": 1}]'
+    assert json.dumps(validate(""), default=json_codec.default) == '{"Error": 1}'
+    assert json_codec.loads(json_codec.dumps(validate(""))).map_err(ValidationError.from_code) == validate("")
+
+
+def test_msgpack_codec_writes_codes():
+    pytest.importorskip("msgpack")
+    from rusty_results import msgpack_codec
+
+    assert msgpack_codec.unpackb(msgpack_codec.packb(validate(""))) == Err(1)
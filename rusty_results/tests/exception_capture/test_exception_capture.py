@@ -0,0 +1,88 @@
+import gc
+import weakref
+
+from rusty_results.prelude import *
+from rusty_results.exception_capture import strip_traceback, stack_summary, capture, catch, format_captured
+
+
+class Payload:
+    pass
+
+
+def fail(payload: Payload):
+    raise ValueError("invalid record")
+
+
+def fail_chained():
+    try:
+        fail(Payload())
+    except ValueError as e:
+        raise KeyError("record") from e
+
+
+def test_strip_releases_frames():
+    payload = Payload()
+    reference = weakref.ref(payload)
+    try:
+        fail(payload)
+    except ValueError as e:
+        err = capture(e)
+    del payload
+    gc.collect()
+    assert reference() is None
+    assert err.unwrap_err().__traceback__ is None
+    assert stack_summary(err.unwrap_err()) is None
+
+
+def test_summarize():
+    try:
+        fail(Payload())
+    except ValueError as e:
+        exception = strip_traceback(e, summarize=True)
+    summary = stack_summary(exception)
+    assert [frame.name for frame in summary] == ["test_summarize", "fail"]
+    assert summary[-1].line == 'raise ValueError("invalid record")'
+
+
+def test_summarize_limit():
+    try:
+        fail(Payload())
+    except ValueError as e:
+        exception = strip_traceback(e, summarize=True, limit=1)
+    assert [frame.name for frame in stack_summary(exception)] == ["fail"]
+
+
+def test_strip_chain():
+    try:
+        fail_chained()
+    except KeyError as e:
+        exception = strip_traceback(e, summarize=True)
+    assert exception.__traceback__ is None
+    assert exception.__cause__.__traceback__ is None
+    assert stack_summary(exception.__cause__)[-1].name == "fail"
+
+
+def test_format_captured():
+    try:
+        fail_chained()
+    except KeyError as e:
+        exception = strip_traceback(e, summarize=True)
+    formatted = format_captured(exception)
+    assert formatted.startswith("Traceback (most recent call last):\n")
+    assert "ValueError: invalid record\n" in formatted
+    assert "The above exception was the direct cause of the following exception:" in formatted
+    assert formatted.endswith("KeyError: 'record'\n")
+    assert 'raise ValueError("invalid record")' in formatted
+    assert format_captured(strip_traceback(ValueError("bare"))) == "ValueError: bare\n"
+
+
+def test_catch():
+    @catch(ValueError, summarize=True)
+    def parse(value: str) -> int:
+        return int(value)
+
+    assert parse("1") == Ok(1)
+    error = parse("x").unwrap_err()
+    assert isinstance(error, ValueError)
+    assert error.__traceback__ is None
+    assert stack_summary(error)[-1].name == "parse"
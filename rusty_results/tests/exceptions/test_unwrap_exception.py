@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.exceptions import UnwrapException
+
+
+class Expensive:
+    formatted = 0
+
+    def __str__(self) -> str:
+        Expensive.formatted += 1
+        return "expensive"
+
+
+def test_message_is_formatted_lazily():
+    Expensive.formatted = 0
+    ok = Ok(Expensive())
+    with pytest.raises(UnwrapException) as e:
+        ok.unwrap_err()
+    assert Expensive.formatted == 0
+    assert e.value.variant is ok
+    assert str(e.value) == "expensive"
+    assert Expensive.formatted == 1
+
+
+def test_err_unwrap_carries_variant():
+    err = Err(None)
+    with pytest.raises(UnwrapException) as e:
+        err.unwrap()
+    assert e.value.variant is err
+    assert str(e.value) == "None"
+
+
+@pytest.mark.parametrize("call", [
+    lambda: Err(1).expect("record {} failed: {}", 7, "boom"),
+    lambda: Ok(1).expect_err("record {} failed: {}", 7, "boom"),
+    lambda: Empty().expects("record {} failed: {}", 7, "boom"),
+    lambda: Some(1).expect_empty("record {} failed: {}", 7, "boom"),
+])
+def test_expect_format_arguments(call):
+    with pytest.raises(UnwrapException) as e:
+        call()
+    assert e.value.message == "record {} failed: {}"
+    assert e.value.format_args == (7, "boom")
+    assert str(e.value) == "record 7 failed: boom"
+
+
+def test_message_without_arguments_is_not_formatted():
+    with pytest.raises(UnwrapException) as e:
+        Err(1).expect("{not a field}")
+    assert str(e.value) == "{not a field}"
+
+
+def test_default_message():
+    assert str(UnwrapException()) == ""
+    assert UnwrapException().args == ()
+
+
+def test_pickle():
+    exception = UnwrapException("value {}", 1, variant=Err(2))
+    unpickled = pickle.loads(pickle.dumps(exception))
+    assert str(unpickled) == "value 1"
+    assert unpickled.variant == Err(2)
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+
+from rusty_results.prelude import *
+from rusty_results.hedging import hedged, hedged_async, HedgeErrors
+
+
+def _sleepy(seconds: float, result: Result):
+    def f():
+        time.sleep(seconds)
+        return result
+    return f
+
+
+def _raising(seconds: float):
+    def f():
+        time.sleep(seconds)
+        raise RuntimeError("down")
+    return f
+
+
+def _async_raising(seconds: float):
+    async def f():
+        await asyncio.sleep(seconds)
+        raise RuntimeError("down")
+    return f
+
+
+def _async_sleepy(seconds: float, result: Result, cancelled=None):
+    async def f():
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(result)
+            raise
+        return result
+    return f
+
+
+def test_hedged_primary_fast():
+    calls = []
+
+    def fallback():
+        calls.append(1)  # pragma: no cover
+        return Ok("fallback")  # pragma: no cover
+
+    assert hedged(lambda: Ok("primary"), fallback, delay=1) == Ok("primary")
+    assert calls == []
+
+
+def test_hedged_primary_slow():
+    start = time.monotonic()
+    assert hedged(_sleepy(1, Ok("primary")), _sleepy(0, Ok("fallback")), delay=0.01) == Ok("fallback")
+    assert time.monotonic() - start < 0.5
+
+
+def test_hedged_primary_fails_fast():
+    assert hedged(lambda: Err("primary"), lambda: Ok("fallback"), delay=1) == Ok("fallback")
+
+
+def test_hedged_slow_ok_wins_over_fast_err():
+    assert hedged(_sleepy(0.05, Ok("primary")), _sleepy(0, Err("fallback")), delay=0.01) == Ok("primary")
+
+
+def test_hedged_both_fail():
+    expected = Err(HedgeErrors("primary", "fallback"))
+    assert hedged(lambda: Err("primary"), lambda: Err("fallback"), delay=1) == expected
+    assert hedged(_sleepy(0.05, Err("primary")), _sleepy(0, Err("fallback")), delay=0.01) == expected
+
+
+def test_hedged_primary_raises():
+    # before the delay, the fallback is started right away
+    assert hedged(_raising(0), _sleepy(0.05, Ok("fallback")), delay=1) == Ok("fallback")
+    # after the delay, the running fallback is waited for
+    assert hedged(_raising(0.05), _sleepy(0.1, Ok("fallback")), delay=0.01) == Ok("fallback")
+    # an exception is only raised once no call returned Ok
+    with pytest.raises(RuntimeError):
+        hedged(_raising(0), lambda: Err("fallback"), delay=1)
+    with pytest.raises(RuntimeError):
+        hedged(_raising(0.05), _sleepy(0, Err("fallback")), delay=0.01)
+
+
+def test_hedged_fallback_raises():
+    assert hedged(_sleepy(0.05, Ok("primary")), _raising(0), delay=0.01) == Ok("primary")
+    with pytest.raises(RuntimeError):
+        hedged(_sleepy(0.05, Err("primary")), _raising(0), delay=0.01)
+
+
+def test_hedged_async():
+    cancelled = []
+
+    async def run():
+        slow_primary = await hedged_async(
+            _async_sleepy(1, Ok("primary"), cancelled), _async_sleepy(0, Ok("fallback")), delay=0.01
+        )
+        fast_primary = await hedged_async(_async_sleepy(0, Ok("primary")), _async_sleepy(0, Ok("fallback")), delay=1)
+        failed_primary = await hedged_async(_async_sleepy(0, Err("primary")), _async_sleepy(0, Ok("fallback")), 1)
+        both_failed = await hedged_async(_async_sleepy(0.05, Err("primary")), _async_sleepy(0, Err("fallback")), 0.01)
+        await asyncio.sleep(0)
+        return slow_primary, fast_primary, failed_primary, both_failed
+
+    assert asyncio.run(run()) == (
+        Ok("fallback"), Ok("primary"), Ok("fallback"), Err(HedgeErrors("primary", "fallback"))
+    )
+    assert cancelled == [Ok("primary")]
+
+
+def test_hedged_async_raises():
+    async def run():
+        fast_raise = await hedged_async(_async_raising(0), _async_sleepy(0.05, Ok("fallback")), delay=1)
+        slow_raise = await hedged_async(_async_raising(0.05), _async_sleepy(0.1, Ok("fallback")), delay=0.01)
+        fallback_raise = await hedged_async(_async_sleepy(0.05, Ok("primary")), _async_raising(0), delay=0.01)
+        return fast_raise, slow_raise, fallback_raise
+
+    assert asyncio.run(run()) == (Ok("fallback"), Ok("fallback"), Ok("primary"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedged_async(_async_raising(0), _async_sleepy(0, Err("fallback")), delay=1))
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedged_async(_async_sleepy(0.05, Err("primary")), _async_raising(0), delay=0.01))
@@ -0,0 +1,74 @@
+import dataclasses
+import pickle
+import subprocess
+import sys
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.error_context import ContextError
+
+
+def test_import_does_not_load_optional_modules():
+    code = (
+        "import sys, rusty_results\n"
+        "assert 'dataclasses' not in sys.modules\n"
+        "assert 'rusty_results.retry' not in sys.modules\n"
+        "assert rusty_results.retry.__name__ == 'rusty_results.retry'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute():
+    import rusty_results
+
+    with pytest.raises(AttributeError):
+        rusty_results.unknown
+
+
+@pytest.mark.parametrize("value", [Some(1), Empty(), Ok(1), Err("e"), ContextError("ctx", "e")])
+def test_dataclass_api(value):
+    assert dataclasses.is_dataclass(value)
+    assert dataclasses.replace(value) == value
+    assert pickle.loads(pickle.dumps(value)) == value
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        value.other = 1
+    fields = dataclasses.fields(value)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del value.__dict__
+    assert type(value).__match_args__ == tuple(field.name for field in fields)
+
+
+def test_dataclass_fields():
+    assert [field.name for field in dataclasses.fields(Some)] == ["Some"]
+    assert dataclasses.fields(Empty) == ()
+    assert dataclasses.asdict(Err(1)) == {"Error": 1}
+    frame = dataclasses.fields(ContextError)[2]
+    assert (frame.name, frame.default, frame.compare, frame.repr) == ("frame", None, False, False)
+
+
+def test_eq_hash_repr():
+    assert Some(1) == Some(1) and hash(Some(1)) == hash(Some(1))
+    assert Some(1) != Ok(1)
+    assert Some(1) != 1
+    assert Empty() == Empty()
+    assert repr(Some(1)) == "Some(Some=1)"
+    assert repr(Empty()) == "Empty()"
+    assert ContextError("ctx", "e", (None, 1)) == ContextError("ctx", "e")
+    assert repr(ContextError("ctx", "e")) == "ContextError(context='ctx', source='e')"
+
+
+def test_generic_alias_cached():
+    assert Ok[int, str] is Ok[int, str]
+    assert Some[int] is Some[int]
+    assert Ok[int, str] is not Err[int, str]
+    assert Ok[int, str](1) == Ok(1)
+    assert Some[int].__origin__ is Some
+
+
+def test_generic_alias_unhashable_params():
+    class Unhashable(type):
+        __hash__ = None
+
+    param = Unhashable("Param", (), {})
+    assert Some[param].__args__ == (param,)
+    assert Some[param] is not Some[param]
@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.exceptions import UnwrapException, early_return
+from rusty_results import instrumentation
+from rusty_results.instrumentation import CREATE, UNWRAP, EARLY_RETURN, instrumented, counters
+
+
+BACKENDS = ["patch"] + (["monitoring"] if hasattr(sys, "monitoring") else [])
+
+
+@pytest.fixture(autouse=True)
+def clean_counters():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def _by_event(event: str):
+    counts = {}
+    for (counted_event, variant, site), count in counters().items():
+        if counted_event == event:
+            counts[variant, site.function] = counts.get((variant, site.function), 0) + count
+    return counts
+
+
+def test_disabled_leaves_prelude_untouched():
+    init, new, unwrap = Err.__init__, Empty.__dict__["__new__"], Empty.unwrap
+    with instrumented(backend="patch"):
+        assert Err.__init__ is not init
+        assert instrumentation.is_enabled()
+    assert Err.__init__ is init
+    assert Empty.__dict__["__new__"] is new
+    assert Empty.unwrap is unwrap
+    assert not instrumentation.is_enabled()
+    Err(1)
+    assert counters() == {}
+
+
+def test_count_creations_per_site():
+    def make():
+        return Err("e"), Empty(), Some(1).filter(lambda _: False), Ok(1)
+
+    with instrumented():
+        make()
+        make()
+    assert Empty() is Empty()
+    assert _by_event(CREATE) == {("Err", "make"): 2, ("Empty", "make"): 4}
+    site = next(iter(counters()))[2]
+    assert site.filename == __file__
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_count_unwrap_failures(backend):
+    def fail():
+        for call in (Empty().unwrap, Err(1).unwrap, Some(1).unwrap_empty):
+            with pytest.raises(UnwrapException):
+                call()
+        with pytest.raises(UnwrapException):
+            Err(1).expect("boom")
+        Some(1).unwrap()
+
+    with instrumented(backend=backend):
+        fail()
+    assert _by_event(UNWRAP) == {("Empty", "fail"): 1, ("Err", "fail"): 2, ("Some", "fail"): 1}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_count_early_returns(backend):
+    @early_return
+    def short_circuit(value):
+        ~value
+
+    with instrumented(backend=backend):
+        short_circuit(Err(1))
+        short_circuit(Ok(1))
+        short_circuit(Empty())
+    assert _by_event(EARLY_RETURN) == {("Err", "short_circuit"): 1, ("Empty", "short_circuit"): 1}
+
+
+def test_sampling():
+    draws = iter([0.1, 0.9, 0.2, 0.8])
+    instrumentation.enable(sample_rate=0.5, backend="patch", rng=lambda: next(draws))
+    for _ in range(4):
+        Err(None)
+    instrumentation.disable()
+    assert sum(counters().values()) == 2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        instrumentation.enable(sample_rate=0)
+    with pytest.raises(ValueError):
+        instrumentation.enable(backend="dtrace")
+    assert not instrumentation.is_enabled()
@@ -0,0 +1,55 @@
+import pytest
+from rusty_results.prelude import *
+from rusty_results import interning
+from rusty_results.interning import InternStats, some, ok
+
+
+@pytest.fixture
+def cache():
+    cache = interning.enable_cache(maxsize=2)
+    yield cache
+    interning.disable_cache()
+
+
+def test_fixed_table():
+    assert option_from(True) is option_from(True)
+    assert Ok(0).ok() is Err(0).err() is some(0)
+    assert Some(None).ok_or("e") is ok(None)
+    assert some(256) is some(256)
+    assert some(257) is not some(257)
+    assert some(257) == Some(257)
+
+
+def test_bool_and_int_are_kept_apart():
+    assert some(True) == Some(True)
+    assert type(some(True).Some) is bool
+    assert type(some(1).Some) is int
+    assert type(ok(False).Ok) is bool
+    assert type(ok(0).Ok) is int
+
+
+def test_option_from_keeps_flattening():
+    assert option_from(Some(1)) == Some(1)
+    assert option_from(None) == Empty()
+
+
+def test_cache_disabled_by_default():
+    assert interning.cache_stats() is None
+    assert some("a") is not some("a")
+
+
+def test_cache(cache):
+    assert some("a") is some("a")
+    assert ok("a") is ok("a")
+    assert ok("a") is not some("a")
+    assert some("b") is some("b")
+    assert interning.cache_stats() == InternStats(hits=5, misses=3, evictions=1, size=2)
+
+
+def test_cache_types(cache):
+    assert some(0.0) is not some(0.0)
+    assert some(-0.0).Some.hex() == "-0x0.0p+0"
+    assert some((1,)) is not some((1,))
+    assert some("x" * 100) is not some("x" * 100)
+    assert some(1 << 40) is some(1 << 40)
+    assert cache.stats().size == 1
@@ -0,0 +1,84 @@
+import io
+import json
+from dataclasses import dataclass
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.json_codec import (
+    default, object_hook, to_jsonable, from_jsonable, dumps, loads, write_jsonl, read_jsonl
+)
+
+
+@dataclass
+class Point:
+    x: int
+    y: Option[int]
+
+
+VALUES = [
+    Some(1),
+    Empty(),
+    Ok("value"),
+    Err({"code": 3}),
+    Some(Ok([Empty(), Some(None)])),
+    {"nested": Err(Some(1.5)), "plain": {}},
+    [1, "two", None],
+]
+
+
+def test_json_stdlib_roundtrip():
+    data = json.dumps(VALUES, default=default)
+    assert json.loads(data, object_hook=object_hook) == VALUES
+
+
+def test_json_format():
+    assert json.loads(json.dumps([Some(1), Empty(), Ok(2), Err(3)], default=default)) == [
+        {"Some": 1}, {"Empty": None}, {"Ok": 2}, {"Error": 3}
+    ]
+
+
+def test_json_plain_dicts_untouched():
+    assert object_hook({"Empty": 1}) == {"Empty": 1}
+    assert object_hook({"Other": 1}) == {"Other": 1}
+    assert object_hook({"Some": 1, "Ok": 2}) == {"Some": 1, "Ok": 2}
+
+
+def test_json_unsupported():
+    with pytest.raises(TypeError):
+        default(object())
+
+
+def test_json_jsonable_roundtrip():
+    assert from_jsonable(json.loads(json.dumps(to_jsonable(VALUES)))) == VALUES
+    assert to_jsonable((Some(1),)) == [{"Some": 1}]
+
+
+def test_json_dumps_loads():
+    assert loads(dumps(VALUES)) == VALUES
+    assert loads(dumps(Point(1, Some(2)))) == {"x": 1, "y": Some(2)}
+
+
+def test_json_orjson_hook():
+    orjson = pytest.importorskip("orjson")
+    data = orjson.dumps(VALUES, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    assert from_jsonable(orjson.loads(data)) == VALUES
+
+
+def test_jsonl_roundtrip():
+    records = [{"id": i, "value": Ok(i) if i % 2 else Err(f"bad {i}")} for i in range(100)]
+    buffer = io.BytesIO()
+    assert write_jsonl(buffer, records, chunk_size=7) == 100
+    assert buffer.getvalue().count(b"\n") == 100
+    buffer.seek(0)
+    assert list(read_jsonl(buffer, chunk_size=13)) == records
+
+
+def test_jsonl_last_line_without_newline():
+    buffer = io.BytesIO(b'{"Some": 1}\n\n{"Empty": null}')
+    assert list(read_jsonl(buffer)) == [Some(1), Empty()]
+
+
+def test_json_dumps_loads_without_orjson(monkeypatch):
+    from rusty_results import json_codec
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert loads(dumps(VALUES)) == VALUES
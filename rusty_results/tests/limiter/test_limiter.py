@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.limiter import Limiter, LimiterStats, Rejected
+
+
+def test_limiter_max_in_flight():
+    limiter = Limiter(name="db", max_in_flight=1)
+    inner = []
+
+    def outer() -> Result[int, str]:
+        inner.append(limiter.call(lambda: Ok(2)))
+        return Ok(1)
+
+    assert limiter.call(outer) == Ok(1)
+    assert inner == [Err(Rejected("db", "max_in_flight"))]
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=1, rejected=1)
+
+
+def test_limiter_token_bucket(clock):
+    limiter = Limiter(rate=2, burst=2, clock=clock)
+    results = [limiter.call(lambda: Ok(i)) for i in range(3)]
+    assert results[:2] == [Ok(0), Ok(1)]
+    assert results[2] == Err(Rejected("limiter", "rate"))
+    clock.now = 0.5
+    assert limiter.call(lambda: Ok(3)) == Ok(3)
+    assert limiter.call(lambda: Ok(4)).is_err
+
+
+def test_limiter_releases_on_exception():
+    limiter = Limiter(max_in_flight=1)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        limiter.call(fail)
+    assert limiter.stats().in_flight == 0
+
+
+def test_limiter_invalid_rate():
+    with pytest.raises(ValueError):
+        Limiter(rate=0)
+
+
+def test_limiter_async():
+    limiter = Limiter(max_in_flight=2)
+
+    @limiter
+    async def fetch(value: int) -> Result[int, str]:
+        await asyncio.sleep(0.01)
+        return Ok(value)
+
+    async def run():
+        return await asyncio.gather(*(fetch(i) for i in range(3)))
+
+    assert asyncio.run(run()) == [Ok(0), Ok(1), Err(Rejected("limiter", "max_in_flight"))]
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=2, rejected=1)
+
+
+def test_limiter_decorator_sync():
+    @Limiter(max_in_flight=1)
+    def double(value: int) -> Result[int, str]:
+        return Ok(value * 2)
+
+    assert double(2) == Ok(4)
+
+
+def test_limiter_queue():
+    limiter = Limiter(name="db", max_in_flight=1, max_queue=1)
+    running = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def slow() -> Result[str, str]:
+        running.set()
+        release.wait()
+        return Ok("slow")
+
+    first = threading.Thread(target=lambda: results.append(limiter.call(slow)), daemon=True)
+    first.start()
+    assert running.wait(1)
+    second = threading.Thread(target=lambda: results.append(limiter.call(lambda: Ok("queued"))), daemon=True)
+    second.start()
+    try:
+        while limiter.stats().queued < 1:
+            time.sleep(0.001)
+        # the queue is full
+        assert limiter.call(lambda: Ok("rejected")) == Err(Rejected("db", "max_in_flight"))
+    finally:
+        release.set()
+    first.join()
+    second.join()
+    assert results == [Ok("slow"), Ok("queued")]
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=2, rejected=1, queued=0, waited=1)
+
+
+def test_limiter_queue_timeout():
+    limiter = Limiter(max_in_flight=1, max_queue=1, queue_timeout=0.01)
+    assert limiter.try_acquire() == Ok(None)
+    assert limiter.call(lambda: Ok(1)) == Err(Rejected("limiter", "queue_timeout"))
+    limiter.release()
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=1, rejected=1, queued=0, waited=1)
+
+
+def test_limiter_queue_async():
+    limiter = Limiter(max_in_flight=1, max_queue=2)
+
+    @limiter
+    async def fetch(value: int) -> Result[int, str]:
+        await asyncio.sleep(0.01)
+        return Ok(value)
+
+    async def run():
+        return await asyncio.gather(*(fetch(i) for i in range(4)))
+
+    assert asyncio.run(run()) == [Ok(0), Ok(1), Ok(2), Err(Rejected("limiter", "max_in_flight"))]
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=3, rejected=1, queued=0, waited=2)
+
+
+def test_limiter_queue_async_cancelled():
+    limiter = Limiter(max_in_flight=1, max_queue=1)
+
+    async def run():
+        assert limiter.try_acquire() == Ok(None)
+        waiting = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        assert limiter.stats().queued == 1
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        limiter.release()
+
+    asyncio.run(run())
+    assert limiter.stats() == LimiterStats(in_flight=0, accepted=1, rejected=1, queued=0, waited=1)
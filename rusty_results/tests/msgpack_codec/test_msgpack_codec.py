@@ -0,0 +1,64 @@
+import pytest
+from rusty_results.prelude import *
+
+msgpack = pytest.importorskip("msgpack")
+from rusty_results.msgpack_codec import (  # noqa: E402
+    default, ext_hook, packb, unpackb, pack_many, unpack_many, EXT_SOME_BYTES
+)
+
+
+VALUES = [
+    Some(1),
+    Empty(),
+    Ok("value"),
+    Err({"code": 3}),
+    Some(Ok([Empty(), Some(None)])),
+    Ok(b"\x00raw bytes"),
+    Err(Some(b"nested bytes")),
+    {1: Some(1.5), "plain": [1, 2]},
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_msgpack_roundtrip(value):
+    assert unpackb(packb(value)) == value
+
+
+def test_msgpack_hooks():
+    data = msgpack.packb(VALUES, default=default, use_bin_type=True)
+    assert msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False) == VALUES
+
+
+def test_msgpack_bytes_passthrough():
+    payload = b"x" * 1024
+    ext = default(Some(payload))
+    assert ext.code == EXT_SOME_BYTES
+    assert ext.data is payload
+    assert unpackb(packb(Some(payload))) == Some(payload)
+
+
+def test_msgpack_unknown_ext():
+    ext = msgpack.ExtType(100, b"data")
+    assert unpackb(msgpack.packb(ext)) == ext
+
+
+def test_msgpack_unsupported():
+    with pytest.raises(TypeError):
+        packb(object())
+    with pytest.raises(TypeError):
+        packb([Some(1), Ok({"nested": object()})])
+    # the packers reused after a failure start from an empty buffer
+    assert unpackb(packb(Ok(300))) == Ok(300)
+    assert unpackb(packb(Some(Some(Some(1000))))) == Some(Some(Some(1000)))
+
+
+def test_msgpack_fixint_payloads():
+    for value in (-33, -32, 0, 127, 128):
+        for variant in (Some(value), Ok(value), Err(value)):
+            assert unpackb(packb(variant)) == variant
+
+
+def test_msgpack_many():
+    values = [Ok(i) if i % 3 else Err(f"bad {i}") for i in range(1000)] + VALUES
+    assert unpack_many(pack_many(values)) == values
+    assert unpack_many(pack_many([])) == []
@@ -1,6 +1,8 @@
+import pickle
 import pytest
 
 from rusty_results.prelude import *
+from rusty_results.exceptions import UnwrapException, EarlyReturnException
 
 
 def test_empty_is_some():
@@ -111,3 +113,12 @@ def test_early_return():
     with pytest.raises(EarlyReturnException):
         this: Empty = Empty()
         _ = ~this
+
+
+def test_empty_singleton():
+    assert Empty() is Empty()
+
+
+def test_empty_pickle():
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(Empty(), protocol=protocol)) is Empty()
@@ -1,3 +1,4 @@
+import pickle
 from typing import Tuple
 
 import pytest
@@ -177,3 +178,9 @@ def test_transpose_type_error():
 def test_early_return():
     value = ~Some(10)
     assert value == 10
+
+
+def test_some_pickle():
+    some = Some([1, Some("a")])
+    assert pickle.loads(pickle.dumps(some)) == some
+    assert pickle.dumps(Some(1)) == pickle.dumps(Some(1))
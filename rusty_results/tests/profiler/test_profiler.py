@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results import profiler
+from rusty_results.profiler import profiled, report, format_report
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    profiler.reset()
+    yield
+    profiler.disable()
+    profiler.reset()
+
+
+def parse(value: str) -> Result[int, str]:
+    return Ok(int(value)) if value.isdigit() else Err(value)
+
+
+def slow(value: int) -> int:
+    time.sleep(0.01)
+    return value
+
+
+def _stats_by_name():
+    return {step.name: stats for step, stats in report()}
+
+
+def test_disabled_leaves_prelude_untouched():
+    and_then = Ok.and_then
+    with profiled():
+        assert Ok.and_then is not and_then
+        assert profiler.is_enabled()
+    assert Ok.and_then is and_then
+    Ok("1").and_then(parse)
+    assert report() == []
+
+
+def test_profile_sync_chain():
+    with profiled():
+        for value in ("1", "2", "x"):
+            Ok(value).and_then(parse).map(slow).map_err(str.upper)
+        Some(1).zip_with(Some(2), lambda pair: sum(pair))
+        Empty().unwrap_or_else(f=lambda: 0)
+    stats = _stats_by_name()
+    assert (stats["parse"].calls, stats["parse"].failures) == (3, 1)
+    assert (stats["slow"].calls, stats["slow"].failures) == (2, 0)
+    assert stats["str.upper"].calls == 1
+    assert [stats.calls for step, stats in report() if step.name.endswith("<lambda>")] == [1, 1]
+    assert report()[0][0].name == "slow"
+    assert stats["slow"].total >= 0.02
+    assert stats["slow"].mean == stats["slow"].total / 2
+
+
+def test_profile_failures_raised():
+    def boom(_):
+        raise ValueError()
+
+    with profiled(), pytest.raises(ValueError):
+        Ok(1).map(boom)
+    assert _stats_by_name()["test_profile_failures_raised.<locals>.boom"].failures == 1
+
+
+def test_profile_async_chain():
+    async def fetch(value: int) -> Result[int, str]:
+        await asyncio.sleep(0.01)
+        return Ok(value) if value else Err("zero")
+
+    async def main():
+        return [await Ok(value).map(fetch).unwrap() for value in (1, 0)]
+
+    with profiled():
+        assert asyncio.run(main()) == [Ok(1), Err("zero")]
+    stats = _stats_by_name()["test_profile_async_chain.<locals>.fetch"]
+    assert (stats.calls, stats.failures) == (2, 1)
+    assert stats.total >= 0.02
+
+
+def test_format_report():
+    with profiled():
+        Ok(1).map(slow)
+    text = format_report(limit=1)
+    assert "slow" in text
+    assert len(text.splitlines()) == 2
@@ -0,0 +1,83 @@
+import pytest
+from rusty_results.prelude import *
+
+pydantic = pytest.importorskip("pydantic", minversion="2")
+
+
+class MyData(pydantic.BaseModel):
+    name: Option[str]
+    phone: Option[int]
+    parsed: Result[int, str]
+
+
+def test_validators_hook():
+    validate_option, = Some.__get_validators__()
+    assert validate_option(Some(1)) == Some(1)
+    assert validate_option({"Some": 1}) == Some(1)
+    assert validate_option({}) == Empty()
+    assert validate_option({"Empty": None}) == Empty()
+    with pytest.raises(TypeError):
+        validate_option(1)
+    validate_result, = Err.__get_validators__()
+    assert validate_result(Ok(1)) == Ok(1)
+    assert validate_result({"Ok": 1}) == Ok(1)
+    assert validate_result({"Error": "e"}) == Err("e")
+    with pytest.raises(TypeError):
+        validate_result({"Ok": 1, "Error": "e"})
+
+
+def test_pydantic_instances():
+    data = MyData(name=Some("Link"), phone=Empty(), parsed=Err("nope"))
+    assert data.name == Some("Link")
+    assert data.phone == Empty()
+    assert data.parsed == Err("nope")
+
+
+def test_pydantic_json_roundtrip():
+    data = MyData(name=Some("Link"), phone=Empty(), parsed=Ok(1))
+    json_data = data.model_dump_json()
+    assert json_data == '{"name":{"Some":"Link"},"phone":{"Empty":null},"parsed":{"Ok":1}}'
+    assert MyData.model_validate_json(json_data) == data
+    # the form written by earlier versions
+    assert MyData.model_validate_json('{"name":{"Some":"Link"},"phone":{},"parsed":{"Ok":1}}') == data
+
+
+def test_pydantic_matches_json_codec():
+    from rusty_results import json_codec
+
+    data = MyData(name=Some("Link"), phone=Empty(), parsed=Err("nope"))
+    decoded = json_codec.loads(data.model_dump_json())
+    assert decoded == {"name": Some("Link"), "phone": Empty(), "parsed": Err("nope")}
+    assert MyData.model_validate_json(json_codec.dumps(decoded)) == data
+
+
+def test_pydantic_validates_inner_types():
+    data = MyData.model_validate({"name": {}, "phone": {"Some": "12"}, "parsed": {"Error": "e"}})
+    assert data == MyData(name=Empty(), phone=Some(12), parsed=Err("e"))
+    with pytest.raises(pydantic.ValidationError):
+        MyData.model_validate({"name": {"Some": 1}, "phone": {}, "parsed": {"Ok": 1}})
+    with pytest.raises(pydantic.ValidationError):
+        pydantic.TypeAdapter(Empty).validate_python({"Some": 1})
+    with pytest.raises(pydantic.ValidationError):
+        MyData.model_validate({"name": {}, "phone": {}, "parsed": {"Ok": "a"}})
+
+
+def test_pydantic_rejects_ambiguous_variants():
+    with pytest.raises(pydantic.ValidationError):
+        MyData.model_validate({"name": {}, "phone": {}, "parsed": {"Ok": 1, "Error": "e"}})
+    with pytest.raises(pydantic.ValidationError):
+        MyData.model_validate({"name": {"Some": "a", "other": 1}, "phone": {}, "parsed": {"Ok": 1}})
+    with pytest.raises(pydantic.ValidationError):
+        pydantic.TypeAdapter(Some[int]).validate_python({"Some": 1, "Error": "e"})
+
+
+def test_pydantic_unparametrized():
+    adapter = pydantic.TypeAdapter(Option)
+    assert adapter.validate_python({"Some": [1]}) == Some([1])
+    assert adapter.validate_python({}) == Empty()
+    assert adapter.dump_python(Some(1)) == {"Some": 1}
+
+
+def test_pydantic_json_schema():
+    schema = MyData.model_json_schema()
+    assert set(schema["properties"]) == {"name", "phone", "parsed"}
@@ -0,0 +1,92 @@
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.records import ParseError, read_records, read_records_parallel, split_ranges
+
+
+DATA = b'{"a": 1}\n{"a": 2}\r\nnot json\n\n{"a": 3}\n{"a"'
+
+
+def checked(line: bytes) -> Result[int, str]:
+    value = json.loads(line)["a"]
+    return Ok(value) if value != 2 else Err("two")
+
+
+def _comparable(result: Result) -> Result:
+    # exceptions do not compare equal, keep the position of the errors only
+    return result.map_err(lambda error: (error.line_no, error.offset, error.raw))
+
+
+def test_read_records_file_object():
+    results = list(read_records(io.BytesIO(DATA), json.loads, chunk_size=4))
+    assert results[0] == Ok({"a": 1})
+    assert results[1] == Ok({"a": 2})
+    error = results[2].unwrap_err()
+    assert (error.line_no, error.offset, error.raw) == (3, 19, b"not json")
+    assert isinstance(error.reason, json.JSONDecodeError)
+    assert results[3] == Ok({"a": 3})
+    assert results[4].unwrap_err().line_no == 6
+    assert len(results) == 5
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_read_records_path(tmp_path, use_mmap):
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(DATA)
+    results = list(read_records(path, json.loads, use_mmap=use_mmap))
+    expected = read_records(io.BytesIO(DATA), json.loads)
+    assert [_comparable(result) for result in results] == [_comparable(result) for result in expected]
+
+
+def test_read_records_parser_result():
+    results = list(read_records(io.BytesIO(DATA), checked))
+    assert results[0] == Ok(1)
+    assert results[1] == Err(ParseError(2, 9, b'{"a": 2}', "two"))
+
+
+def test_read_records_keep_blank():
+    results = list(read_records(io.BytesIO(b"1\n\n2\n"), int, skip_blank=False))
+    assert results[0] == Ok(1)
+    assert results[1].unwrap_err().line_no == 2
+    assert results[2] == Ok(2)
+
+
+def test_read_records_empty(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    assert list(read_records(path, int, use_mmap=True)) == []
+    assert list(read_records_parallel(path, int)) == []
+
+
+def test_split_ranges(tmp_path):
+    path = tmp_path / "records"
+    path.write_bytes(DATA)
+    ranges = split_ranges(path, 5)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(DATA)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert DATA[end - 1:end] == b"\n"
+
+
+def test_read_records_parallel_matches_sequential(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(DATA * 50)
+    expected = list(read_records(path, json.loads))
+    with ThreadPoolExecutor(3) as executor:
+        results = list(read_records_parallel(path, json.loads, range_size=16, executor=executor))
+    assert [_comparable(result) for result in results] == [_comparable(result) for result in expected]
+
+
+def test_read_records_parallel_processes(tmp_path):
+    path = tmp_path / "records"
+    path.write_bytes(b"".join(b"%d\n" % i for i in range(1000)) + b"bad\n")
+    executor = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"))
+    with executor:
+        results = list(read_records_parallel(path, int, range_size=256, executor=executor))
+    assert [result.unwrap() for result in results[:-1]] == list(range(1000))
+    error = results[-1].unwrap_err()
+    assert (error.line_no, error.raw) == (1001, b"bad")
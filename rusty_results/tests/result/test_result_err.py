@@ -1,5 +1,9 @@
+import pickle
+from typing import Callable
 import pytest
 from rusty_results.prelude import *
+from rusty_results.exceptions import UnwrapException, EarlyReturnException
+from rusty_results.error_context import ContextError
 
 
 def test_err_builds():
@@ -154,3 +158,18 @@ def test_early_return():
     err: Result[int, int] = Err(0)
     with pytest.raises(EarlyReturnException):
         _ = ~err
+
+
+def test_err_pickle():
+    err = Err(ValueError("boom"))
+    unpickled = pickle.loads(pickle.dumps(err))
+    assert isinstance(unpickled, Err)
+    assert unpickled.Error.args == ("boom",)
+
+
+def test_err_context():
+    err: Result[int, str] = Err("not found")
+    with_context = err.context("loading config").context("starting")
+    assert with_context == Err(ContextError("starting", ContextError("loading config", "not found")))
+    assert with_context.unwrap_err().root == "not found"
+    assert err.with_context(lambda: "lazy") == Err(ContextError("lazy", "not found"))
@@ -1,5 +1,8 @@
+import pickle
+from typing import Callable
 import pytest
 from rusty_results.prelude import *
+from rusty_results.exceptions import UnwrapException
 
 
 def test_ok_builds():
@@ -184,3 +187,17 @@ def test_transpose_type_error():
 def test_early_return():
     err: Result[int, int] = Ok(0)
     assert ~err == 0
+
+
+def test_ok_pickle():
+    ok = Ok({"key": Empty()})
+    assert pickle.loads(pickle.dumps(ok)) == ok
+
+
+def test_ok_context():
+    def context() -> str:
+        raise AssertionError("context must not be built for Ok")  # pragma: no cover
+
+    ok: Result[int, str] = Ok(1)
+    assert ok.context("loading config") is ok
+    assert ok.with_context(context) is ok
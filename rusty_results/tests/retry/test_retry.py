@@ -0,0 +1,69 @@
+import asyncio
+
+from rusty_results.prelude import *
+from rusty_results.retry import retry, retry_async, RetryBudget, RetryOutcome, RetryPolicy
+
+
+def _flaky(failures: int, error="down"):
+    calls = []
+
+    def f(value: int = 0) -> Result[int, str]:
+        calls.append(value)
+        return Err(error) if len(calls) <= failures else Ok(value)
+    return f, calls
+
+
+def test_retry_until_ok():
+    f, calls = _flaky(2)
+    delays = []
+    outcome = retry(f, RetryPolicy(max_attempts=5, base_delay=1, jitter=False), 7, sleep=delays.append)
+    assert outcome == RetryOutcome(Ok(7), 3)
+    assert calls == [7, 7, 7]
+    assert delays == [1, 2]
+
+
+def test_retry_exhausts_attempts():
+    f, _ = _flaky(10)
+    outcome = retry(f, RetryPolicy(max_attempts=3), sleep=lambda _: None)
+    assert outcome == RetryOutcome(Err("down"), 3)
+
+
+def test_retry_predicate():
+    f, calls = _flaky(10, error="fatal")
+    outcome = retry(f, RetryPolicy(retry_on=lambda e: e != "fatal"), sleep=lambda _: None)
+    assert outcome.attempts == 1
+    assert calls == [0]
+
+
+def test_retry_ok_first():
+    assert retry(lambda: Ok(1)) == RetryOutcome(Ok(1), 1)
+
+
+def test_retry_delay_bounds():
+    policy = RetryPolicy(base_delay=1, multiplier=10, max_delay=5)
+    assert all(0 <= policy.delay(retry) <= 5 for retry in range(10))
+    assert RetryPolicy(base_delay=1, multiplier=10, max_delay=5, jitter=False).delay(3) == 5
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, initial=1, max_tokens=2)
+    policy = RetryPolicy(max_attempts=10, budget=budget)
+    f, calls = _flaky(100)
+    # initial token plus 0.5 deposited by the call
+    assert retry(f, policy, sleep=lambda _: None).attempts == 2
+    assert retry(f, policy, sleep=lambda _: None).attempts == 2
+    assert retry(f, policy, sleep=lambda _: None).attempts == 1
+    assert budget.tokens == 0.5
+
+
+def test_retry_async():
+    f, calls = _flaky(1)
+
+    async def async_f(value: int) -> Result[int, str]:
+        return f(value)
+
+    async def no_sleep(_):
+        pass
+
+    outcome = asyncio.run(retry_async(async_f, RetryPolicy(), 3, sleep=no_sleep))
+    assert outcome == RetryOutcome(Ok(3), 2)
@@ -0,0 +1,60 @@
+import sqlite3
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.sqlite_adapter import OptionCursor, bind, convert_rows, register_adapters
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (name TEXT NOT NULL, phone INTEGER, email TEXT)")
+    yield connection
+    connection.close()
+
+
+def test_bind():
+    assert bind((Some(1), Empty(), 2)) == (1, None, 2)
+    assert bind({"a": Some("x"), "b": Empty()}) == {"a": "x", "b": None}
+
+
+def test_convert_rows():
+    rows = [("a", None, 1), ("b", 2, None)]
+    assert convert_rows(rows, [1, 2]) == [("a", Empty(), Some(1)), ("b", Some(2), Empty())]
+    assert convert_rows(rows, []) == rows
+    assert convert_rows([], [0]) == []
+    assert convert_rows([(None,)], [0])[0][0] is Empty()
+
+
+def test_option_cursor(connection):
+    cursor = OptionCursor(connection.cursor(), nullable=("phone", 2))
+    cursor.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)",
+        [("link", Some(123), Empty()), ("zelda", Empty(), Some("zelda@hyrule"))],
+    )
+    cursor.execute("SELECT name, phone, email FROM users ORDER BY name")
+    assert cursor.fetchone() == ("link", Some(123), Empty())
+    assert cursor.fetchall() == [("zelda", Empty(), Some("zelda@hyrule"))]
+    assert cursor.fetchone() is None
+
+
+def test_option_cursor_iter(connection):
+    users = [(str(i), i if i % 2 else None) for i in range(1000)]
+    connection.executemany("INSERT INTO users VALUES (?, ?, NULL)", users)
+    cursor = OptionCursor(connection.cursor(), nullable=("phone",))
+    rows = list(cursor.execute("SELECT name, phone FROM users WHERE name = :name OR :all", {"name": "1", "all": 1}))
+    assert len(rows) == 1000
+    assert rows[:2] == [("0", Empty()), ("1", Some(1))]
+    cursor.execute("SELECT phone FROM users")
+    assert len(cursor.fetchmany(10)) == 10
+
+
+def test_option_cursor_unknown_column(connection):
+    cursor = OptionCursor(connection.cursor(), nullable=("missing",))
+    with pytest.raises(KeyError):
+        cursor.execute("SELECT name FROM users")
+
+
+def test_register_adapters(connection):
+    register_adapters()
+    assert connection.execute("SELECT ?, ?", (Some(1), Empty())).fetchone() == (1, None)
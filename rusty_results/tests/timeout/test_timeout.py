@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from rusty_results.prelude import *
+from rusty_results.timeout import with_timeout, with_timeout_async, Timeout
+
+
+def test_with_timeout_ok():
+    assert with_timeout(lambda a, b=0: a + b, 1, 1, b=2) == Ok(3)
+
+
+def test_with_timeout_err():
+    start = time.monotonic()
+    assert with_timeout(time.sleep, 0.01, 0.5) == Err(Timeout(0.01))
+    assert time.monotonic() - start < 0.4
+
+
+def test_with_timeout_hung_calls_do_not_block_later_ones():
+    hang = threading.Event()
+    try:
+        # more than the largest default thread pool, long enough for busy threads left by other tests to finish
+        for _ in range(40):
+            assert with_timeout(hang.wait, 0.02) == Err(Timeout(0.02))
+        assert with_timeout(lambda: 1, 0.5) == Ok(1)
+    finally:
+        hang.set()
+
+
+def test_with_timeout_propagates_exceptions():
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        with_timeout(fail, 1)
+
+
+def test_with_timeout_async():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def fast():
+        return 10
+
+    async def run():
+        timed_out = await with_timeout_async(slow(), 0.01)
+        await asyncio.sleep(0)
+        return timed_out, await with_timeout_async(fast(), 1)
+
+    assert asyncio.run(run()) == (Err(Timeout(0.01)), Ok(10))
+    assert cancelled == [True]
@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import Executor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar, Union
+
+from rusty_results.prelude import Result, Ok, Err
+from rusty_results.deadline import DeadlineExceeded, check, _limit
+from rusty_results._executor import default_executor
+
+
+T = TypeVar('T')
+
+
+@dataclass(eq=True, frozen=True)
+class Timeout:
+    """
+    Error value returned when a call did not finish in time.
+    """
+    seconds: float
+
+
+def with_timeout(
+        f: Callable[..., T],
+        seconds: float,
+        *args,
+        executor: Optional[Executor] = None,
+        **kwargs,
+) -> Result[T, Union[Timeout, DeadlineExceeded]]:
+    """
+    Runs f in a background thread and waits at most `seconds` for it, without raising `TimeoutError` on the way.
+    On timeout the call is cancelled if it did not start yet, a running call cannot be interrupted so its
+    result is discarded. Exceptions raised by f are propagated.
+    The wait is capped by the current deadline, which is also visible to f.
+
+    :param f: Function to call.
+    :param seconds: Maximum seconds to wait.
+    :param args: Positional arguments for f.
+    :param executor: Executor to run the call, if None it runs in its own daemon thread so calls that never return
+        do not hold back later ones.
+    :param kwargs: Keyword arguments for f.
+    :return: `Ok(f(*args, **kwargs))`, `Err(Timeout(seconds))` or `Err(DeadlineExceeded)`.
+    """
+    expired = check()
+    if expired.is_err:
+        return Err(expired.unwrap_err())
+    limit, deadline = _limit(seconds)
+    future = (executor or default_executor()).submit(copy_context().run, f, *args, **kwargs)
+    done, _ = wait((future,), timeout=limit)
+    if not done:
+        future.cancel()
+        return Err(Timeout(seconds) if deadline is None else DeadlineExceeded(deadline))
+    return Ok(future.result())
+
+
+async def with_timeout_async(
+        awaitable: Awaitable[T], seconds: float
+) -> Result[T, Union[Timeout, DeadlineExceeded]]:
+    """
+    Awaits at most `seconds` for awaitable, cancelling it on timeout. Exceptions raised by it are propagated.
+    The wait is capped by the current deadline.
+
+    :param awaitable: Coroutine or future to wait for.
+    :param seconds: Maximum seconds to wait.
+    :return: `Ok(value)`, `Err(Timeout(seconds))` or `Err(DeadlineExceeded)`.
+    """
+    expired = check()
+    if expired.is_err:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        return Err(expired.unwrap_err())
+    limit, deadline = _limit(seconds)
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait((task,), timeout=limit)
+    finally:
+        if not task.done():
+            task.cancel()
+    if not done:
+        return Err(Timeout(seconds) if deadline is None else DeadlineExceeded(deadline))
+    return Ok(task.result())